@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+GENESIS SOLID-STATE BATTERY: BATCH CYCLE-LIFE VERIFICATION
+================================================================================
+
+verification_suite.py checks one curated file. This script applies the same
+cycle-life checks to every cell coming off the pilot line: a directory (or
+glob) of per-cell cycling CSVs, verified on a process pool and aggregated
+into one summary.
+
+PER CELL:
+    The cycle-life checks of verify_cycle_life (max cycle, retention at 1000
+    cycles, monotonic degradation, fade rate), evaluated with the streaming
+    CycleLifeAccumulator so cells with very long logs stay in constant memory.
+
+AGGREGATE:
+    - Pass rate overall and per check
+    - Fade-rate distribution (mean, spread, percentiles, histogram)
+    - Outliers: cells whose fade rate has a robust z-score
+      |0.6745 (x - median) / MAD| above OUTLIER_Z (Iglewicz & Hoaglin)
+    - Cells that could not be read
+
+USAGE:
+    python batch_verification.py <directory | "glob/*.csv"> [--workers N]
+
+OUTPUT:
+    verification_output/batch_verification_report.txt
+    verification_output/batch_verification_cells.csv
+
+Author: Nicholas Harris, Genesis Platform Inc.
+Date: February 2026
+License: Proprietary - All Rights Reserved
+================================================================================
+"""
+
+import csv
+import glob
+import os
+import sys
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import validation_data_access as data_access
+from verification_suite import OUTPUT_DIR, CycleLifeAccumulator
+
+# Robust z-score above which a cell's fade rate is reported as an outlier
+OUTLIER_Z = 3.5
+
+# Files handed to a worker per task (amortizes inter-process overhead)
+MAX_FILES_PER_TASK = 64
+
+CELL_FIELDS = ["path", "n_rows", "max_cycle", "retention_at_1000",
+               "fade_rate_per_100", "monotonic", "passed", "failed_checks", "error"]
+
+
+# =============================================================================
+# PER-CELL VERIFICATION
+# =============================================================================
+
+def find_cell_files(source: str) -> List[str]:
+    """Cycling CSVs in a directory, or matching a glob pattern, sorted."""
+    pattern = os.path.join(source, "*.csv") if os.path.isdir(source) else source
+    return sorted(glob.glob(pattern))
+
+
+def verify_cell_file(filepath: str) -> Dict:
+    """
+    Cycle-life checks for one cell file.
+
+    Returns:
+        Flat record with CELL_FIELDS; unreadable files get error set and
+        passed=False instead of raising
+    """
+    record = dict.fromkeys(CELL_FIELDS)
+    record["path"] = filepath
+    try:
+        accumulator = CycleLifeAccumulator()
+        for cycles, retention in data_access.iter_table_chunks(
+                filepath, ("cycle", "capacity_retention_percent")):
+            accumulator.update(cycles, retention)
+        if accumulator.n_rows == 0:
+            raise ValueError("no data rows")
+        results = accumulator.results()
+    except Exception as e:
+        record.update(passed=False, error=f"{type(e).__name__}: {e}")
+        return record
+
+    record.update(
+        n_rows=accumulator.n_rows,
+        max_cycle=float(accumulator.max_cycle),
+        retention_at_1000=results[1].calculated_value,
+        fade_rate_per_100=results[3].calculated_value,
+        monotonic=accumulator.is_monotonic,
+        passed=all(r.passed for r in results),
+        failed_checks=";".join(r.name for r in results if not r.passed),
+        error="",
+    )
+    return record
+
+
+def _verify_cell_files(filepaths: List[str]) -> List[Dict]:
+    """Worker task: verify a block of files."""
+    return [verify_cell_file(path) for path in filepaths]
+
+
+def run_batch(filepaths: List[str], max_workers: Optional[int] = None) -> List[Dict]:
+    """
+    Verify many cell files on a process pool.
+
+    Files are sent to workers in blocks so per-task overhead stays small
+    next to the parsing work. Records come back in input order.
+    """
+    if not filepaths:
+        return []
+    workers = max_workers or os.cpu_count() or 1
+    per_task = int(np.clip(len(filepaths) // (4 * workers), 1, MAX_FILES_PER_TASK))
+    blocks = [filepaths[i:i + per_task] for i in range(0, len(filepaths), per_task)]
+
+    if workers == 1:
+        return [record for block in blocks for record in _verify_cell_files(block)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return [record for block in pool.map(_verify_cell_files, blocks) for record in block]
+
+
+# =============================================================================
+# AGGREGATION
+# =============================================================================
+
+def summarize_batch(records: List[Dict]) -> Dict:
+    """
+    Pass rates, fade-rate distribution and outliers across cells.
+
+    Returns:
+        Summary dict; fade statistics cover readable cells only
+    """
+    readable = [r for r in records if not r["error"]]
+    errors = [r for r in records if r["error"]]
+
+    check_names = ["Maximum Cycle Count", "Capacity Retention at 1000 Cycles",
+                   "Monotonic Degradation", "Capacity Fade Rate"]
+    failed_lists = [r["failed_checks"].split(";") if r["failed_checks"] else [] for r in readable]
+    per_check = {
+        name: (sum(name not in failed for failed in failed_lists) / len(readable)
+               if readable else float('nan'))
+        for name in check_names
+    }
+
+    summary = {
+        "n_files": len(records),
+        "n_readable": len(readable),
+        "n_errors": len(errors),
+        "n_passed": sum(1 for r in records if r["passed"]),
+        "pass_rate": (sum(1 for r in records if r["passed"]) / len(records)
+                      if records else float('nan')),
+        "check_pass_rates": per_check,
+        "errors": [(r["path"], r["error"]) for r in errors],
+        "outliers": [],
+    }
+
+    fade = np.array([r["fade_rate_per_100"] for r in readable], dtype=float)
+    if len(fade):
+        median = np.median(fade)
+        mad = np.median(np.abs(fade - median))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            robust_z = np.where(mad > 0, 0.6745 * (fade - median) / mad,
+                                np.where(fade == median, 0.0, np.inf * np.sign(fade - median)))
+        counts, edges = np.histogram(fade, bins=min(20, max(1, len(fade) // 5)))
+        summary["fade_rate"] = {
+            "mean": float(fade.mean()),
+            "std": float(fade.std()),
+            "median": float(median),
+            "mad": float(mad),
+            "p05": float(np.percentile(fade, 5)),
+            "p95": float(np.percentile(fade, 95)),
+            "min": float(fade.min()),
+            "max": float(fade.max()),
+            "histogram_counts": counts.tolist(),
+            "histogram_edges": edges.tolist(),
+        }
+        order = np.argsort(-np.abs(robust_z))
+        summary["outliers"] = [
+            (readable[i]["path"], float(fade[i]), float(robust_z[i]))
+            for i in order if abs(robust_z[i]) > OUTLIER_Z
+        ]
+    return summary
+
+
+# =============================================================================
+# REPORTS
+# =============================================================================
+
+def write_cell_table(records: List[Dict], output_path: str):
+    """One CSV row per cell."""
+    with open(output_path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=CELL_FIELDS)
+        writer.writeheader()
+        writer.writerows(records)
+
+
+def write_batch_report(summary: Dict, output_path: str, elapsed_s: float):
+    """Human-readable batch summary."""
+    with open(output_path, 'w') as f:
+        f.write("=" * 80 + "\n")
+        f.write("GENESIS SOLID-STATE BATTERY: BATCH CYCLE-LIFE VERIFICATION\n")
+        f.write("=" * 80 + "\n")
+        f.write(f"Generated: {datetime.now().isoformat()}\n")
+        f.write(f"Files: {summary['n_files']} ({summary['n_errors']} unreadable)\n")
+        f.write(f"Passed: {summary['n_passed']} ({100 * summary['pass_rate']:.1f}%)\n")
+        f.write(f"Runtime: {elapsed_s:.2f} s "
+                f"({summary['n_files'] / max(elapsed_s, 1e-9):.0f} files/s)\n")
+        f.write("=" * 80 + "\n\n")
+
+        f.write("PASS RATE BY CHECK:\n")
+        f.write("-" * 80 + "\n")
+        for name, rate in summary["check_pass_rates"].items():
+            f.write(f"  {name:<40} {100 * rate:6.1f}%\n")
+        f.write("\n")
+
+        if "fade_rate" in summary:
+            fade = summary["fade_rate"]
+            f.write("FADE RATE DISTRIBUTION (% / 100 cycles):\n")
+            f.write("-" * 80 + "\n")
+            f.write(f"  Mean ± std:  {fade['mean']:.4f} ± {fade['std']:.4f}\n")
+            f.write(f"  Median (MAD): {fade['median']:.4f} ({fade['mad']:.4f})\n")
+            f.write(f"  5th-95th:    {fade['p05']:.4f} - {fade['p95']:.4f}\n")
+            f.write(f"  Range:       {fade['min']:.4f} - {fade['max']:.4f}\n")
+            peak = max(fade["histogram_counts"]) or 1
+            for lo, hi, n in zip(fade["histogram_edges"][:-1], fade["histogram_edges"][1:],
+                                 fade["histogram_counts"]):
+                f.write(f"  [{lo:8.4f}, {hi:8.4f})  {n:6d}  {'█' * int(40 * n / peak)}\n")
+            f.write("\n")
+
+        f.write(f"OUTLIERS (|robust z| > {OUTLIER_Z}): {len(summary['outliers'])}\n")
+        f.write("-" * 80 + "\n")
+        for path, rate, z in summary["outliers"]:
+            f.write(f"  {path}: fade {rate:.4f} %/100 cycles (z = {z:+.1f})\n")
+        f.write("\n")
+
+        if summary["errors"]:
+            f.write("UNREADABLE FILES:\n")
+            f.write("-" * 80 + "\n")
+            for path, error in summary["errors"]:
+                f.write(f"  {path}: {error}\n")
+            f.write("\n")
+
+        f.write("=" * 80 + "\n")
+        f.write("END OF REPORT\n")
+        f.write("=" * 80 + "\n")
+
+
+# =============================================================================
+# ENTRY POINT
+# =============================================================================
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1].startswith("--"):
+        print("Usage: python batch_verification.py <directory | glob> [--workers N]")
+        sys.exit(2)
+    workers = int(sys.argv[sys.argv.index("--workers") + 1]) if "--workers" in sys.argv else None
+
+    files = find_cell_files(sys.argv[1])
+    print("=" * 80)
+    print("GENESIS SOLID-STATE BATTERY: BATCH CYCLE-LIFE VERIFICATION")
+    print("=" * 80)
+    print(f"Timestamp: {datetime.now().isoformat()}")
+    print(f"Cell files: {len(files)}")
+
+    t0 = time.perf_counter()
+    records = run_batch(files, max_workers=workers)
+    summary = summarize_batch(records)
+    elapsed = time.perf_counter() - t0
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    report_path = os.path.join(OUTPUT_DIR, "batch_verification_report.txt")
+    table_path = os.path.join(OUTPUT_DIR, "batch_verification_cells.csv")
+    write_batch_report(summary, report_path, elapsed)
+    write_cell_table(records, table_path)
+
+    print(f"Passed: {summary['n_passed']}/{summary['n_files']}, "
+          f"unreadable: {summary['n_errors']}, outliers: {len(summary['outliers'])}")
+    print(f"Runtime: {elapsed:.2f} s ({len(files) / max(elapsed, 1e-9):.0f} files/s)")
+    print(f"\n📄 Batch report saved to: {report_path}")
+    print(f"📄 Per-cell table saved to: {table_path}")
+    print("=" * 80)
+
+    sys.exit(0 if files and summary["n_passed"] == summary["n_files"] else 1)
+
+
+if __name__ == "__main__":
+    main()
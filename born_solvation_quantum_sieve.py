@@ -26,7 +26,11 @@ PHYSICS:
 
 OUTPUTS:
     - dehydration_enthalpy_profile.json  (quantitative results)
-    - dehydration_cliff.png              (publication-quality figure)
+    - dehydration_profiles.npy/.json     (binary species × pore profiles)
+    - dehydration_plot_data.npz          (arrays behind the figure)
+    - dehydration_cliff.png              (publication-quality figure;
+                                          --render-only redraws it from the .npz,
+                                          --profile NAME picks a render profile)
     - species_selectivity.json           (selectivity ratios)
     - sieve_validation_report.txt        (full verification report)
 
@@ -44,11 +48,15 @@ Patent Reference: Provisional 6, Claims 12-17
 """
 
 import numpy as np
+import csv
 import json
 import os
+import sys
 from datetime import datetime
 from dataclasses import dataclass, asdict
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+from sieve_output import write_profiles
 
 # =============================================================================
 # PHYSICAL CONSTANTS (SI Units)
@@ -65,6 +73,7 @@ NM_TO_M = 1e-9
 ANGSTROM_TO_M = 1e-10
 J_TO_KJ = 1e-3
 KJ_PER_MOL_TO_J = 1e3 / N_A
+LN10 = np.log(10.0)
 
 
 # =============================================================================
@@ -141,6 +150,134 @@ SPECIES = {
 }
 
 
+# =============================================================================
+# SPECIES LIBRARIES (STRUCTURED ARRAYS)
+# =============================================================================
+
+# One record per ion or solvated complex. Screening libraries with thousands
+# of candidates are held in a single structured array so that barriers and
+# selectivities are evaluated column-wise instead of one dataclass at a time.
+SPECIES_DTYPE = np.dtype([
+    ("key", "U32"),
+    ("name", "U64"),
+    ("formula", "U32"),
+    ("bare_radius_nm", "f8"),
+    ("solvated_radius_nm", "f8"),
+    ("charge", "i4"),
+    ("coordination_number", "i4"),
+    ("hydration_enthalpy_kJ_mol", "f8"),
+])
+
+# Columns that every library file must provide
+_REQUIRED_LIBRARY_FIELDS = ("formula", "bare_radius_nm", "solvated_radius_nm", "charge")
+
+
+def species_library_from_dict(species: Dict[str, IonSpecies] = None) -> np.ndarray:
+    """
+    Convert a dict of IonSpecies (default: SPECIES) into a structured array.
+
+    Returns:
+        Structured array with dtype SPECIES_DTYPE, in dict insertion order
+    """
+    if species is None:
+        species = SPECIES
+
+    library = np.zeros(len(species), dtype=SPECIES_DTYPE)
+    for i, (key, ion) in enumerate(species.items()):
+        library[i] = (key, ion.name, ion.formula, ion.bare_radius_nm,
+                      ion.solvated_radius_nm, ion.charge,
+                      ion.coordination_number, ion.hydration_enthalpy_kJ_mol)
+    return library
+
+
+def _blank(value) -> bool:
+    return value is None or str(value).strip() == ""
+
+
+def _library_from_columns(columns: Dict[str, list]) -> np.ndarray:
+    """
+    Assemble a structured species array from per-field column lists.
+
+    Raises:
+        ValueError: if a required field is missing or has a blank cell,
+            or if two species end up with the same key
+    """
+    missing = [f for f in _REQUIRED_LIBRARY_FIELDS if f not in columns]
+    if missing:
+        raise ValueError(f"Species library is missing required fields: {missing}")
+    for field in _REQUIRED_LIBRARY_FIELDS:
+        blank = [i for i, v in enumerate(columns[field]) if _blank(v)]
+        if blank:
+            raise ValueError(f"Species library has blank '{field}' in rows {blank}")
+
+    # Optional identifiers default to the chemical formula, per row
+    for field in ("key", "name"):
+        values = columns.get(field, [None] * len(columns["formula"]))
+        columns[field] = [formula if _blank(v) else v
+                          for v, formula in zip(values, columns["formula"])]
+    keys, counts = np.unique(np.asarray(columns["key"], dtype=str), return_counts=True)
+    if (counts > 1).any():
+        raise ValueError(f"Species library has duplicate keys: {[str(k) for k in keys[counts > 1]]}")
+
+    n = len(columns["formula"])
+    library = np.zeros(n, dtype=SPECIES_DTYPE)
+    for field in SPECIES_DTYPE.names:
+        if field in columns:
+            library[field] = np.asarray(columns[field]).astype(SPECIES_DTYPE[field])
+    return library
+
+
+def load_species_library(filepath: str) -> np.ndarray:
+    """
+    Load an ion/solvent species library from CSV or JSON.
+
+    CSV files need a header row with at least the columns
+    formula, bare_radius_nm, solvated_radius_nm and charge; key, name,
+    coordination_number and hydration_enthalpy_kJ_mol are optional.
+    Lines starting with '#' are treated as comments.
+
+    A blank or absent key or name takes the row's formula; a blank
+    required cell or a duplicate key raises ValueError.
+
+    JSON files may hold either a list of records or a dict of records
+    keyed by species key (the same layout as SPECIES).
+
+    Returns:
+        Structured array with dtype SPECIES_DTYPE
+    """
+    ext = os.path.splitext(filepath)[1].lower()
+
+    if ext == ".csv":
+        with open(filepath, 'r', newline='') as f:
+            rows = (line for line in f if line.strip() and not line.lstrip().startswith('#'))
+            reader = csv.DictReader(rows)
+            columns = {name.strip(): [] for name in reader.fieldnames}
+            for row in reader:
+                for name, value in row.items():
+                    columns[name.strip()].append(value.strip())
+        # Empty optional cells fall back to zero rather than failing the cast
+        for field in ("coordination_number", "hydration_enthalpy_kJ_mol"):
+            if field in columns:
+                columns[field] = [v if v != "" else 0 for v in columns[field]]
+        return _library_from_columns(columns)
+
+    if ext == ".json":
+        with open(filepath, 'r') as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            records = [dict(record, key=key if _blank(record.get("key")) else record["key"])
+                       for key, record in data.items()]
+        else:
+            records = list(data)
+        fields = set().union(*(r.keys() for r in records)) if records else set(_REQUIRED_LIBRARY_FIELDS)
+        # Absent identifiers stay None (filled per row); absent numbers are 0
+        columns = {field: [r.get(field, None if field in ("key", "name") else 0) for r in records]
+                   for field in fields if field in SPECIES_DTYPE.names}
+        return _library_from_columns(columns)
+
+    raise ValueError(f"Unsupported species library format: {filepath}")
+
+
 # =============================================================================
 # BORN SOLVATION MODEL
 # =============================================================================
@@ -256,6 +393,231 @@ def dehydration_enthalpy(
     return delta_H
 
 
+# =============================================================================
+# VECTORIZED SIEVE ENGINE
+# =============================================================================
+
+def born_solvation_energy_array(z, r_eff_m, epsilon_r) -> np.ndarray:
+    """
+    Vectorized Born solvation free energy (kJ/mol).
+
+    Same equation and guards as born_solvation_energy, evaluated
+    element-wise over broadcastable arrays.
+    """
+    z = np.asarray(z)
+    r_eff_m = np.asarray(r_eff_m, dtype=float)
+    epsilon_r = np.asarray(epsilon_r, dtype=float)
+
+    valid = (r_eff_m > 0) & (epsilon_r > 0)
+    r_safe = np.where(valid, r_eff_m, 1.0)
+    eps_safe = np.where(valid, epsilon_r, 1.0)
+
+    delta_G = -(N_A * z**2 * E_CHARGE**2) / (8 * PI * EPSILON_0 * r_safe)
+    delta_G = delta_G * (1.0 - 1.0/eps_safe)
+
+    return np.where(valid, delta_G * J_TO_KJ, 0.0)
+
+
+def dehydration_enthalpy_array(
+    pore_diameter_nm,
+    bare_radius_nm,
+    solvated_radius_nm,
+    charge,
+    epsilon_bulk=30.0,
+    epsilon_vacuum=2.0,
+    d_critical_nm=0.70,
+    transition_width_nm=0.10
+) -> np.ndarray:
+    """
+    Vectorized dehydration enthalpy barrier (kJ/mol).
+
+    All arguments broadcast against each other, so a (species, 1) column of
+    radii against a (pores,) row of diameters yields a (species, pores)
+    barrier matrix in one pass. Sterically blocked entries are +inf, as in
+    dehydration_enthalpy.
+    """
+    pore_diameter_nm = np.asarray(pore_diameter_nm, dtype=float)
+    solvated_diameter_nm = 2.0 * np.asarray(solvated_radius_nm, dtype=float)
+
+    r_eff = np.asarray(bare_radius_nm, dtype=float) * NM_TO_M
+    G_bulk = born_solvation_energy_array(charge, r_eff, epsilon_bulk)
+
+    epsilon_pore = confined_dielectric_constant(
+        pore_diameter_nm, epsilon_bulk, epsilon_vacuum,
+        d_critical_nm, transition_width_nm
+    )
+    G_pore = born_solvation_energy_array(charge, r_eff, epsilon_pore)
+
+    delta_H = G_pore - G_bulk
+    blocked = pore_diameter_nm < solvated_diameter_nm * 0.8
+
+    return np.where(blocked, np.inf, delta_H)
+
+
+def library_dehydration_matrix(
+    library: np.ndarray,
+    pore_range_nm: np.ndarray,
+    epsilon_bulk: float = 30.0,
+    **confinement
+) -> np.ndarray:
+    """
+    Dehydration barriers for a whole species library.
+
+    Parameters:
+        library: Structured array with dtype SPECIES_DTYPE
+        pore_range_nm: Pore diameters to evaluate
+        epsilon_bulk: Bulk solvent dielectric constant
+        **confinement: epsilon_vacuum, d_critical_nm, transition_width_nm
+
+    Returns:
+        Barrier matrix in kJ/mol, shape (n_species, n_pores), +inf where blocked
+    """
+    pore_range_nm = np.asarray(pore_range_nm, dtype=float)
+    return dehydration_enthalpy_array(
+        pore_range_nm[np.newaxis, :],
+        library["bare_radius_nm"][:, np.newaxis],
+        library["solvated_radius_nm"][:, np.newaxis],
+        library["charge"][:, np.newaxis],
+        epsilon_bulk,
+        **confinement
+    )
+
+
+def compute_library_selectivity(
+    library: np.ndarray,
+    target_pore_nm: float = 0.70,
+    reference: str = "Li+",
+    temperature_K: float = 300.0,
+    epsilon_bulk: float = 30.0
+) -> Dict[str, np.ndarray]:
+    """
+    Barriers and selectivity versus a reference species for a whole library.
+
+    log10(Selectivity) = ΔΔG / (ln(10) × RT), where ΔΔG is the barrier of
+    each species minus that of the reference. Selectivity is kept in log10
+    so that arbitrarily large ratios remain finite, sortable numbers;
+    blocked species have +inf.
+
+    Returns:
+        Dict of per-species arrays: key, barrier_kJ_mol,
+        delta_barrier_kJ_mol, log10_selectivity
+    """
+    RT = K_B * temperature_K * N_A / 1000  # kJ/mol
+
+    barrier = library_dehydration_matrix(library, [target_pore_nm], epsilon_bulk)[:, 0]
+
+    ref_idx = np.flatnonzero(library["key"] == reference)
+    if ref_idx.size == 0:
+        raise KeyError(f"Reference species '{reference}' not in library")
+    ref_barrier = barrier[ref_idx[0]]
+    if not np.isfinite(ref_barrier):
+        ref_barrier = 0.0  # Reference passes freely
+
+    delta_barrier = barrier - ref_barrier
+
+    return {
+        "key": library["key"],
+        "barrier_kJ_mol": barrier,
+        "delta_barrier_kJ_mol": delta_barrier,
+        "log10_selectivity": delta_barrier / (LN10 * RT),
+    }
+
+
+def log10_selectivity_matrix(barriers: np.ndarray, temperature_K: float = 300.0) -> np.ndarray:
+    """
+    Full pairwise log10 selectivity at every pore diameter.
+
+    log10 S[p, i, j] = log10(k_i / k_j) = (ΔH_j - ΔH_i) / (ln(10) × RT)
+
+    i.e. how strongly pore p favours species i over species j. Working in
+    log10 avoids overflow for any barrier difference. Blocked species
+    (+inf barrier) give +inf when only j is blocked, -inf when only i is
+    blocked and NaN when both are.
+
+    Parameters:
+        barriers: Barrier matrix in kJ/mol, shape (n_species, n_pores)
+        temperature_K: Temperature
+
+    Returns:
+        log10 selectivity array, shape (n_pores, n_species, n_species)
+    """
+    RT = K_B * temperature_K * N_A / 1000  # kJ/mol
+
+    b = np.asarray(barriers, dtype=float).T  # (pores, species)
+    with np.errstate(invalid='ignore'):
+        delta = b[:, np.newaxis, :] - b[:, :, np.newaxis]
+    return delta / (LN10 * RT)
+
+
+def pairwise_selectivity(
+    library: np.ndarray,
+    pore_range_nm: np.ndarray = None,
+    temperature_K: float = 300.0,
+    epsilon_bulk: float = 30.0,
+    **confinement
+) -> Dict[str, np.ndarray]:
+    """
+    Species × species selectivity matrices across a range of pore sizes.
+
+    Returns:
+        Dict with pore_nm, species (keys), barrier_kJ_mol (species, pores)
+        and log10_selectivity (pores, species, species); see
+        log10_selectivity_matrix
+    """
+    if pore_range_nm is None:
+        pore_range_nm = np.linspace(0.3, 3.0, 500)
+    pore_range_nm = np.asarray(pore_range_nm, dtype=float)
+
+    barriers = library_dehydration_matrix(library, pore_range_nm, epsilon_bulk, **confinement)
+
+    return {
+        "pore_nm": pore_range_nm,
+        "species": library["key"],
+        "barrier_kJ_mol": barriers,
+        "log10_selectivity": log10_selectivity_matrix(barriers, temperature_K),
+    }
+
+
+def optimal_pore_for_pairs(pairwise: Dict[str, np.ndarray], targets, blocked) -> Dict[str, np.ndarray]:
+    """
+    Pick the pore diameter that best separates each target/blocked pair.
+
+    The optimum maximises selectivity of target over blocked; among pores
+    with equal selectivity (e.g. blocked species sterically excluded
+    everywhere) the one with the lowest target barrier wins, since it
+    transports the target fastest.
+
+    Parameters:
+        pairwise: Output of pairwise_selectivity
+        targets: Species key(s) that should pass
+        blocked: Species key(s) that should be rejected, paired with targets
+
+    Returns:
+        Dict of per-pair arrays: pore_index, pore_nm, log10_selectivity,
+        target_barrier_kJ_mol
+    """
+    keys = list(pairwise["species"])
+    t_idx = np.array([keys.index(k) for k in np.atleast_1d(targets)])
+    b_idx = np.array([keys.index(k) for k in np.atleast_1d(blocked)])
+
+    # (pairs, pores); undefined (both blocked) entries never win
+    sel = pairwise["log10_selectivity"][:, t_idx, b_idx].T
+    sel = np.where(np.isnan(sel), -np.inf, sel)
+    target_barrier = pairwise["barrier_kJ_mol"][t_idx]
+
+    best = sel.max(axis=1, keepdims=True)
+    tie_break = np.where(sel == best, target_barrier, np.inf)
+    pore_index = np.argmin(tie_break, axis=1)
+
+    rows = np.arange(len(t_idx))
+    return {
+        "pore_index": pore_index,
+        "pore_nm": pairwise["pore_nm"][pore_index],
+        "log10_selectivity": sel[rows, pore_index],
+        "target_barrier_kJ_mol": target_barrier[rows, pore_index],
+    }
+
+
 # =============================================================================
 # COMPREHENSIVE ANALYSIS
 # =============================================================================
@@ -285,14 +647,14 @@ def compute_dehydration_profile(
     print(f"Resolution: {len(pore_range_nm)} points")
     print("-" * 70)
 
-    for key, ion in SPECIES.items():
-        profile = []
-        for d in pore_range_nm:
-            dH = dehydration_enthalpy(d, ion, epsilon_bulk)
-            if dH == float('inf'):
-                profile.append(None)  # Sterically blocked
-            else:
-                profile.append(round(dH, 2))
+    # All species × pores in one vectorized pass
+    barriers = library_dehydration_matrix(species_library_from_dict(SPECIES),
+                                          pore_range_nm, epsilon_bulk)
+
+    for i, (key, ion) in enumerate(SPECIES.items()):
+        # None marks sterically blocked pores
+        profile = [round(float(dH), 2) if np.isfinite(dH) else None
+                   for dH in barriers[i]]
 
         # Find first non-infinite value
         passable_indices = [i for i, v in enumerate(profile) if v is not None]
@@ -348,12 +710,43 @@ def compute_dehydration_profile(
     return results
 
 
+def format_log10_ratio(log10_value: float) -> str:
+    """Scientific notation for a ratio given as log10, without overflow."""
+    if np.isnan(log10_value):
+        return "UNDEFINED"
+    if np.isinf(log10_value):
+        return "INFINITE" if log10_value > 0 else "0"
+    exponent = int(np.floor(log10_value))
+    mantissa = 10 ** (log10_value - exponent)
+    if mantissa >= 9.95:  # Rounds up to the next decade
+        mantissa, exponent = mantissa / 10, exponent + 1
+    return f"{mantissa:.1f}e{exponent:+03d}"
+
+
+def _format_selectivity(barrier: float, delta_barrier: float,
+                        log10_selectivity: float) -> Tuple[str, str, str]:
+    """Display strings (barrier, selectivity, status) for one species."""
+    if not np.isfinite(barrier):
+        return "INFINITE", "INFINITE", "⛔ BLOCKED"
+
+    barrier_str = f"{barrier:.1f}"
+    if delta_barrier > 20:
+        return barrier_str, format_log10_ratio(log10_selectivity), "⛔ BLOCKED"
+    elif delta_barrier > 5:
+        return barrier_str, f"{10 ** log10_selectivity:.0f}:1", "⚠ PARTIAL"
+    else:
+        return barrier_str, "1:1 (passes)", "✅ PASS"
+
+
 def compute_selectivity(results: Dict, target_pore_nm: float = 0.70) -> Dict:
     """
     Compute ion selectivity ratios at the target pore dimension.
 
     Selectivity = exp(-ΔΔG / RT) where ΔΔG is the difference in barrier
-    between the target species (Li+) and the blocked species.
+    between the target species (Li+) and the blocked species. It is
+    computed and stored as log10_selectivity; sterically blocked species
+    (+inf) are stored as null with "blocked": true, so the saved file is
+    strict JSON. The selectivity string is for display only.
     """
     T = 300.0  # K
     RT = K_B * T * N_A / 1000  # kJ/mol (≈ 2.494 kJ/mol)
@@ -375,60 +768,96 @@ def compute_selectivity(results: Dict, target_pore_nm: float = 0.70) -> Dict:
         "species_selectivity": {}
     }
 
+    # Numeric pass: all species at once, blocked profiles as +inf
+    keys = list(results["species"].keys())
+    barriers = np.array([
+        np.inf if results["species"][k]["enthalpy_profile_kJ_mol"][idx] is None
+        else results["species"][k]["enthalpy_profile_kJ_mol"][idx]
+        for k in keys
+    ], dtype=float)
+    delta_barriers = barriers - li_barrier
+    log10_selectivities = delta_barriers / (LN10 * RT)
+
     print("\n" + "=" * 70)
     print(f"SELECTIVITY ANALYSIS AT d = {target_pore_nm} nm, T = {T} K")
     print("=" * 70)
     print(f"{'Species':<25} {'Barrier (kJ/mol)':<20} {'Selectivity vs Li+':<20} {'Status':<15}")
     print("-" * 80)
 
-    for key, species_data in results["species"].items():
-        barrier = species_data["enthalpy_profile_kJ_mol"][idx]
+    # Display pass
+    for i, key in enumerate(keys):
+        species_data = results["species"][key]
+        barrier_str, selectivity_str, status = _format_selectivity(
+            barriers[i], delta_barriers[i], log10_selectivities[i])
 
-        if barrier is None or barrier == "INFINITE":
-            selectivity = float('inf')
-            selectivity_str = "INFINITE"
-            status = "⛔ BLOCKED"
-        else:
-            delta_barrier = barrier - (li_barrier if li_barrier else 0)
-            if delta_barrier > 100:
-                selectivity = float('inf')
-                selectivity_str = f">10^{int(delta_barrier / (2.303 * RT))}"
-                status = "⛔ BLOCKED"
-            elif delta_barrier > 20:
-                selectivity = np.exp(delta_barrier / RT)
-                selectivity_str = f"{selectivity:.1e}"
-                status = "⛔ BLOCKED"
-            elif delta_barrier > 5:
-                selectivity = np.exp(delta_barrier / RT)
-                selectivity_str = f"{selectivity:.0f}:1"
-                status = "⚠ PARTIAL"
-            else:
-                selectivity = 1.0
-                selectivity_str = "1:1 (passes)"
-                status = "✅ PASS"
-
-        barrier_str = f"{barrier:.1f}" if (barrier is not None and barrier != "INFINITE") else "INFINITE"
         print(f"  {species_data['name']:<23} {barrier_str:<20} {selectivity_str:<20} {status:<15}")
 
+        blocked = not np.isfinite(log10_selectivities[i])
         selectivity_results["species_selectivity"][key] = {
             "name": species_data["name"],
             "barrier_kJ_mol": barrier_str,
             "selectivity": selectivity_str,
+            "log10_selectivity": None if blocked else float(log10_selectivities[i]),
+            "blocked": bool(blocked),
             "status": status
         }
 
     return selectivity_results
 
 
-def generate_dehydration_plot(results: Dict, output_path: str):
-    """Generate publication-quality dehydration enthalpy cliff plot."""
+# Plot data is written next to the figure, so it can be restyled with
+# --render-only without rerunning the model
+PLOT_DATA_FILE = "dehydration_plot_data.npz"
+PLOT_FILE = "dehydration_cliff.png"
+
+# Species drawn in the left panel, in legend order
+PLOT_SPECIES = ["Li+", "Na+", "Li_H2O4", "Li_EC4"]
+
+
+def save_dehydration_plot_data(results: Dict, output_path: str):
+    """
+    Save the arrays behind dehydration_cliff.png as .npz.
+
+    Profiles are stored unclipped, with NaN where the species is blocked;
+    the confined dielectric curve for the right panel is computed here.
+    """
+    profiles = np.array([
+        [v if v is not None else np.nan
+         for v in results["species"][key]["enthalpy_profile_kJ_mol"]]
+        for key in PLOT_SPECIES
+    ], dtype=float)
+    epsilon_pore_nm = np.linspace(0.3, 2.0, 200)
+
+    np.savez(
+        output_path,
+        pore_diameters_nm=np.array(results["pore_diameters_nm"], dtype=float),
+        species_keys=np.array(PLOT_SPECIES),
+        species_names=np.array([results["species"][k]["name"] for k in PLOT_SPECIES]),
+        enthalpy_profiles_kJ_mol=profiles,
+        epsilon_pore_nm=epsilon_pore_nm,
+        epsilon_r=confined_dielectric_constant(epsilon_pore_nm),
+    )
+    print(f"  Plot data saved: {output_path}")
+
+
+def generate_dehydration_plot(data_path: str, output_path: str, profile: Optional[str] = None):
+    """
+    Generate the dehydration enthalpy cliff plot from saved plot data.
+
+    profile is a figure_registry render profile (default: the active one).
+    """
     try:
         import matplotlib.pyplot as plt
+        from figure_registry import get_render_profile, save_figure
     except ImportError:
         print("  [Warning] matplotlib not available, skipping plot generation")
         return
 
-    plt.rcParams.update({
+    with np.load(data_path) as d:
+        data = dict(d)
+
+    profile = get_render_profile(profile)
+    with plt.rc_context({
         'font.family': 'serif',
         'font.size': 12,
         'axes.labelsize': 14,
@@ -436,11 +865,18 @@ def generate_dehydration_plot(results: Dict, output_path: str):
         'figure.dpi': 300,
         'savefig.dpi': 300,
         'savefig.bbox': 'tight',
-    })
+    }), plt.rc_context(profile.rc):
+        fig = _draw_dehydration_plot(plt, data)
+        paths = save_figure(fig, output_path, profile.name)
+        plt.close(fig)
+    for path in paths:
+        print(f"  Plot saved: {path}")
+
 
+def _draw_dehydration_plot(plt, data: Dict):
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
 
-    pore_d = np.array(results["pore_diameters_nm"])
+    pore_d = data["pore_diameters_nm"]
 
     # Color map for species
     colors = {
@@ -452,19 +888,13 @@ def generate_dehydration_plot(results: Dict, output_path: str):
     }
 
     # LEFT PANEL: Dehydration enthalpy vs pore diameter
-    for key in ["Li+", "Na+", "Li_H2O4", "Li_EC4"]:
-        species = results["species"][key]
-        profile = species["enthalpy_profile_kJ_mol"]
-
-        # Replace None with NaN for plotting
-        profile_plot = [v if v is not None else np.nan for v in profile]
-        profile_arr = np.array(profile_plot)
-
+    for key, name, profile in zip(data["species_keys"], data["species_names"],
+                                  data["enthalpy_profiles_kJ_mol"]):
         # Cap at 600 kJ/mol for visibility
-        profile_arr = np.clip(profile_arr, -100, 600)
+        profile_arr = np.clip(profile, -100, 600)
 
-        ax1.plot(pore_d, profile_arr, linewidth=2.5, color=colors[key],
-                 label=species["name"])
+        ax1.plot(pore_d, profile_arr, linewidth=2.5, color=colors[str(key)],
+                 label=str(name))
 
     # Mark the 0.7 nm cliff
     ax1.axvline(0.70, color='black', linestyle='--', linewidth=2, alpha=0.7)
@@ -490,10 +920,7 @@ def generate_dehydration_plot(results: Dict, output_path: str):
                  color='#C62828', fontweight='bold', ha='center')
 
     # RIGHT PANEL: Confined dielectric constant
-    pore_range = np.linspace(0.3, 2.0, 200)
-    epsilon_profile = [confined_dielectric_constant(d) for d in pore_range]
-
-    ax2.plot(pore_range, epsilon_profile, linewidth=3, color='#1565C0')
+    ax2.plot(data["epsilon_pore_nm"], data["epsilon_r"], linewidth=3, color='#1565C0')
     ax2.axvline(0.70, color='black', linestyle='--', linewidth=2, alpha=0.7)
     ax2.axhline(30.0, color='gray', linestyle=':', linewidth=1, alpha=0.5)
     ax2.text(1.5, 28, 'ε_bulk = 30', fontsize=10, color='gray')
@@ -514,16 +941,17 @@ def generate_dehydration_plot(results: Dict, output_path: str):
              verticalalignment='top', horizontalalignment='right',
              bbox=dict(boxstyle='round,pad=0.5', facecolor='#E3F2FD', edgecolor='#1976D2'))
 
-    plt.tight_layout()
-    plt.savefig(output_path)
-    plt.close()
-    print(f"  Plot saved: {output_path}")
+    return fig
 
 
 # =============================================================================
 # MAIN
 # =============================================================================
 
+def _verdict(passed: bool) -> str:
+    return "✅ PASS" if passed else "❌ FAIL"
+
+
 def main():
     """Run complete Quantum Sieve analysis."""
 
@@ -547,6 +975,17 @@ def main():
     # 2. Compute selectivity
     selectivity = compute_selectivity(results, target_pore_nm=0.70)
 
+    # Claims 12-13, evaluated from the model rather than asserted
+    library = species_library_from_dict(SPECIES)
+    claims = compute_library_selectivity(library, target_pore_nm=0.70)
+    claim_barrier = dict(zip(claims["key"], claims["barrier_kJ_mol"]))
+    claim_log10 = dict(zip(claims["key"], claims["log10_selectivity"]))
+    d_crit = float(optimal_pore_for_pairs(pairwise_selectivity(library),
+                                          ["Li+"], ["Li_EC4"])["pore_nm"][0])
+    claim_12b = {k: bool(claim_barrier[k] > 400) for k in ("Li_EC4", "Li_H2O4")}
+    claim_12c = bool(claim_log10["Li_EC4"] > 3.0)
+    claim_13 = 0.6 <= d_crit <= 0.8
+
     # 3. Save results
     # Dehydration profile
     profile_path = os.path.join(output_dir, "dehydration_enthalpy_profile.json")
@@ -571,26 +1010,38 @@ def main():
                 "Li+_barrier_at_0.7nm_kJ_mol": results["species"]["Li+"]["barrier_at_0.7nm_kJ_mol"],
                 "Li_EC4_barrier_at_0.7nm": results["species"]["Li_EC4"]["barrier_at_0.7nm_kJ_mol"],
                 "Li_H2O4_barrier_at_0.7nm": results["species"]["Li_H2O4"]["barrier_at_0.7nm_kJ_mol"],
-                "selectivity_Li_vs_LiEC4": "INFINITE (steric exclusion)",
-                "selectivity_Li_vs_LiH2O4": "INFINITE (steric exclusion)"
+                "selectivity_Li_vs_LiEC4": format_log10_ratio(claim_log10["Li_EC4"]),
+                "selectivity_Li_vs_LiH2O4": format_log10_ratio(claim_log10["Li_H2O4"]),
+                "optimal_pore_Li_vs_LiEC4_nm": round(d_crit, 3)
             },
             "claim_validation": {
-                "claim_12_barrier_gt_400": True,
-                "claim_12_selectivity_gt_1000": True,
-                "claim_13_d_crit_0.6_to_0.8": True
+                "claim_12_barrier_gt_400": all(claim_12b.values()),
+                "claim_12_selectivity_gt_1000": claim_12c,
+                "claim_13_d_crit_0.6_to_0.8": claim_13
             }
         }, f, indent=2)
     print(f"\n  Results saved: {profile_path}")
 
+    # Full profiles: typed binary store (+inf where blocked), not JSON lists
+    profiles_path = write_profiles(
+        output_dir, "dehydration_profiles", list(library["key"]), pore_range,
+        library_dehydration_matrix(library, pore_range, 30.0),
+        species_names=list(library["name"]),
+        metadata={"epsilon_bulk": 30.0, "d_critical_nm": 0.70,
+                  "simulation_id": "GENESIS-SIEVE-V1"}
+    )
+    print(f"  Profiles saved: {profiles_path}")
+
     # Selectivity
     sel_path = os.path.join(output_dir, "species_selectivity.json")
     with open(sel_path, 'w') as f:
-        json.dump(selectivity, f, indent=2, default=str)
+        json.dump(selectivity, f, indent=2, allow_nan=False)
     print(f"  Selectivity saved: {sel_path}")
 
     # 4. Generate plot
-    plot_path = os.path.join(output_dir, "dehydration_cliff.png")
-    generate_dehydration_plot(results, plot_path)
+    plot_data_path = os.path.join(output_dir, PLOT_DATA_FILE)
+    save_dehydration_plot_data(results, plot_data_path)
+    generate_dehydration_plot(plot_data_path, os.path.join(output_dir, PLOT_FILE))
 
     # 5. Generate verification report
     report_path = os.path.join(output_dir, "sieve_validation_report.txt")
@@ -605,12 +1056,16 @@ def main():
         f.write("CLAIM VERIFICATION:\n")
         f.write("-" * 70 + "\n")
         f.write(f"Claim 12(b): Barrier > 400 kJ/mol for solvated species\n")
-        f.write(f"  Li(EC)₄⁺ at 0.7nm: INFINITE (steric) ✅ PASS\n")
-        f.write(f"  Li(H₂O)₄⁺ at 0.7nm: INFINITE (steric) ✅ PASS\n\n")
+        for key, label in (("Li_EC4", "Li(EC)₄⁺"), ("Li_H2O4", "Li(H₂O)₄⁺")):
+            barrier = claim_barrier[key]
+            shown = "INFINITE (steric)" if np.isinf(barrier) else f"{barrier:.1f} kJ/mol"
+            f.write(f"  {label} at 0.7nm: {shown} {_verdict(claim_12b[key])}\n")
+        f.write("\n")
         f.write(f"Claim 12(c): Selectivity > 1000:1\n")
-        f.write(f"  Li⁺(bare) vs Li(EC)₄⁺: INFINITE ✅ PASS\n\n")
+        f.write(f"  Li⁺(bare) vs Li(EC)₄⁺: {format_log10_ratio(claim_log10['Li_EC4'])} "
+                f"{_verdict(claim_12c)}\n\n")
         f.write(f"Claim 13: d_crit between 0.6-0.8 nm\n")
-        f.write(f"  Model d_crit = 0.70 nm ✅ PASS\n\n")
+        f.write(f"  Model d_crit = {d_crit:.2f} nm {_verdict(claim_13)}\n\n")
         f.write("=" * 70 + "\n")
 
     print(f"  Report saved: {report_path}")
@@ -622,4 +1077,12 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    if "--profile" in sys.argv:
+        from figure_registry import set_render_profile
+        set_render_profile(sys.argv[sys.argv.index("--profile") + 1])
+    if "--render-only" in sys.argv:
+        # Restyle from the saved plot data; the model is not rerun
+        out = os.path.join(os.path.dirname(__file__), "outputs", "quantum_sieve")
+        generate_dehydration_plot(os.path.join(out, PLOT_DATA_FILE), os.path.join(out, PLOT_FILE))
+    else:
+        main()
@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+GENESIS SOLID-STATE BATTERY: FIGURE REGISTRY
+================================================================================
+
+Every figure is registered here as a pair:
+    - a data function (zero arguments) that computes or loads the arrays
+    - a render function render(plt, data) -> Figure that only draws
+
+generate_all_figures.py (publication style) and generate_plots.py (seaborn
+"paper" style) used to compute the Weibull failure curve and the Norton creep
+band separately, with their own copies of the parameters, and both wrote
+pressure_failure_curve_real.png. They now register their figures here and
+share one data function per curve.
+
+CACHING:
+    - Data functions run at most once per process; their result is shared
+      by every figure (and style) that declares the same data name.
+    - Each figure is rendered at most once per process; later requests
+      return the saved path.
+    - Two figures may not write the same output file.
+
+USAGE:
+    python figure_registry.py [--profile NAME]   (every figure, once each)
+
+RENDER PROFILES:
+    publication  300 DPI PNG in OUTPUT_DIR (the white-paper figures)
+    draft        50 DPI PNG in OUTPUT_DIR/draft, no tight-layout passes,
+                 minor ticks, antialiasing or hinting, light PNG
+                 compression; for fast iteration. Rendering is about 5×
+                 faster than publication, but a whole run is only about
+                 2.5× faster: startup (Python, matplotlib and the seaborn
+                 import behind the "paper" style, ~1.5 s) is the same
+                 for every profile
+    vector       SVG + PDF in OUTPUT_DIR, with dates and ids fixed so the
+                 files are reproducible
+    thumbnail    30 DPI PNG in OUTPUT_DIR/thumbnails
+
+    Select with --profile, set_render_profile(), or the
+    GENESIS_RENDER_PROFILE environment variable; no code edits needed.
+
+    Figures drawn outside the registry (physics_cycle_life,
+    born_solvation_quantum_sieve) are written with save_figure() and
+    follow the same profiles.
+
+STYLES:
+    Styles are applied with rc_context around each render, never globally,
+    so figures come out the same in any order and on any worker.
+
+Author: Nicholas Harris, Genesis Platform Inc.
+Date: February 2026
+License: Proprietary - All Rights Reserved
+================================================================================
+"""
+
+import importlib
+import numpy as np
+import os
+import sys
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Output directory
+OUTPUT_DIR = "03_VISUALIZATIONS"
+
+# Modules whose figures make up the full pipeline
+FIGURE_MODULES = ("generate_all_figures", "generate_plots")
+
+# High-quality figure parameters for publication
+RC_PARAMS = {
+    'font.family': 'serif',
+    'font.size': 12,
+    'axes.labelsize': 14,
+    'axes.titlesize': 16,
+    'xtick.labelsize': 11,
+    'ytick.labelsize': 11,
+    'legend.fontsize': 11,
+    'figure.dpi': 300,
+    'savefig.dpi': 300,
+    'savefig.bbox': 'tight',
+    'axes.linewidth': 1.2,
+    'axes.grid': True,
+    'grid.alpha': 0.3,
+    'grid.linestyle': '--'
+}
+
+# Render profile used when none is given
+DEFAULT_PROFILE = os.environ.get("GENESIS_RENDER_PROFILE") or "publication"
+
+# Weibull failure model for LLZO with 10 μm grain boundary flaws
+WEIBULL_THRESHOLD_MPA = 15.0   # Onset of micro-crack initiation
+WEIBULL_SCALE_MPA = 25.0       # Characteristic strength
+WEIBULL_MODULUS = 3.5          # Shape parameter
+
+# Norton power-law creep band for lithium at room temperature (rate = A·σⁿ)
+NORTON_A_LOW = 1e-9            # Pre-exponential (conservative)
+NORTON_A_HIGH = 1e-8           # Pre-exponential (aggressive)
+NORTON_N_LOW = 3.0             # Stress exponent (low bound)
+NORTON_N_HIGH = 4.5            # Stress exponent (high bound)
+
+
+# =============================================================================
+# REGISTRY
+# =============================================================================
+
+@dataclass
+class FigureSpec:
+    """A registered figure: where its data comes from and how it is drawn."""
+    name: str
+    data: str
+    render: Callable
+    filename: str
+    title: str
+    style: str = "publication"
+
+
+@dataclass
+class RenderProfile:
+    """How figures are written, independent of their style."""
+    name: str
+    formats: Tuple[str, ...] = ("png",)
+    subdir: str = ""                # Under OUTPUT_DIR
+    tight_layout: bool = True
+    minor_ticks: bool = True
+    png_compression: Optional[int] = None  # zlib level 0-9 (default 6); lower is faster
+    rc: Dict = field(default_factory=dict)  # Applied on top of the figure style
+
+
+RENDER_PROFILES: Dict[str, RenderProfile] = {
+    "publication": RenderProfile("publication"),
+    # Tick and text layout, not pixels, dominate at 50 DPI, so draft also
+    # skips minor ticks, glyph hinting and title auto-positioning, and
+    # writes lightly compressed PNGs
+    "draft": RenderProfile("draft", subdir="draft", tight_layout=False, minor_ticks=False,
+                           png_compression=1, rc={
+        'figure.dpi': 50, 'savefig.dpi': 50, 'savefig.bbox': 'standard',
+        'text.antialiased': False, 'lines.antialiased': False, 'patch.antialiased': False,
+        'text.hinting': 'none', 'axes.titley': 1.0,
+    }),
+    "vector": RenderProfile("vector", formats=("svg", "pdf"), rc={'svg.hashsalt': 'genesis'}),
+    "thumbnail": RenderProfile("thumbnail", subdir="thumbnails", rc={
+        'figure.dpi': 30, 'savefig.dpi': 30,
+    }),
+}
+
+# Per-format savefig metadata: no timestamps, so output is reproducible
+_SAVE_METADATA = {"svg": {"Date": None}, "pdf": {"CreationDate": None}}
+
+DATA_REGISTRY: Dict[str, Callable[[], Dict]] = {}
+FIGURE_REGISTRY: Dict[str, FigureSpec] = {}
+
+_data_cache: Dict[str, Dict] = {}
+_rendered: Dict[Tuple[str, str], str] = {}
+_active_profile = DEFAULT_PROFILE
+
+
+def register_data(name: str):
+    """Register a zero-argument function producing a figure's data dict."""
+    def decorator(func):
+        DATA_REGISTRY[name] = func
+        return func
+    return decorator
+
+
+def register_figure(name: str, data: str, filename: str, title: str,
+                    style: str = "publication"):
+    """
+    Register a render function render(plt, data) -> Figure.
+
+    Raises:
+        ValueError: if another figure already writes filename
+    """
+    def decorator(func):
+        for other in FIGURE_REGISTRY.values():
+            if other.filename == filename and other.name != name:
+                raise ValueError(f"{name}: {filename} is already written by {other.name}")
+        FIGURE_REGISTRY[name] = FigureSpec(name, data, func, filename, title, style)
+        return func
+    return decorator
+
+
+def load_figure_modules():
+    """Import FIGURE_MODULES so all their figures are registered."""
+    for module in FIGURE_MODULES:
+        importlib.import_module(module)
+
+
+def set_render_profile(name: str):
+    """Profile used by render_figure and save_figure when none is given."""
+    global _active_profile
+    _active_profile = get_render_profile(name).name
+
+
+def get_render_profile(name: Optional[str] = None) -> RenderProfile:
+    """A render profile by name (default: the active one)."""
+    name = name or _active_profile
+    if name not in RENDER_PROFILES:
+        raise ValueError(f"Unknown render profile {name!r}; choose from {sorted(RENDER_PROFILES)}")
+    return RENDER_PROFILES[name]
+
+
+def figure_data(name: str) -> Dict:
+    """Data dict for a registered data name, computed once per process."""
+    if name not in _data_cache:
+        _data_cache[name] = DATA_REGISTRY[name]()
+    return _data_cache[name]
+
+
+def clear_figure_cache():
+    """Forget cached data and rendered figures (e.g. after data files change)."""
+    _data_cache.clear()
+    _rendered.clear()
+
+
+# =============================================================================
+# STYLES AND RENDERING
+# =============================================================================
+
+def _paper_style() -> Dict:
+    """seaborn "paper" context (font_scale 1.5) with "ticks" axes."""
+    import matplotlib.style
+    import seaborn as sns
+    rc = dict(matplotlib.style.library['seaborn-v0_8-paper'])
+    rc.update(sns.plotting_context("paper", font_scale=1.5))
+    rc.update(sns.axes_style("ticks"))
+    rc['savefig.dpi'] = 300
+    return rc
+
+
+STYLES: Dict[str, Callable[[], Dict]] = {
+    "publication": lambda: RC_PARAMS,
+    "paper": _paper_style,
+}
+
+
+def save_figure(fig, output_path: str, profile: Optional[str] = None) -> List[str]:
+    """
+    Lay out and write a drawn figure the way a render profile says.
+
+    Call inside plt.rc_context(get_render_profile(profile).rc) so the
+    profile's rc applies to drawing as well as saving. The profile's
+    subdir goes under the directory of output_path, and each of its
+    formats replaces the extension.
+
+    Returns:
+        Written paths, one per format
+    """
+    profile = get_render_profile(profile)
+    directory, filename = os.path.split(output_path)
+    directory = os.path.join(directory, profile.subdir)
+    os.makedirs(directory or ".", exist_ok=True)
+    stem = os.path.splitext(filename)[0]
+    paths = [os.path.join(directory, f"{stem}.{fmt}") for fmt in profile.formats]
+
+    if not profile.minor_ticks:
+        for ax in fig.axes:
+            ax.minorticks_off()
+    if profile.tight_layout:
+        fig.tight_layout()
+    for fmt, path in zip(profile.formats, paths):
+        options = {}
+        if fmt == "png" and profile.png_compression is not None:
+            options["pil_kwargs"] = {"compress_level": profile.png_compression}
+        fig.savefig(path, format=fmt, metadata=_SAVE_METADATA.get(fmt), **options)
+    return paths
+
+
+def render_figure(name: str, profile: Optional[str] = None, force: bool = False) -> str:
+    """
+    Render a registered figure with a render profile (default: the active one).
+
+    matplotlib is imported here, on first use. A figure already rendered
+    with this profile in this process is not drawn again unless force is
+    set. Data is shared between profiles.
+
+    Returns:
+        Output path (of the first format, for multi-format profiles)
+    """
+    profile = get_render_profile(profile)
+    if (name, profile.name) in _rendered and not force:
+        return _rendered[name, profile.name]
+    spec = FIGURE_REGISTRY[name]
+    print(f"Generating {spec.title}...")
+    data = figure_data(spec.data)
+
+    import matplotlib.pyplot as plt
+    with plt.rc_context(STYLES[spec.style]()), plt.rc_context(profile.rc):
+        fig = spec.render(plt, data)
+        paths = save_figure(fig, os.path.join(OUTPUT_DIR, spec.filename), profile.name)
+        plt.close(fig)
+    for path in paths:
+        print(f"  ✓ Saved: {path}")
+
+    _rendered[name, profile.name] = paths[0]
+    return paths[0]
+
+
+def render_figures(names: Optional[Sequence[str]] = None, profile: Optional[str] = None) -> List[str]:
+    """Render several registered figures (default: all), each at most once."""
+    return [render_figure(name, profile) for name in (names or list(FIGURE_REGISTRY))]
+
+
+# =============================================================================
+# SHARED FIGURE DATA
+# =============================================================================
+
+@register_data("weibull_failure")
+def weibull_failure_data() -> Dict:
+    """
+    Micro-crack initiation probability vs. clamping pressure (0-100 MPa).
+
+    P(failure) = 1 - exp(-((σ - σ_threshold) / σ_scale)^m) for σ > σ_threshold
+    """
+    pressure = np.linspace(0, 100, 1000)
+    failure_prob = np.zeros_like(pressure)
+    above_threshold = pressure > WEIBULL_THRESHOLD_MPA
+    failure_prob[above_threshold] = 1 - np.exp(
+        -((pressure[above_threshold] - WEIBULL_THRESHOLD_MPA) / WEIBULL_SCALE_MPA) ** WEIBULL_MODULUS
+    )
+    return {
+        "pressure_MPa": pressure,
+        "failure_probability_percent": failure_prob * 100,
+    }
+
+
+@register_data("weibull_failure_monte_carlo")
+def weibull_failure_monte_carlo_data() -> Dict:
+    """
+    Alternative to weibull_failure: the weakest-link Monte Carlo curve.
+
+    Same keys and pressure grid as weibull_failure, plus the Weibull fit to
+    the simulated separator strengths (weakest_link_fracture defaults).
+    """
+    from weakest_link_fracture import run_fracture_simulation
+    result = run_fracture_simulation(np.linspace(0, 100, 1000))
+    return {
+        "pressure_MPa": result["pressure_MPa"],
+        "failure_probability_percent": result["failure_probability"] * 100,
+        "weibull_fit": result["weibull"],
+    }
+
+
+@register_data("norton_creep")
+def norton_creep_data() -> Dict:
+    """
+    Lithium creep rate band (1/s) vs. stack pressure (1-300 MPa, log grid).
+
+    Evaluated with the norton_creep engine (Arrhenius term included) at
+    room temperature, where A is calibrated.
+    """
+    from norton_creep import NORTON_HIGH, NORTON_LOW, ROOM_TEMPERATURE_K
+    pressure = np.logspace(0, 2.5, 200)
+    rate_low = NORTON_LOW.strain_rate(pressure, ROOM_TEMPERATURE_K)
+    rate_high = NORTON_HIGH.strain_rate(pressure, ROOM_TEMPERATURE_K)
+    return {
+        "pressure_MPa": pressure,
+        "temperature_K": ROOM_TEMPERATURE_K,
+        "rate_low": rate_low,
+        "rate_high": rate_high,
+        "rate_mid": np.sqrt(rate_low * rate_high),  # Geometric mean
+    }
+
+
+# =============================================================================
+# MAIN EXECUTION
+# =============================================================================
+
+def main() -> int:
+    """Render every figure of FIGURE_MODULES once; returns the exit code."""
+    if "--profile" in sys.argv:
+        set_render_profile(sys.argv[sys.argv.index("--profile") + 1])
+    load_figure_modules()
+    failed = []
+    for name in FIGURE_REGISTRY:
+        try:
+            render_figure(name)
+        except Exception as e:
+            failed.append(name)
+            print(f"  ✗ {name}: {type(e).__name__}: {e}")
+    print(f"Rendered {len(_rendered)}/{len(FIGURE_REGISTRY)} figures "
+          f"from {len(_data_cache)} data sets")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    # Figure modules register into the importable module, not __main__
+    import figure_registry
+    sys.exit(figure_registry.main())
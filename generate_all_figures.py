@@ -15,8 +15,20 @@ Author: Nicholas Harris, Genesis Platform Inc.
 Date: February 2026
 License: Proprietary - All Rights Reserved
 
+Each figure is registered in figure_registry as a data function plus a
+render function; the Weibull and creep data are shared with generate_plots.
+
 USAGE:
-    python generate_all_figures.py
+    python generate_all_figures.py [--parallel] [--workers N] [--profile NAME]
+
+    --profile selects a render profile (publication, draft, vector,
+    thumbnail; see figure_registry).
+
+PARALLEL RENDERING:
+    --parallel renders the figures on a process pool with the headless Agg
+    backend forced in every worker, and reports each figure's output path
+    and render time. Each figure is drawn from seeded/deterministic data by
+    a single process, so the files are byte-identical to a serial run.
 
 OUTPUT:
     All figures saved to 03_VISUALIZATIONS/
@@ -24,86 +36,39 @@ OUTPUT:
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
-import json
-import csv
 import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence
+
+import validation_data_access as data_access
+from series_decimation import decimate
+from figure_registry import (
+    OUTPUT_DIR,
+    WEIBULL_MODULUS, WEIBULL_SCALE_MPA, WEIBULL_THRESHOLD_MPA,
+    register_data, register_figure, render_figure, set_render_profile,
+)
 
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
 
-# Set high-quality figure parameters for publication
-plt.rcParams.update({
-    'font.family': 'serif',
-    'font.size': 12,
-    'axes.labelsize': 14,
-    'axes.titlesize': 16,
-    'xtick.labelsize': 11,
-    'ytick.labelsize': 11,
-    'legend.fontsize': 11,
-    'figure.dpi': 300,
-    'savefig.dpi': 300,
-    'savefig.bbox': 'tight',
-    'axes.linewidth': 1.2,
-    'axes.grid': True,
-    'grid.alpha': 0.3,
-    'grid.linestyle': '--'
-})
-
-# Output directory
-OUTPUT_DIR = "03_VISUALIZATIONS"
 DATA_DIR = "validation_data"
 
-# Ensure output directory exists
-os.makedirs(OUTPUT_DIR, exist_ok=True)
-
 
 # =============================================================================
 # FIGURE 1: PRESSURE-FAILURE PROBABILITY CURVE
 # =============================================================================
 
-def generate_pressure_failure_curve():
-    """
-    Generates the 'Pressure Paradox' failure probability curve.
-    
-    PHYSICS BASIS:
-    - Weibull distribution for brittle ceramic failure
-    - Stress concentration factor at grain boundaries: K_t ≈ 7
-    - LLZO fracture toughness: K_IC ≈ 1.0 MPa·√m
-    - Typical grain boundary flaw size: a ≈ 10 μm
-    
-    The critical stress for micro-crack initiation:
-        σ_critical = K_IC / (K_t × √(π×a)) ≈ 25 MPa
-    
-    We model failure probability using Weibull statistics:
-        P(failure) = 1 - exp(-((σ - σ_threshold) / σ_scale)^m)
-    
-    Where:
-        σ_threshold = 15 MPa (onset of damage)
-        σ_scale = 25 MPa (characteristic strength)
-        m = 3.5 (Weibull modulus for LLZO)
-    """
-    
-    print("Generating Figure 1: Pressure-Failure Probability Curve...")
-    
-    # Generate pressure range (0 to 100 MPa)
-    pressure = np.linspace(0, 100, 1000)
-    
-    # Weibull parameters (from fracture mechanics analysis)
-    threshold = 15.0    # MPa - onset of micro-crack initiation
-    scale = 25.0        # MPa - characteristic strength
-    weibull_mod = 3.5   # Weibull modulus (shape parameter)
-    
-    # Calculate failure probability using Weibull distribution
-    # P(failure) = 1 - exp(-((σ - threshold)/scale)^m) for σ > threshold
-    failure_prob = np.zeros_like(pressure)
-    above_threshold = pressure > threshold
-    failure_prob[above_threshold] = 1 - np.exp(
-        -((pressure[above_threshold] - threshold) / scale) ** weibull_mod
-    )
-    failure_prob = failure_prob * 100  # Convert to percentage
+@register_figure("pressure_failure_curve", data="weibull_failure",
+                 filename="pressure_failure_curve_real.png",
+                 title="Figure 1: Pressure-Failure Probability Curve")
+def render_pressure_failure_curve(plt, data: Dict):
+    """Draw Figure 1."""
+    pressure = data["pressure_MPa"]
+    failure_prob = data["failure_probability_percent"]
     
     # Create figure
     fig, ax = plt.subplots(figsize=(12, 8))
@@ -147,53 +112,50 @@ def generate_pressure_failure_curve():
     # Add equation box
     eq_text = (r'$P_{failure} = 1 - \exp\left(-\left(\frac{\sigma - \sigma_{th}}{\sigma_0}\right)^m\right)$'
                '\n\n'
-               r'$\sigma_{th} = 15$ MPa, $\sigma_0 = 25$ MPa, $m = 3.5$')
+               rf'$\sigma_{{th}} = {WEIBULL_THRESHOLD_MPA:g}$ MPa, $\sigma_0 = {WEIBULL_SCALE_MPA:g}$ MPa, '
+               rf'$m = {WEIBULL_MODULUS:g}$')
     ax.text(0.98, 0.25, eq_text, transform=ax.transAxes, fontsize=10,
             verticalalignment='top', horizontalalignment='right',
             bbox=dict(boxstyle='round,pad=0.5', facecolor='#FFF8E1', edgecolor='#FF8F00', alpha=0.9))
     
-    plt.tight_layout()
-    output_path = os.path.join(OUTPUT_DIR, 'pressure_failure_curve_real.png')
-    plt.savefig(output_path)
-    plt.close()
-    
-    print(f"  ✓ Saved: {output_path}")
-    return output_path
+    return fig
 
 
-# =============================================================================
-# FIGURE 2: LITHIUM CREEP RATE VS. PRESSURE
-# =============================================================================
-
-def generate_creep_rate_curve():
+def generate_pressure_failure_curve():
     """
-    Generates Lithium Creep Rate vs. Applied Pressure plot.
+    Generates the 'Pressure Paradox' failure probability curve.
     
     PHYSICS BASIS:
-    - Norton Power-Law Creep: ε̇ = A × σ^n × exp(-Q/RT)
-    - For lithium at room temperature (300 K):
-        A ≈ 10⁻⁸ s⁻¹·MPa⁻ⁿ
-        n ≈ 3-5 (dislocation creep regime)
-        Q ≈ 50 kJ/mol (activation energy)
-    
-    This shows why high pressure ACCELERATES lithium infiltration into cracks.
-    """
-    
-    print("Generating Figure 2: Lithium Creep Rate vs. Pressure...")
+    - Weibull distribution for brittle ceramic failure
+    - Stress concentration factor at grain boundaries: K_t ≈ 7
+    - LLZO fracture toughness: K_IC ≈ 1.0 MPa·√m
+    - Typical grain boundary flaw size: a ≈ 10 μm
     
-    # Generate pressure range (log scale: 1 to 300 MPa)
-    pressure = np.logspace(0, 2.5, 200)
+    The critical stress for micro-crack initiation:
+        σ_critical = K_IC / (K_t × √(π×a)) ≈ 25 MPa
     
-    # Norton creep parameters for lithium metal
-    A_low = 1e-9       # Pre-exponential (conservative)
-    A_high = 1e-8      # Pre-exponential (aggressive)
-    n_low = 3.0        # Stress exponent (low bound)
-    n_high = 4.5       # Stress exponent (high bound)
+    We model failure probability using Weibull statistics:
+        P(failure) = 1 - exp(-((σ - σ_threshold) / σ_scale)^m)
     
-    # Calculate creep rates
-    rate_low = A_low * np.power(pressure, n_low)
-    rate_high = A_high * np.power(pressure, n_high)
-    rate_mid = np.sqrt(rate_low * rate_high)  # Geometric mean
+    Where:
+        σ_threshold = 15 MPa (onset of damage)
+        σ_scale = 25 MPa (characteristic strength)
+        m = 3.5 (Weibull modulus for LLZO)
+    """
+    return render_figure("pressure_failure_curve")
+
+
+# =============================================================================
+# FIGURE 2: LITHIUM CREEP RATE VS. PRESSURE
+# =============================================================================
+
+@register_figure("creep_rate_curve", data="norton_creep",
+                 filename="lithium_creep_rate.png",
+                 title="Figure 2: Lithium Creep Rate vs. Pressure")
+def render_creep_rate_curve(plt, data: Dict):
+    """Draw Figure 2."""
+    pressure = data["pressure_MPa"]
+    rate_low, rate_high, rate_mid = data["rate_low"], data["rate_high"], data["rate_mid"]
     
     # Create figure
     fig, ax = plt.subplots(figsize=(12, 8))
@@ -244,46 +206,48 @@ def generate_creep_rate_curve():
             verticalalignment='top', horizontalalignment='right',
             bbox=dict(boxstyle='round,pad=0.5', facecolor='#E3F2FD', edgecolor='#1976D2', alpha=0.9))
     
-    plt.tight_layout()
-    output_path = os.path.join(OUTPUT_DIR, 'lithium_creep_rate.png')
-    plt.savefig(output_path)
-    plt.close()
+    return fig
+
+
+def generate_creep_rate_curve():
+    """
+    Generates Lithium Creep Rate vs. Applied Pressure plot.
     
-    print(f"  ✓ Saved: {output_path}")
-    return output_path
+    PHYSICS BASIS:
+    - Norton Power-Law Creep: ε̇ = A × σ^n × exp(-Q/RT)
+    - For lithium at room temperature (300 K):
+        A ≈ 10⁻⁸ s⁻¹·MPa⁻ⁿ
+        n ≈ 3-5 (dislocation creep regime)
+        Q ≈ 50 kJ/mol (activation energy)
+    
+    This shows why high pressure ACCELERATES lithium infiltration into cracks.
+    """
+    return render_figure("creep_rate_curve")
 
 
 # =============================================================================
 # FIGURE 3: CYCLE LIFE VALIDATION
 # =============================================================================
 
-def generate_cycle_life_plot():
-    """
-    Generates cycle life validation plot from real simulation data.
-    
-    DATA SOURCE: validation_data/zero_pressure_cycling.csv
-    
-    This demonstrates >1000 cycles with >95% capacity retention at ZERO pressure.
-    """
-    
-    print("Generating Figure 3: Cycle Life Validation Plot...")
-    
-    # Load real data from CSV
+@register_data("zero_pressure_cycling")
+def zero_pressure_cycling_data() -> Dict:
+    """Cycle number and retention (%) from validation_data/zero_pressure_cycling.csv."""
+    # Load real data from CSV (shared cached loader)
     data_path = os.path.join(DATA_DIR, 'zero_pressure_cycling.csv')
-    cycles = []
-    retention = []
-    
-    with open(data_path, 'r') as f:
-        reader = csv.reader(f)
-        for row in reader:
-            # Skip comments and header
-            if not row or row[0].startswith('#') or row[0] == 'cycle':
-                continue
-            cycles.append(int(row[0]))
-            retention.append(float(row[2]))
+    cycles, retention = data_access.load_cycling(data_path)
+    return {"cycles": cycles, "retention_percent": retention}
+
+
+@register_figure("cycle_life_validation", data="zero_pressure_cycling",
+                 filename="cycle_life_validation.png",
+                 title="Figure 3: Cycle Life Validation Plot")
+def render_cycle_life_plot(plt, data: Dict):
+    """Draw Figure 3."""
+    cycles, retention = data["cycles"], data["retention_percent"]
     
-    cycles = np.array(cycles)
-    retention = np.array(retention)
+    # Long histories: plot a shape-preserving subset (no-op below the threshold)
+    cycles, retention = decimate(cycles, retention, thresholds=(80, 95),
+                                 keep=(int(np.argmin(np.abs(cycles - 1000))),))
     
     # Create figure
     fig, ax = plt.subplots(figsize=(12, 8))
@@ -339,31 +303,27 @@ def generate_cycle_life_plot():
             verticalalignment='top', horizontalalignment='right',
             bbox=dict(boxstyle='round,pad=0.4', facecolor='#FAFAFA', edgecolor='#BDBDBD', alpha=0.9))
     
-    plt.tight_layout()
-    output_path = os.path.join(OUTPUT_DIR, 'cycle_life_validation.png')
-    plt.savefig(output_path)
-    plt.close()
+    return fig
+
+
+def generate_cycle_life_plot():
+    """
+    Generates cycle life validation plot from real simulation data.
+    
+    DATA SOURCE: validation_data/zero_pressure_cycling.csv
     
-    print(f"  ✓ Saved: {output_path}")
-    return output_path
+    This demonstrates >1000 cycles with >95% capacity retention at ZERO pressure.
+    """
+    return render_figure("cycle_life_validation")
 
 
 # =============================================================================
 # FIGURE 4: IONIC CONDUCTIVITY TEMPERATURE DEPENDENCE
 # =============================================================================
 
-def generate_conductivity_arrhenius_plot():
-    """
-    Generates Arrhenius plot of ionic conductivity vs. temperature.
-    
-    PHYSICS BASIS:
-    - Arrhenius equation: σ = σ₀ × exp(-Ea / kB×T)
-    - Activation energy: Ea = 0.31 eV (from simulation)
-    - Room temperature conductivity: σ(300K) = 0.5485 mS/cm
-    """
-    
-    print("Generating Figure 4: Ionic Conductivity Arrhenius Plot...")
-    
+@register_data("conductivity_arrhenius")
+def conductivity_arrhenius_data() -> Dict:
+    """Arrhenius conductivity model and seeded scatter points (mS/cm)."""
     # Temperature range (Celsius)
     T_celsius = np.array([-40, -20, 0, 25, 40, 60, 80, 100])
     T_kelvin = T_celsius + 273.15
@@ -380,6 +340,19 @@ def generate_conductivity_arrhenius_plot():
     np.random.seed(42)
     sigma_data = sigma * (1 + 0.05 * np.random.randn(len(sigma)))
     
+    return {"T_celsius": T_celsius, "T_kelvin": T_kelvin, "sigma": sigma,
+            "sigma_data": sigma_data, "Ea_eV": Ea, "kB_eV_K": kB}
+
+
+@register_figure("conductivity_arrhenius", data="conductivity_arrhenius",
+                 filename="conductivity_arrhenius.png",
+                 title="Figure 4: Ionic Conductivity Arrhenius Plot")
+def render_conductivity_arrhenius_plot(plt, data: Dict):
+    """Draw Figure 4."""
+    T_celsius, T_kelvin = data["T_celsius"], data["T_kelvin"]
+    sigma, sigma_data = data["sigma"], data["sigma_data"]
+    Ea, kB = data["Ea_eV"], data["kB_eV_K"]
+    
     # Create figure with two panels
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
     
@@ -427,33 +400,37 @@ def generate_conductivity_arrhenius_plot():
                  '(Nernst-Einstein from MD Simulation)',
                  fontweight='bold', fontsize=14, y=1.02)
     
-    plt.tight_layout()
-    output_path = os.path.join(OUTPUT_DIR, 'conductivity_arrhenius.png')
-    plt.savefig(output_path)
-    plt.close()
+    return fig
+
+
+def generate_conductivity_arrhenius_plot():
+    """
+    Generates Arrhenius plot of ionic conductivity vs. temperature.
     
-    print(f"  ✓ Saved: {output_path}")
-    return output_path
+    PHYSICS BASIS:
+    - Arrhenius equation: σ = σ₀ × exp(-Ea / kB×T)
+    - Activation energy: Ea = 0.31 eV (from simulation)
+    - Room temperature conductivity: σ(300K) = 0.5485 mS/cm
+    """
+    return render_figure("conductivity_arrhenius")
 
 
 # =============================================================================
 # FIGURE 5: DENDRITE SUPPRESSION COMPARISON
 # =============================================================================
 
-def generate_dendrite_comparison_plot():
-    """
-    Generates bar chart comparing dendrite suppression metrics.
-    
-    DATA SOURCE: validation_data/dendrite_suppression_results.json
-    """
-    
-    print("Generating Figure 5: Dendrite Suppression Comparison...")
-    
-    # Load real data
+@register_data("dendrite_suppression")
+def dendrite_suppression_data() -> Dict:
+    """Phase-field results from validation_data/dendrite_suppression_results.json."""
     data_path = os.path.join(DATA_DIR, 'dendrite_suppression_results.json')
-    with open(data_path, 'r') as f:
-        data = json.load(f)
-    
+    return data_access.load_dendrite_results(data_path)
+
+
+@register_figure("dendrite_suppression_comparison", data="dendrite_suppression",
+                 filename="dendrite_suppression_comparison.png",
+                 title="Figure 5: Dendrite Suppression Comparison")
+def render_dendrite_comparison_plot(plt, data: Dict):
+    """Draw Figure 5."""
     # Extract metrics
     metrics = ['Max Deflection\n(nm)', 'Peak Stress\n(MPa)', 'Penetration\n(%)']
     baseline_values = [
@@ -522,31 +499,42 @@ def generate_dendrite_comparison_plot():
             verticalalignment='top', horizontalalignment='right', fontweight='bold',
             bbox=dict(boxstyle='round,pad=0.5', facecolor='#E8F5E9', edgecolor='#2E7D32'))
     
-    plt.tight_layout()
-    output_path = os.path.join(OUTPUT_DIR, 'dendrite_suppression_comparison.png')
-    plt.savefig(output_path)
-    plt.close()
+    return fig
+
+
+def generate_dendrite_comparison_plot():
+    """
+    Generates bar chart comparing dendrite suppression metrics.
     
-    print(f"  ✓ Saved: {output_path}")
-    return output_path
+    DATA SOURCE: validation_data/dendrite_suppression_results.json
+    """
+    return render_figure("dendrite_suppression_comparison")
 
 
 # =============================================================================
 # FIGURE 6: INDUSTRY INVESTMENT MAP
 # =============================================================================
 
-def generate_investment_landscape():
-    """
-    Generates visualization of industry investment and failure modes.
-    """
-    
-    print("Generating Figure 6: Industry Investment Landscape...")
-    
+@register_data("industry_investment")
+def industry_investment_data() -> Dict:
+    """Investment, estimated operating pressure and cycle life by company."""
     companies = ['QuantumScape', 'Toyota', 'CATL', 'Samsung SDI', 'Solid Power', 'Apple']
     investments = [4.2, 15.0, 10.0, 3.0, 0.64, 2.0]  # Billions USD
     pressures = [20, 100, 50, 30, 40, 10]  # Estimated operating pressure (MPa)
     cycle_life = [300, 200, 250, 400, 200, 500]  # Estimated cycle life
     
+    return {"companies": companies, "investments": investments,
+            "pressures": pressures, "cycle_life": cycle_life}
+
+
+@register_figure("industry_investment_landscape", data="industry_investment",
+                 filename="industry_investment_landscape.png",
+                 title="Figure 6: Industry Investment Landscape")
+def render_investment_landscape(plt, data: Dict):
+    """Draw Figure 6."""
+    companies, investments = data["companies"], data["investments"]
+    pressures, cycle_life = data["pressures"], data["cycle_life"]
+    
     # Create figure with two panels
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
     
@@ -596,39 +584,103 @@ def generate_investment_landscape():
     
     plt.colorbar(scatter, ax=ax2, label='Pressure (MPa)')
     
-    plt.tight_layout()
-    output_path = os.path.join(OUTPUT_DIR, 'industry_investment_landscape.png')
-    plt.savefig(output_path)
-    plt.close()
-    
-    print(f"  ✓ Saved: {output_path}")
-    return output_path
+    return fig
+
+
+def generate_investment_landscape():
+    """
+    Generates visualization of industry investment and failure modes.
+    """
+    return render_figure("industry_investment_landscape")
 
 
 # =============================================================================
 # MAIN EXECUTION
 # =============================================================================
 
-def main():
+FIGURES: List[Callable[[], str]] = [
+    generate_pressure_failure_curve,
+    generate_creep_rate_curve,
+    generate_cycle_life_plot,
+    generate_conductivity_arrhenius_plot,
+    generate_dendrite_comparison_plot,
+    generate_investment_landscape,
+]
+
+
+def _init_render_worker(profile: Optional[str]):
+    """Pool initializer: force Agg before any worker imports pyplot."""
+    import matplotlib
+    matplotlib.use("Agg", force=True)
+    if profile:
+        set_render_profile(profile)
+
+
+def _timed_render(generate: Callable[[], str]) -> Dict:
+    """Worker task: render one figure, never raising."""
+    t0 = time.perf_counter()
+    try:
+        path, error = generate(), ""
+    except Exception as e:
+        path, error = None, f"{type(e).__name__}: {e}"
+    return {"figure": generate.__name__, "path": path,
+            "render_time_s": time.perf_counter() - t0, "error": error}
+
+
+def render_figures_parallel(
+    figures: Optional[Sequence[Callable[[], str]]] = None,
+    max_workers: Optional[int] = None,
+    profile: Optional[str] = None
+) -> List[Dict]:
+    """
+    Render figures on a process pool with the Agg backend.
+
+    Returns:
+        One record per figure, in input order: figure, path, render_time_s
+        and error ("" on success; a failing figure does not stop the others)
+    """
+    figures = FIGURES if figures is None else list(figures)
+    workers = min(max_workers or os.cpu_count() or 1, len(figures)) or 1
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker,
+                             initargs=(profile,)) as pool:
+        return list(pool.map(_timed_render, figures))
+
+
+def main(parallel: bool = False, max_workers: Optional[int] = None,
+         profile: Optional[str] = None):
     """
     Generate all figures for the public white paper.
     """
+    if profile:
+        set_render_profile(profile)
     
     print("=" * 80)
     print("GENESIS SOLID-STATE BATTERY: FIGURE GENERATION SUITE")
     print("=" * 80)
     print(f"Timestamp: {datetime.now().isoformat()}")
     print(f"Output Directory: {OUTPUT_DIR}")
+    if profile:
+        print(f"Render Profile: {profile}")
     print("-" * 80)
     
+    if parallel:
+        t0 = time.perf_counter()
+        records = render_figures_parallel(max_workers=max_workers, profile=profile)
+        elapsed = time.perf_counter() - t0
+        figures = [r["path"] for r in records if not r["error"]]
+        
+        print("-" * 80)
+        print(f"Rendered {len(figures)}/{len(records)} figures in {elapsed:.2f} s:")
+        for r in records:
+            if r["error"]:
+                print(f"   ✗ {r['figure']} ({r['render_time_s']:.2f} s): {r['error']}")
+            else:
+                print(f"   • {r['path']} ({r['render_time_s']:.2f} s)")
+        print("=" * 80)
+        return figures
+    
     # Generate all figures
-    figures = []
-    figures.append(generate_pressure_failure_curve())
-    figures.append(generate_creep_rate_curve())
-    figures.append(generate_cycle_life_plot())
-    figures.append(generate_conductivity_arrhenius_plot())
-    figures.append(generate_dendrite_comparison_plot())
-    figures.append(generate_investment_landscape())
+    figures = [generate() for generate in FIGURES]
     
     print("-" * 80)
     print(f"✅ Successfully generated {len(figures)} figures:")
@@ -640,4 +692,6 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    main(parallel="--parallel" in sys.argv,
+         max_workers=int(sys.argv[sys.argv.index("--workers") + 1]) if "--workers" in sys.argv else None,
+         profile=sys.argv[sys.argv.index("--profile") + 1] if "--profile" in sys.argv else None)
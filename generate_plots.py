@@ -1,26 +1,12 @@
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+import sys
 
-# Set style for "Scientific Publication" look
-plt.style.use('seaborn-v0_8-paper')
-sns.set_context("paper", font_scale=1.5)
-sns.set_style("ticks")
+from figure_registry import register_figure, render_figure, set_render_profile
 
-def plot_failure_probability():
-    """
-    Generates the 'Pressure Paradox' failure probability curve based on fracture mechanics.
-    """
-    pressure = np.linspace(0, 100, 1000) # MPa
-    
-    # Weibull distribution model for ceramic failure
-    # Parameters estimated for LLZO with 10um grain flaws
-    threshold = 15.0 # MPa (lower bound)
-    scale = 25.0    # MPa (characteristic strength)
-    shape = 3.5     # Weibull modulus
-    
-    failure_prob = 1 - np.exp(-((pressure - threshold).clip(0) / scale) ** shape)
-    failure_prob = failure_prob * 100 # Convert to %
+@register_figure("pressure_failure_curve_paper", data="weibull_failure",
+                 filename="pressure_failure_curve_paper.png",
+                 title="Paper Figure: Pressure-Failure Probability Curve", style="paper")
+def render_failure_probability(plt, data):
+    pressure, failure_prob = data["pressure_MPa"], data["failure_probability_percent"]
 
     fig, ax = plt.subplots(figsize=(10, 6))
     
@@ -46,21 +32,19 @@ def plot_failure_probability():
     ax.grid(True, linestyle='--', alpha=0.7)
     ax.legend(loc='upper left', frameon=True)
     
-    plt.tight_layout()
-    plt.savefig('03_VISUALIZATIONS/pressure_failure_curve_real.png', dpi=300)
-    print("Generated pressure_failure_curve_real.png")
+    return fig
 
-def plot_creep_rate():
+def plot_failure_probability():
     """
-    Generates Lithium Creep Rate vs. Pressure log-log plot.
+    Generates the 'Pressure Paradox' failure probability curve based on fracture mechanics.
     """
-    pressure = np.logspace(0, 2.5, 100) # 1 to 300 MPa
-    
-    # Norton Creep Law: rate = A * sigma^n
-    # A approx 1e-8 for Li at room temp
-    # n approx 4
-    rate_low = 1e-9 * pressure**3
-    rate_high = 1e-8 * pressure**4.5
+    return render_figure("pressure_failure_curve_paper")
+
+@register_figure("creep_rate_paper", data="norton_creep",
+                 filename="lithium_creep_rate_paper.png",
+                 title="Paper Figure: Lithium Creep Rate vs. Pressure", style="paper")
+def render_creep_rate(plt, data):
+    pressure, rate_low, rate_high = data["pressure_MPa"], data["rate_low"], data["rate_high"]
     
     fig, ax = plt.subplots(figsize=(10, 6))
     
@@ -80,10 +64,16 @@ def plot_creep_rate():
     ax.grid(True, which="both", ls="-", alpha=0.2)
     ax.legend(loc='upper left')
     
-    plt.tight_layout()
-    plt.savefig('03_VISUALIZATIONS/lithium_creep_rate.png', dpi=300)
-    print("Generated lithium_creep_rate.png")
+    return fig
+
+def plot_creep_rate():
+    """
+    Generates Lithium Creep Rate vs. Pressure log-log plot.
+    """
+    return render_figure("creep_rate_paper")
 
 if __name__ == "__main__":
+    if "--profile" in sys.argv:
+        set_render_profile(sys.argv[sys.argv.index("--profile") + 1])
     plot_failure_probability()
     plot_creep_rate()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+GENESIS: MODULE IMPORT-TIME BUDGETS
+================================================================================
+
+Batch jobs import the model modules as libraries; they should not pay for
+matplotlib, seaborn or SciPy until a function actually needs them. This
+script checks every budgeted module still imports within its budget.
+
+MEASUREMENT:
+    - Each module is imported in a fresh interpreter, after NumPy, so the
+      figure is the module's own cost (ms beyond NumPy)
+    - Modules are timed one at a time, never alongside other work, and the
+      minimum of N_RUNS imports is compared with the budget; the minimum is
+      the least noisy estimate of the cost itself
+    - Nothing is cached: every run measures
+
+    This is a performance gate, not a white-paper claim, so it is kept out
+    of the verification report; verification_suite.py --import-budgets runs
+    it after the checks and fails the run if a module is over budget.
+
+USAGE:
+    python import_budget.py [--runs N]       (exit code 1 if over budget)
+    python verification_suite.py --import-budgets [--runs N]
+
+Author: Nicholas Harris, Genesis Platform Inc.
+Date: February 2026
+License: Proprietary - All Rights Reserved
+================================================================================
+"""
+
+import os
+import subprocess
+import sys
+from typing import Dict
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Imports per module; the minimum is compared with the budget
+N_RUNS = 5
+
+# Import-time budgets (ms beyond NumPy, fresh interpreter). Plotting and
+# SciPy imports are deferred to the functions that use them.
+IMPORT_BUDGETS_MS = {
+    "physics_cycle_life": 50.0,
+    "born_solvation_quantum_sieve": 50.0,
+    "sieve_output": 25.0,
+    "validation_data_access": 25.0,
+    "sieve_lookup": 50.0,
+    "sieve_uncertainty": 50.0,
+    "sieve_pore_distribution": 50.0,
+    "sieve_sweep": 50.0,
+    "pore_network_flux": 50.0,
+    "generate_all_figures": 50.0,
+    "generate_plots": 50.0,
+    "figure_registry": 25.0,
+    "series_decimation": 25.0,
+    "weakest_link_fracture": 50.0,
+    "norton_creep": 50.0,
+    "verification_suite": 100.0,
+    "batch_verification": 100.0,
+}
+
+_IMPORT_TIMER = (
+    "import importlib, sys, time; import numpy; "
+    "t = time.perf_counter(); importlib.import_module(sys.argv[1]); "
+    "print((time.perf_counter() - t) * 1000.0)"
+)
+
+
+def measure_import_ms(module: str, runs: int = N_RUNS) -> float:
+    """
+    Minimum import time (ms beyond NumPy) of module over runs fresh interpreters.
+
+    Returns:
+        NaN if the module fails to import
+    """
+    best = float('inf')
+    for _ in range(runs):
+        proc = subprocess.run([sys.executable, "-c", _IMPORT_TIMER, module],
+                              cwd=SCRIPT_DIR, capture_output=True, text=True)
+        if proc.returncode != 0:
+            return float('nan')
+        best = min(best, float(proc.stdout.split()[-1]))
+    return best
+
+
+def check_import_budgets(budgets_ms: Dict[str, float] = None, runs: int = N_RUNS) -> Dict[str, Dict]:
+    """Measure every budgeted module in turn; returns {module: {time_ms, budget_ms, passed}}."""
+    report = {}
+    for module, budget in (budgets_ms or IMPORT_BUDGETS_MS).items():
+        elapsed = measure_import_ms(module, runs)
+        report[module] = {"time_ms": elapsed, "budget_ms": budget, "passed": elapsed <= budget}
+    return report
+
+
+def main() -> int:
+    """Print the budget table; returns the exit code."""
+    runs = int(sys.argv[sys.argv.index("--runs") + 1]) if "--runs" in sys.argv else N_RUNS
+    report = check_import_budgets(runs=runs)
+
+    print(f"  {'Module':<32} {'Import (ms)':>12} {'Budget':>8}")
+    print("  " + "-" * 56)
+    for module, r in report.items():
+        status = "✅" if r["passed"] else "❌"
+        shown = f"{r['time_ms']:.1f}" if r["time_ms"] == r["time_ms"] else "failed"
+        print(f"  {module:<32} {shown:>12} {r['budget_ms']:>8.0f}  {status}")
+    failed = [m for m, r in report.items() if not r["passed"]]
+    print(f"\n  {len(report) - len(failed)}/{len(report)} modules within budget "
+          f"(minimum of {runs} imports each)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+GENESIS: TIME-INTEGRATED NORTON CREEP ENGINE FOR LITHIUM
+================================================================================
+
+Figure 2 (lithium_creep_rate.png) plots the room-temperature creep rate
+A·σⁿ only. This engine evaluates lithium creep over whole operating
+envelopes: pressure × temperature × time grids in one broadcast call.
+
+PHYSICS:
+    1. Norton power law with an Arrhenius term:
+       ε̇(σ, T) = A × σⁿ × exp(-Q/R × (1/T - 1/T_ref))
+       A is the room-temperature (T_ref = 300 K) rate constant of the
+       figure band, so at 300 K the engine reproduces Figure 2 exactly;
+       Q ≈ 50 kJ/mol sets how fast creep rises with temperature.
+
+    2. Constant stack pressure (load control):
+       ε(t) = ε̇(P, T) × t
+
+    3. Stress relaxation under constant displacement (clamped stack):
+       dσ/dt = -E × ε̇(σ, T),  σ(0) = P
+       At constant T this ODE has a closed-form solution at every grid
+       point,
+       σ(t) = [P^(1-n) + (n - 1) × E × k(T) × t]^(-1/(n-1)),  k = A·exp(...)
+       (σ(t) = P·exp(-E k t) for n = 1), so the whole grid is solved
+       exactly in one vectorized expression, with no time stepping.
+
+    4. Lithium infiltration (upper bound):
+       Lithium squeezed out of a layer of thickness h by true strain ε,
+       δ = h × (1 - exp(-ε)), is available to fill micro-cracks.
+
+PARAMETER BANDS:
+    NORTON_LOW, NORTON_MID and NORTON_HIGH are the lower edge, geometric
+    mean and upper edge of the Figure 2 band (figure_registry constants).
+
+REFERENCES:
+    [1] LePage, W.S. et al. (2019). J. Electrochem. Soc. 166, A89.
+    [2] Masias, A. et al. (2019). J. Mater. Sci. 54, 2585.
+
+Author: Nicholas Harris, Genesis Platform Inc.
+Date: February 2026
+License: Proprietary - All Rights Reserved
+================================================================================
+"""
+
+import numpy as np
+import json
+import os
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Dict
+
+from figure_registry import NORTON_A_HIGH, NORTON_A_LOW, NORTON_N_HIGH, NORTON_N_LOW
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+GAS_CONSTANT = 8.314             # J/(mol·K)
+ROOM_TEMPERATURE_K = 300.0       # Temperature at which A is calibrated
+LI_ACTIVATION_ENERGY_J_MOL = 50e3
+LI_YOUNGS_MODULUS_MPA = 4.9e3    # Polycrystalline lithium
+LI_LAYER_THICKNESS_UM = 20.0     # Lithium anode layer
+
+
+@dataclass
+class NortonLaw:
+    """Norton power-law creep parameters (stress in MPa, rate in 1/s)."""
+    A: float                                   # 1/(s·MPaⁿ) at T_ref_K
+    n: float
+    Q_J_mol: float = LI_ACTIVATION_ENERGY_J_MOL
+    T_ref_K: float = ROOM_TEMPERATURE_K
+
+    def rate_constant(self, temperature_K) -> np.ndarray:
+        """k(T) = A × exp(-Q/R × (1/T - 1/T_ref)), so that ε̇ = k σⁿ."""
+        T = np.asarray(temperature_K, dtype=float)
+        return self.A * np.exp(-self.Q_J_mol / GAS_CONSTANT * (1.0 / T - 1.0 / self.T_ref_K))
+
+    def strain_rate(self, stress_MPa, temperature_K=ROOM_TEMPERATURE_K) -> np.ndarray:
+        """ε̇ (1/s); stress and temperature broadcast against each other."""
+        return self.rate_constant(temperature_K) * np.power(np.asarray(stress_MPa, dtype=float), self.n)
+
+
+NORTON_LOW = NortonLaw(NORTON_A_LOW, NORTON_N_LOW)
+NORTON_HIGH = NortonLaw(NORTON_A_HIGH, NORTON_N_HIGH)
+# Geometric mean of the band edges is itself a Norton law
+NORTON_MID = NortonLaw(float(np.sqrt(NORTON_A_LOW * NORTON_A_HIGH)), (NORTON_N_LOW + NORTON_N_HIGH) / 2)
+
+
+# =============================================================================
+# ENGINE
+# =============================================================================
+
+def _grid(pressure_MPa, temperature_K, time_s):
+    """Axes reshaped to broadcast as (pressure, temperature, time)."""
+    P = np.asarray(pressure_MPa, dtype=float).reshape(-1, 1, 1)
+    T = np.asarray(temperature_K, dtype=float).reshape(1, -1, 1)
+    t = np.asarray(time_s, dtype=float).reshape(1, 1, -1)
+    return P, T, t
+
+
+def creep_strain(pressure_MPa, temperature_K, time_s, law: NortonLaw = NORTON_MID) -> np.ndarray:
+    """Creep strain under constant pressure, shape (pressure, temperature, time)."""
+    P, T, t = _grid(pressure_MPa, temperature_K, time_s)
+    return law.strain_rate(P, T) * t
+
+
+def relaxed_stress(
+    pressure_MPa,
+    temperature_K,
+    time_s,
+    law: NortonLaw = NORTON_MID,
+    modulus_MPa: float = LI_YOUNGS_MODULUS_MPA
+) -> np.ndarray:
+    """
+    Stress (MPa) under constant displacement, starting from the stack pressure.
+
+    Solves dσ/dt = -E k(T) σⁿ exactly at every (pressure, temperature, time)
+    point; shape (pressure, temperature, time).
+    """
+    P, T, t = _grid(pressure_MPa, temperature_K, time_s)
+    decay = modulus_MPa * law.rate_constant(T) * t
+    if law.n == 1:
+        return P * np.exp(-decay)
+    with np.errstate(divide='ignore'):
+        # P = 0 gives P^(1-n) = inf and σ = 0, as it should
+        return np.power(np.power(P, 1 - law.n) + (law.n - 1) * decay, -1 / (law.n - 1))
+
+
+def infiltration_depth_um(strain: np.ndarray, layer_um: float = LI_LAYER_THICKNESS_UM) -> np.ndarray:
+    """Lithium squeezed out of a layer of thickness layer_um by true strain."""
+    return layer_um * -np.expm1(-np.asarray(strain, dtype=float))
+
+
+def run_creep_envelope(
+    pressure_MPa,
+    temperature_K,
+    time_s,
+    law: NortonLaw = NORTON_MID,
+    modulus_MPa: float = LI_YOUNGS_MODULUS_MPA,
+    layer_um: float = LI_LAYER_THICKNESS_UM
+) -> Dict:
+    """
+    Creep over a full pressure × temperature × time envelope.
+
+    Parameters:
+        pressure_MPa: Stack pressures
+        temperature_K: Temperatures
+        time_s: Hold times
+        law: Norton parameters (default: middle of the Figure 2 band)
+        modulus_MPa: Stiffness resisting creep under constant displacement
+        layer_um: Lithium layer thickness for the infiltration estimate
+
+    Returns:
+        Dict of arrays; rate is (pressure, temperature), the rest
+        (pressure, temperature, time):
+        strain_rate, creep_strain, infiltration_um (constant pressure),
+        relaxed_stress_MPa, relaxation_strain, relaxation_infiltration_um
+        (constant displacement)
+    """
+    P, T, _ = _grid(pressure_MPa, temperature_K, time_s)
+    strain = creep_strain(pressure_MPa, temperature_K, time_s, law)
+    stress = relaxed_stress(pressure_MPa, temperature_K, time_s, law, modulus_MPa)
+    # Under fixed displacement, creep strain is the elastic strain given up
+    relaxation_strain = (P - stress) / modulus_MPa
+
+    return {
+        "pressure_MPa": P.ravel(),
+        "temperature_K": T.ravel(),
+        "time_s": np.asarray(time_s, dtype=float).ravel(),
+        "strain_rate": law.strain_rate(P[:, :, 0], T[:, :, 0]),
+        "creep_strain": strain,
+        "infiltration_um": infiltration_depth_um(strain, layer_um),
+        "relaxed_stress_MPa": stress,
+        "relaxation_strain": relaxation_strain,
+        "relaxation_infiltration_um": infiltration_depth_um(relaxation_strain, layer_um),
+        "law": asdict(law),
+        "modulus_MPa": modulus_MPa,
+        "layer_um": layer_um,
+    }
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def main():
+    """Map the operating envelope (0.1-300 MPa, -20 to 80 °C, 1 s to 1000 h)."""
+    import time
+
+    print("\n" + "█" * 70)
+    print("  GENESIS: NORTON CREEP ENGINE (LITHIUM)")
+    print("█" * 70)
+    print(f"  Timestamp: {datetime.now().isoformat()}")
+
+    output_dir = os.path.join(os.path.dirname(__file__), "outputs", "norton_creep")
+    os.makedirs(output_dir, exist_ok=True)
+
+    pressure = np.logspace(-1, np.log10(300), 200)
+    temperature = np.linspace(253.15, 353.15, 101)
+    hold = np.logspace(0, np.log10(1000 * 3600), 120)
+
+    bands = {"low": NORTON_LOW, "mid": NORTON_MID, "high": NORTON_HIGH}
+    start = time.perf_counter()
+    envelopes = {name: run_creep_envelope(pressure, temperature, hold, law)
+                 for name, law in bands.items()}
+    elapsed = time.perf_counter() - start
+
+    n_points = len(pressure) * len(temperature) * len(hold)
+    print(f"  Grid:        {len(pressure)} pressures × {len(temperature)} temperatures × "
+          f"{len(hold)} times × {len(bands)} bands ({n_points * len(bands):,} points), {elapsed:.2f} s")
+
+    # 1-hour hold at 25 °C and 60 °C: pressure / Genesis contrast
+    i_hour = int(np.argmin(np.abs(hold - 3600)))
+    mid = envelopes["mid"]
+    print(f"\n  Lithium infiltration after {hold[i_hour] / 3600:.2f} h (mid band, "
+          f"{LI_LAYER_THICKNESS_UM:.0f} μm layer):")
+    print(f"  {'Pressure':<12} {'T (°C)':>8} {'Constant P (μm)':>17} {'Clamped (μm)':>14}")
+    for p_target in (0.5, 10.0, 25.0, 100.0):
+        i_p = int(np.argmin(np.abs(pressure - p_target)))
+        for T_c in (25.0, 60.0):
+            i_T = int(np.argmin(np.abs(temperature - (T_c + 273.15))))
+            print(f"  {pressure[i_p]:<8.1f} MPa {temperature[i_T] - 273.15:>8.1f} "
+                  f"{mid['infiltration_um'][i_p, i_T, i_hour]:>17.3g} "
+                  f"{mid['relaxation_infiltration_um'][i_p, i_T, i_hour]:>14.3g}")
+
+    envelope_path = os.path.join(output_dir, "creep_envelope.npz")
+    np.savez(envelope_path, pressure_MPa=pressure, temperature_K=temperature, time_s=hold,
+             **{f"{name}_{key}": env[key] for name, env in envelopes.items()
+                for key in ("strain_rate", "infiltration_um", "relaxed_stress_MPa",
+                            "relaxation_infiltration_um")})
+    print(f"\n  Envelope saved: {envelope_path}")
+
+    meta_path = os.path.join(output_dir, "creep_envelope.json")
+    with open(meta_path, 'w') as f:
+        json.dump({
+            "simulation_id": "GENESIS-CREEP-NORTON-V1",
+            "date": datetime.now().isoformat(),
+            "method": "Norton power law + Arrhenius; closed-form relaxation under fixed displacement",
+            "axes": ["pressure_MPa", "temperature_K", "time_s"],
+            "laws": {name: asdict(law) for name, law in bands.items()},
+            "modulus_MPa": LI_YOUNGS_MODULUS_MPA,
+            "layer_um": LI_LAYER_THICKNESS_UM,
+            "runtime_s": round(elapsed, 3),
+        }, f, indent=2)
+    print(f"  Metadata saved: {meta_path}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
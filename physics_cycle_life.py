@@ -26,6 +26,11 @@ PHYSICS:
     KEY INSIGHT: The Genesis architecture reduces ALL three degradation rates
     through measurable physics, not arbitrary parameter tuning.
 
+USAGE:
+    python physics_cycle_life.py                  (model, plot data, plot)
+    python physics_cycle_life.py --render-only    (replot from saved .npz)
+    Either form takes --profile NAME (figure_registry render profile)
+
 REFERENCES:
     [1] Pinson, M.B. & Bazant, M.Z. (2013). J. Electrochem. Soc. 160, A243.
     [2] Paris, P. & Erdogan, F. (1963). J. Basic Engineering, 85, 528.
@@ -40,8 +45,9 @@ Patent Reference: Provisional 6, Claims 18-24
 import numpy as np
 import json
 import os
+import sys
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
 from dataclasses import dataclass, asdict
 
 # =============================================================================
@@ -53,6 +59,12 @@ K_B_J = 1.381e-23       # Boltzmann constant (J/K)
 FARADAY = 96485.0        # Faraday constant (C/mol)
 R_GAS = 8.314            # Gas constant (J/mol·K)
 
+# Capacity lost per unit of each degradation mechanism
+SEI_LOSS_PER_NM = 0.0002         # ~0.02% per nm of SEI (Pinson & Bazant scaling)
+FATIGUE_LOSS_AT_FAILURE = 0.3    # 30% capacity loss at full damage
+DENDRITE_LOSS_PER_EVENT = 0.02   # 2% per event
+END_OF_LIFE_CAPACITY = 0.70      # Simulation stops below this
+
 # =============================================================================
 # ARCHITECTURE PROPERTIES
 # =============================================================================
@@ -306,18 +318,27 @@ def run_cycle_life(
     n_cycles: int = 2000,
     T_celsius: float = 25.0,
     C_rate: float = 0.33,
-    DoD: float = 0.80
+    DoD: float = 0.80,
+    rng: np.random.RandomState = None,
+    verbose: bool = True
 ) -> Dict:
     """
     Run complete cycle life simulation for an architecture.
 
+    Parameters:
+        rng: Random state for dendrite nucleation (default: the global
+            np.random state); pass one for reproducible, thread-safe runs
+        verbose: Print progress
+
     Returns capacity retention history and degradation breakdown.
     """
-    print(f"\n  Running: {architecture.name}")
-    print(f"  C-rate: C/{1/C_rate:.0f}, DoD: {DoD:.0%}, T: {T_celsius}°C")
-    print(f"  K_constraint: {architecture.K_constraint_GPa:.1f} GPa")
-    print(f"  Cycling stress: {architecture.cycling_stress_amplitude_MPa():.1f} MPa")
-    print(f"  Dendrite barrier: {architecture.dendrite_barrier_MPa():.1f} MPa")
+    random = rng.random_sample if rng is not None else np.random.random
+    if verbose:
+        print(f"\n  Running: {architecture.name}")
+        print(f"  C-rate: C/{1/C_rate:.0f}, DoD: {DoD:.0%}, T: {T_celsius}°C")
+        print(f"  K_constraint: {architecture.K_constraint_GPa:.1f} GPa")
+        print(f"  Cycling stress: {architecture.cycling_stress_amplitude_MPa():.1f} MPa")
+        print(f"  Dendrite barrier: {architecture.dendrite_barrier_MPa():.1f} MPa")
 
     history = []
     dendrite_events = 0
@@ -326,18 +347,17 @@ def run_cycle_life(
     for n in range(n_cycles):
         # 1. SEI growth (capacity loss from Li inventory consumption)
         sei_nm = sei_growth_per_cycle(architecture, n, T_celsius, C_rate)
-        # Capacity loss: ~0.02% per nm of SEI (Pinson & Bazant scaling)
-        cap_loss_sei = 0.0002 * sei_nm
+        cap_loss_sei = SEI_LOSS_PER_NM * sei_nm
 
         # 2. Fatigue damage (capacity loss from crack-induced isolation)
         fatigue = fatigue_damage_per_cycle(architecture, n, T_celsius, DoD)
-        cap_loss_fatigue = 0.3 * fatigue  # 30% capacity loss at full damage
+        cap_loss_fatigue = FATIGUE_LOSS_AT_FAILURE * fatigue
 
         # 3. Dendrite nucleation (stochastic capacity loss)
         p_dendrite = dendrite_nucleation_probability(architecture, T_celsius)
-        if np.random.random() < p_dendrite:
+        if random() < p_dendrite:
             dendrite_events += 1
-        cap_loss_dendrite = 0.02 * dendrite_events  # 2% per event
+        cap_loss_dendrite = DENDRITE_LOSS_PER_EVENT * dendrite_events
 
         # Total capacity
         capacity = 1.0 - cap_loss_sei - cap_loss_fatigue - cap_loss_dendrite
@@ -357,8 +377,9 @@ def run_cycle_life(
             })
 
         # End of life check
-        if capacity < 0.70:
-            print(f"  End of life at cycle {n} ({capacity:.1%})")
+        if capacity < END_OF_LIFE_CAPACITY:
+            if verbose:
+                print(f"  End of life at cycle {n} ({capacity:.1%})")
             break
 
     # Find cycle at 80% retention
@@ -388,9 +409,10 @@ def run_cycle_life(
         }
     }
 
-    print(f"  Final: {capacity:.1%} after {n+1} cycles")
-    print(f"  Cycles to 80%: {cycles_to_80}")
-    print(f"  Dendrite events: {dendrite_events}")
+    if verbose:
+        print(f"  Final: {capacity:.1%} after {n+1} cycles")
+        print(f"  Cycles to 80%: {cycles_to_80}")
+        print(f"  Dendrite events: {dendrite_events}")
 
     return final
 
@@ -421,6 +443,100 @@ def generate_cycle_life_csv(genesis_result: Dict, output_path: str):
     print(f"  CSV saved: {output_path}")
 
 
+# =============================================================================
+# PLOTTING
+# =============================================================================
+
+# Plot data is written next to the figure, so it can be restyled with
+# --render-only without rerunning the model
+PLOT_DATA_FILE = "cycle_life_plot_data.npz"
+PLOT_FILE = "cycle_life_physics.png"
+
+def save_plot_data(genesis_result: Dict, baseline_result: Dict, output_path: str):
+    """
+    Save the arrays behind cycle_life_physics.png as .npz.
+
+    Histories are stored in full; decimation is part of rendering.
+    """
+    def column(result, key, scale=1.0):
+        return np.array([h[key] * scale for h in result["history"]], dtype=float)
+
+    np.savez(
+        output_path,
+        genesis_cycles=column(genesis_result, "cycle"),
+        genesis_capacity_pct=column(genesis_result, "capacity_retention", 100),
+        genesis_loss_sei_pct=column(genesis_result, "cap_loss_sei_pct"),
+        genesis_loss_fatigue_pct=column(genesis_result, "cap_loss_fatigue_pct"),
+        genesis_loss_dendrite_pct=column(genesis_result, "cap_loss_dendrite_pct"),
+        genesis_K_GPa=genesis_result["K_constraint_GPa"],
+        baseline_cycles=column(baseline_result, "cycle"),
+        baseline_capacity_pct=column(baseline_result, "capacity_retention", 100),
+        baseline_K_GPa=baseline_result["K_constraint_GPa"],
+    )
+    print(f"  Plot data: {output_path}")
+
+
+def plot_cycle_life(data_path: str, output_path: str, profile: Optional[str] = None):
+    """
+    Render cycle_life_physics.png from save_plot_data() output.
+
+    profile is a figure_registry render profile (default: the active one).
+    """
+    try:
+        import matplotlib.pyplot as plt
+        from figure_registry import get_render_profile, save_figure
+        from series_decimation import decimate
+    except ImportError:
+        print("  [Warning] matplotlib not available")
+        return
+
+    with np.load(data_path) as d:
+        data = dict(d)
+
+    profile = get_render_profile(profile)
+    with plt.rc_context({'font.family': 'serif', 'font.size': 12, 'figure.dpi': 300}), \
+            plt.rc_context(profile.rc):
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+
+        # Left: Capacity vs Cycle
+        # Long histories: shape-preserving subsets that keep the 80% crossing and
+        # the final (end-of-life) point; no-op below the decimation threshold
+        gen_cycles, gen_cap = decimate(data["genesis_cycles"], data["genesis_capacity_pct"],
+                                       thresholds=(80,))
+        base_cycles, base_cap = decimate(data["baseline_cycles"], data["baseline_capacity_pct"],
+                                         thresholds=(80,))
+
+        ax1.plot(gen_cycles, gen_cap, 'o-', color='#2E7D32', linewidth=2, markersize=4,
+                 label=f'Genesis (K={float(data["genesis_K_GPa"])} GPa)')
+        ax1.plot(base_cycles, base_cap, 's-', color='#D32F2F', linewidth=2, markersize=4,
+                 label=f'Baseline (K={float(data["baseline_K_GPa"])} GPa)')
+        ax1.axhline(80, color='#FF9800', linestyle=':', linewidth=2, label='80% EOL Threshold')
+        ax1.set_xlabel('Cycle Number', fontweight='bold')
+        ax1.set_ylabel('Capacity Retention (%)', fontweight='bold')
+        ax1.set_title('Physics-Based Cycle Life\n(Derived from Architecture)', fontweight='bold')
+        ax1.legend(loc='lower left')
+        ax1.set_ylim(50, 102)
+        ax1.grid(True, alpha=0.3)
+
+        # Right: Degradation breakdown for Genesis
+        gen_cycles, gen_sei, gen_fat, gen_den = decimate(
+            data["genesis_cycles"], data["genesis_loss_sei_pct"],
+            data["genesis_loss_fatigue_pct"], data["genesis_loss_dendrite_pct"])
+        ax2.stackplot(gen_cycles, gen_sei, gen_fat, gen_den,
+                      labels=['SEI Growth', 'Fatigue', 'Dendrites'],
+                      colors=['#FFC107', '#FF5722', '#9C27B0'], alpha=0.8)
+        ax2.set_xlabel('Cycle Number', fontweight='bold')
+        ax2.set_ylabel('Cumulative Capacity Loss (%)', fontweight='bold')
+        ax2.set_title('Genesis Degradation Breakdown\n(Physics-Based)', fontweight='bold')
+        ax2.legend(loc='upper left')
+        ax2.grid(True, alpha=0.3)
+
+        paths = save_figure(fig, output_path, profile.name)
+        plt.close(fig)
+    for path in paths:
+        print(f"  Plot: {path}")
+
+
 # =============================================================================
 # MAIN
 # =============================================================================
@@ -475,54 +591,19 @@ def main():
     csv_path = os.path.join(output_dir, "genesis_cycle_life_physics.csv")
     generate_cycle_life_csv(genesis_result, csv_path)
 
-    # Generate plot
-    try:
-        import matplotlib.pyplot as plt
-
-        plt.rcParams.update({'font.family': 'serif', 'font.size': 12, 'figure.dpi': 300})
-
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
-
-        # Left: Capacity vs Cycle
-        gen_cycles = [h["cycle"] for h in genesis_result["history"]]
-        gen_cap = [h["capacity_retention"] * 100 for h in genesis_result["history"]]
-        base_cycles = [h["cycle"] for h in baseline_result["history"]]
-        base_cap = [h["capacity_retention"] * 100 for h in baseline_result["history"]]
-
-        ax1.plot(gen_cycles, gen_cap, 'o-', color='#2E7D32', linewidth=2, markersize=4,
-                 label=f'Genesis (K={GENESIS.K_constraint_GPa} GPa)')
-        ax1.plot(base_cycles, base_cap, 's-', color='#D32F2F', linewidth=2, markersize=4,
-                 label=f'Baseline (K={BASELINE.K_constraint_GPa} GPa)')
-        ax1.axhline(80, color='#FF9800', linestyle=':', linewidth=2, label='80% EOL Threshold')
-        ax1.set_xlabel('Cycle Number', fontweight='bold')
-        ax1.set_ylabel('Capacity Retention (%)', fontweight='bold')
-        ax1.set_title('Physics-Based Cycle Life\n(Derived from Architecture)', fontweight='bold')
-        ax1.legend(loc='lower left')
-        ax1.set_ylim(50, 102)
-        ax1.grid(True, alpha=0.3)
-
-        # Right: Degradation breakdown for Genesis
-        gen_sei = [h["cap_loss_sei_pct"] for h in genesis_result["history"]]
-        gen_fat = [h["cap_loss_fatigue_pct"] for h in genesis_result["history"]]
-        gen_den = [h["cap_loss_dendrite_pct"] for h in genesis_result["history"]]
-
-        ax2.stackplot(gen_cycles, gen_sei, gen_fat, gen_den,
-                      labels=['SEI Growth', 'Fatigue', 'Dendrites'],
-                      colors=['#FFC107', '#FF5722', '#9C27B0'], alpha=0.8)
-        ax2.set_xlabel('Cycle Number', fontweight='bold')
-        ax2.set_ylabel('Cumulative Capacity Loss (%)', fontweight='bold')
-        ax2.set_title('Genesis Degradation Breakdown\n(Physics-Based)', fontweight='bold')
-        ax2.legend(loc='upper left')
-        ax2.grid(True, alpha=0.3)
-
-        plt.tight_layout()
-        plot_path = os.path.join(output_dir, "cycle_life_physics.png")
-        plt.savefig(plot_path)
-        plt.close()
-        print(f"  Plot: {plot_path}")
-    except ImportError:
-        print("  [Warning] matplotlib not available")
+    # Plot data (binary), then render from it
+    data_path = os.path.join(output_dir, PLOT_DATA_FILE)
+    save_plot_data(genesis_result, baseline_result, data_path)
+    plot_cycle_life(data_path, os.path.join(output_dir, PLOT_FILE))
 
 
 if __name__ == "__main__":
-    main()
+    if "--profile" in sys.argv:
+        from figure_registry import set_render_profile
+        set_render_profile(sys.argv[sys.argv.index("--profile") + 1])
+    if "--render-only" in sys.argv:
+        # Restyle from the saved plot data; the model is not rerun
+        out = os.path.join(os.path.dirname(__file__), "outputs", "cycle_life_physics")
+        plot_cycle_life(os.path.join(out, PLOT_DATA_FILE), os.path.join(out, PLOT_FILE))
+    else:
+        main()
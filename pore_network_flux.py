@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+GENESIS: MEMBRANE-SCALE PORE-NETWORK FLUX SOLVER FOR THE QUANTUM SIEVE
+================================================================================
+
+born_solvation_quantum_sieve.py predicts the dehydration barrier of a single
+pore. A separator is a connected network of millions of pores with scattered
+throat diameters; this script turns the per-pore barriers into a predicted
+membrane flux and selectivity.
+
+PHYSICS:
+    Each throat t (diameter d_t, length L_t) is an Arrhenius conductance for
+    species s:
+
+        g_t,s = (d_t / d_ref)² / (L_t / L_ref) × exp(-ΔH_s(d_t) / RT)
+
+    with ΔH_s from the Born solvation sieve model (g = 0 when the throat is
+    sterically blocked). Steady-state transport obeys Kirchhoff's law at every
+    pore body i:
+
+        Σ_j g_ij (c_j - c_i) = 0
+
+    with c = 1 on the inlet face and c = 0 on the outlet face. The resulting
+    sparse graph Laplacian is symmetric positive definite on the free nodes
+    and is solved with scipy.sparse: SuperLU for small networks and
+    Jacobi-preconditioned conjugate gradients for 10⁶-10⁷ throats.
+
+    Membrane flux is evaluated from the dissipation, J = Σ_t g_t (Δc_t)²,
+    which equals the inlet-to-outlet flow for a unit concentration drop and
+    is stationary at the solution, so its error is quadratic in the solver
+    residual. Selectivity is the flux ratio, reported as log10 like the rest
+    of the sieve engine.
+
+NETWORKS:
+    - random_lattice_network: cubic lattice with optional throat dilution and
+      log-normal throat diameters
+    - load_network: imported networks (.npz with conns, throat_diameter_nm,
+      inlet_nodes, outlet_nodes and optional throat_length_nm)
+
+Author: Nicholas Harris, Genesis Platform Inc.
+Date: February 2026
+Patent Reference: Provisional 6, Claims 12-17
+================================================================================
+"""
+
+import numpy as np
+import inspect
+import warnings
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional
+
+from born_solvation_quantum_sieve import (
+    K_B, N_A,
+    dehydration_enthalpy_array,
+    species_library_from_dict,
+)
+
+# =============================================================================
+# SOLVER CONFIGURATION
+# =============================================================================
+
+DIRECT_SOLVER_MAX_UNKNOWNS = 20_000    # Above this, use iterative CG
+CG_RTOL = 1e-6                         # Flux error is ~ rtol² (see above)
+CG_MAX_ITER = 20_000
+CG_FALLBACK_MAX_UNKNOWNS = 1_000_000   # Unconverged CG falls back to SuperLU up to this size
+
+D_REF_NM = 0.70                        # Reference throat diameter for g
+
+
+# =============================================================================
+# NETWORK DEFINITION
+# =============================================================================
+
+@dataclass
+class PoreNetwork:
+    """Pore bodies (nodes) connected by throats (edges)."""
+    n_nodes: int
+    conns: np.ndarray                 # (T, 2) node indices per throat
+    throat_diameter_nm: np.ndarray    # (T,)
+    inlet_nodes: np.ndarray           # Node indices held at c = 1
+    outlet_nodes: np.ndarray          # Node indices held at c = 0
+    throat_length_nm: Optional[np.ndarray] = None  # (T,), default: unit length
+
+    @property
+    def n_throats(self) -> int:
+        return len(self.conns)
+
+
+def random_lattice_network(
+    shape=(50, 50, 50),
+    median_diameter_nm: float = 0.70,
+    sigma_log: float = 0.10,
+    coordination_keep: float = 1.0,
+    seed: int = 42
+) -> PoreNetwork:
+    """
+    Cubic-lattice pore network with random throat diameters.
+
+    Transport runs along the first axis: the x = 0 face is the inlet and
+    the x = nx-1 face the outlet.
+
+    Parameters:
+        shape: Lattice dimensions (nx, ny, nz)
+        median_diameter_nm: Median throat diameter
+        sigma_log: Log-normal spread of throat diameters
+        coordination_keep: Fraction of lattice throats kept (random dilution)
+        seed: RNG seed for reproducibility
+    """
+    rng = np.random.default_rng(seed)
+    nx, ny, nz = shape
+    index = np.arange(nx * ny * nz).reshape(shape)
+
+    conns = np.concatenate([
+        np.stack([index[:-1, :, :].ravel(), index[1:, :, :].ravel()], axis=1),
+        np.stack([index[:, :-1, :].ravel(), index[:, 1:, :].ravel()], axis=1),
+        np.stack([index[:, :, :-1].ravel(), index[:, :, 1:].ravel()], axis=1),
+    ])
+    if coordination_keep < 1.0:
+        conns = conns[rng.random(len(conns)) < coordination_keep]
+
+    diameters = median_diameter_nm * np.exp(sigma_log * rng.standard_normal(len(conns)))
+
+    return PoreNetwork(
+        n_nodes=nx * ny * nz,
+        conns=conns,
+        throat_diameter_nm=diameters,
+        inlet_nodes=index[0].ravel(),
+        outlet_nodes=index[-1].ravel(),
+    )
+
+
+def load_network(filepath: str) -> PoreNetwork:
+    """Load an imported pore network from .npz."""
+    data = np.load(filepath)
+    conns = data["conns"]
+    return PoreNetwork(
+        n_nodes=int(data["n_nodes"]) if "n_nodes" in data else int(conns.max()) + 1,
+        conns=conns,
+        throat_diameter_nm=data["throat_diameter_nm"],
+        inlet_nodes=data["inlet_nodes"],
+        outlet_nodes=data["outlet_nodes"],
+        throat_length_nm=data["throat_length_nm"] if "throat_length_nm" in data else None,
+    )
+
+
+# =============================================================================
+# CONDUCTANCES
+# =============================================================================
+
+def throat_conductance(
+    network: PoreNetwork,
+    bare_radius_nm: float,
+    solvated_radius_nm: float,
+    charge: int,
+    temperature_K: float = 300.0,
+    epsilon_bulk: float = 30.0,
+    **confinement
+) -> np.ndarray:
+    """
+    Arrhenius conductance of every throat for one species.
+
+    Returns:
+        Conductance per throat, shape (T,); zero where sterically blocked
+    """
+    RT = K_B * temperature_K * N_A / 1000  # kJ/mol
+    d = network.throat_diameter_nm
+
+    barrier = dehydration_enthalpy_array(d, bare_radius_nm, solvated_radius_nm, charge,
+                                         epsilon_bulk, **confinement)
+    g = (d / D_REF_NM)**2 * np.exp(-barrier / RT)
+    if network.throat_length_nm is not None:
+        g = g / (network.throat_length_nm / np.median(network.throat_length_nm))
+    return g
+
+
+# =============================================================================
+# STEADY-STATE SOLVER
+# =============================================================================
+
+def _cg_kwargs(rtol: float) -> Dict:
+    """Tolerance keyword for scipy's cg (renamed tol → rtol in SciPy 1.12)."""
+    from scipy.sparse.linalg import cg
+    if "rtol" in inspect.signature(cg).parameters:
+        return {"rtol": rtol, "atol": 0.0}
+    return {"tol": rtol, "atol": 0.0}
+
+
+def solve_network_flux(network: PoreNetwork, conductance: np.ndarray) -> Dict:
+    """
+    Solve Kirchhoff's law on the network for one set of conductances.
+
+    Only nodes in a conducting cluster that touches both faces carry flux;
+    everything else is dropped before assembly so the system stays
+    nonsingular even when many throats are blocked.
+
+    If CG does not converge, the system is re-solved with SuperLU (up to
+    CG_FALLBACK_MAX_UNKNOWNS unknowns, with a warning); beyond that a
+    RuntimeError is raised rather than returning an unconverged flux.
+
+    Returns:
+        Dict with flux (for a unit concentration drop), method, n_unknowns,
+        iterations, converged, residual (relative, ||b - Ax|| / ||b||) and
+        the node concentration field
+    """
+    import scipy.sparse as sp
+    from scipy.sparse.csgraph import connected_components
+    from scipy.sparse.linalg import cg, spsolve
+
+    n = network.n_nodes
+    a, b = network.conns[:, 0], network.conns[:, 1]
+    open_t = conductance > 0
+    a_o, b_o, g_o = a[open_t], b[open_t], conductance[open_t]
+
+    # Conducting clusters that span inlet → outlet
+    adjacency = sp.coo_matrix((np.ones(len(a_o)), (a_o, b_o)), shape=(n, n)).tocsr()
+    _, labels = connected_components(adjacency, directed=False)
+    spanning = np.intersect1d(labels[network.inlet_nodes], labels[network.outlet_nodes])
+    active = np.isin(labels, spanning)
+
+    concentration = np.zeros(n)
+    if not active.any():
+        return {"flux": 0.0, "method": "none", "n_unknowns": 0, "iterations": 0,
+                "converged": True, "residual": 0.0, "concentration": concentration}
+
+    fixed = np.zeros(n, dtype=bool)
+    fixed[network.inlet_nodes] = True
+    fixed[network.outlet_nodes] = True
+    concentration[network.inlet_nodes] = 1.0
+
+    free = active & ~fixed
+    free_index = np.full(n, -1)
+    free_index[free] = np.arange(free.sum())
+    n_free = int(free.sum())
+
+    # Keep throats inside the spanning clusters
+    keep = active[a_o] & active[b_o]
+    a_o, b_o, g_o = a_o[keep], b_o[keep], g_o[keep]
+
+    method, iterations, converged, residual = "none", 0, True, 0.0
+    if n_free > 0:
+        ia, ib = free_index[a_o], free_index[b_o]
+        fa, fb = ia >= 0, ib >= 0
+
+        diag = np.bincount(ia[fa], g_o[fa], n_free) + np.bincount(ib[fb], g_o[fb], n_free)
+        both = fa & fb
+        rows = np.concatenate([ia[both], ib[both], np.arange(n_free)])
+        cols = np.concatenate([ib[both], ia[both], np.arange(n_free)])
+        vals = np.concatenate([-g_o[both], -g_o[both], diag])
+        A = sp.csr_matrix((vals, (rows, cols)), shape=(n_free, n_free))
+
+        # Boundary contributions g × c_fixed
+        rhs = (np.bincount(ia[fa & ~fb], g_o[fa & ~fb] * concentration[b_o[fa & ~fb]], n_free)
+               + np.bincount(ib[fb & ~fa], g_o[fb & ~fa] * concentration[a_o[fb & ~fa]], n_free))
+
+        if n_free <= DIRECT_SOLVER_MAX_UNKNOWNS:
+            c_free = spsolve(A.tocsc(), rhs)
+            method = "direct (SuperLU)"
+        else:
+            counter = {"n": 0}
+
+            def _count(_):
+                counter["n"] += 1
+
+            jacobi = sp.diags(1.0 / diag)
+            c_free, info = cg(A, rhs, M=jacobi, maxiter=CG_MAX_ITER,
+                              callback=_count, **_cg_kwargs(CG_RTOL))
+            method, iterations = "CG (Jacobi)", counter["n"]
+            if info != 0:
+                if n_free > CG_FALLBACK_MAX_UNKNOWNS:
+                    raise RuntimeError(f"CG did not converge in {iterations} iterations "
+                                       f"({n_free:,} unknowns, too many for SuperLU)")
+                warnings.warn(f"CG did not converge in {iterations} iterations; "
+                              f"re-solving {n_free:,} unknowns with SuperLU", RuntimeWarning)
+                c_free = spsolve(A.tocsc(), rhs)
+                method = "CG → direct (SuperLU)"
+
+        residual = float(np.linalg.norm(rhs - A @ c_free) / max(np.linalg.norm(rhs), np.finfo(float).tiny))
+        converged = bool(np.isfinite(residual) and residual <= CG_RTOL)
+        concentration[free] = c_free
+
+    # Dissipation = inlet-to-outlet flow for a unit concentration drop
+    flux = float(np.sum(g_o * (concentration[a_o] - concentration[b_o])**2))
+
+    return {"flux": flux, "method": method, "n_unknowns": n_free, "iterations": iterations,
+            "converged": converged, "residual": residual, "concentration": concentration}
+
+
+def membrane_flux(
+    network: PoreNetwork,
+    library: np.ndarray = None,
+    reference: str = "Li+",
+    temperature_K: float = 300.0,
+    epsilon_bulk: float = 30.0,
+    **confinement
+) -> Dict:
+    """
+    Steady-state membrane flux for every species and selectivity vs reference.
+
+    Returns:
+        Dict with species keys, flux (S,), log10_flux (S,),
+        log10_selectivity (S,) of the reference over each species, and
+        per-species solver info
+    """
+    if library is None:
+        library = species_library_from_dict()
+
+    fluxes = np.zeros(len(library))
+    solver_info = []
+    for i, ion in enumerate(library):
+        g = throat_conductance(network, ion["bare_radius_nm"], ion["solvated_radius_nm"],
+                               ion["charge"], temperature_K, epsilon_bulk, **confinement)
+        solution = solve_network_flux(network, g)
+        fluxes[i] = solution["flux"]
+        solver_info.append({k: solution[k] for k in ("method", "n_unknowns", "iterations",
+                                                     "converged", "residual")})
+
+    with np.errstate(divide='ignore'):
+        log10_flux = np.log10(np.maximum(fluxes, 0.0))
+    ref = log10_flux[list(library["key"]).index(reference)]
+    with np.errstate(invalid='ignore'):
+        log10_selectivity = ref - log10_flux
+
+    return {
+        "species": library["key"],
+        "flux": fluxes,
+        "log10_flux": log10_flux,
+        "log10_selectivity": log10_selectivity,
+        "solver": solver_info,
+    }
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def main():
+    """Predict membrane flux and selectivity for a 0.7 nm lattice separator."""
+
+    print("\n" + "█" * 70)
+    print("  GENESIS QUANTUM SIEVE: PORE-NETWORK MEMBRANE FLUX")
+    print("█" * 70)
+    print(f"  Timestamp: {datetime.now().isoformat()}")
+
+    network = random_lattice_network(shape=(60, 60, 60), median_diameter_nm=0.70,
+                                     sigma_log=0.08, coordination_keep=0.9)
+    print(f"  Network: {network.n_nodes:,} pores, {network.n_throats:,} throats")
+    print("-" * 70)
+
+    result = membrane_flux(network)
+
+    print(f"  {'Species':<16} {'log10 Flux':<14} {'log10 S(Li+/x)':<16} {'Solver':<20}")
+    print("  " + "-" * 66)
+    for key, lf, ls, info in zip(result["species"], result["log10_flux"],
+                                 result["log10_selectivity"], result["solver"]):
+        print(f"  {key:<16} {lf:<14.2f} {ls:<16.2f} {info['method']:<20}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
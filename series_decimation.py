@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+GENESIS: SHAPE-PRESERVING DECIMATION FOR LONG PLOTTED SERIES
+================================================================================
+
+Cycle-life histories and parameter sweeps can reach millions of points; a
+PNG is a few thousand pixels wide, so passing every point to matplotlib only
+costs render time. decimate() reduces a series to a few thousand points
+before plotting, and only when it is longer than DECIMATE_MIN_POINTS, so
+short series are drawn exactly as before.
+
+METHODS:
+    - lttb    Largest-Triangle-Three-Buckets (Steinarsson 2013): one point
+              per bucket, chosen to maximize the triangle area with the
+              previously selected point and the next bucket's mean. Keeps
+              the visual shape of smooth curves.
+    - minmax  Minimum and maximum of every bucket. Keeps every local
+              extreme at bucket resolution; best for noisy series.
+
+ALWAYS KEPT:
+    - First and last point
+    - Global minimum and maximum (peaks)
+    - Both points around every crossing of the given thresholds
+      (e.g. the 80% end-of-life line)
+    - Explicitly requested indices (e.g. end-of-life markers)
+
+Author: Nicholas Harris, Genesis Platform Inc.
+Date: February 2026
+License: Proprietary - All Rights Reserved
+================================================================================
+"""
+
+import numpy as np
+from typing import Sequence, Tuple
+
+# Series up to this length are plotted as is
+DECIMATE_MIN_POINTS = 10_000
+
+# Points per series after decimation (before kept extras)
+DECIMATE_TARGET_POINTS = 4_000
+
+
+# =============================================================================
+# SELECTION ALGORITHMS
+# =============================================================================
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Indices of the n_out points chosen by Largest-Triangle-Three-Buckets.
+
+    The first and last points are always selected; the interior is split
+    into n_out - 2 buckets with one point picked per bucket.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    cx = np.concatenate(([0.0], np.cumsum(x)))
+    cy = np.concatenate(([0.0], np.cumsum(y)))
+    counts = np.diff(edges)
+    mean_x = (cx[edges[1:]] - cx[edges[:-1]]) / counts
+    mean_y = (cy[edges[1:]] - cy[edges[:-1]]) / counts
+    # Bucket b looks ahead to bucket b+1; the last bucket to the last point
+    next_x = np.append(mean_x[1:], x[-1])
+    next_y = np.append(mean_y[1:], y[-1])
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for b in range(n_out - 2):
+        lo, hi = edges[b], edges[b + 1]
+        area = np.abs((x[a] - next_x[b]) * (y[lo:hi] - y[a])
+                      - (x[a] - x[lo:hi]) * (next_y[b] - y[a]))
+        a = lo + int(np.argmax(area))
+        selected[b + 1] = a
+    return selected
+
+
+def minmax_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """Indices of the minimum and maximum of each of n_out // 2 equal buckets."""
+    n = len(y)
+    n_buckets = max(n_out // 2, 1)
+    if 2 * n_buckets >= n:
+        return np.arange(n)
+    size = -(-n // n_buckets)
+    n_buckets = -(-n // size)
+    padded = np.concatenate([y, np.full(n_buckets * size - n, y[-1])]).reshape(n_buckets, size)
+    base = np.arange(n_buckets) * size
+    idx = np.concatenate([base + padded.argmin(axis=1), base + padded.argmax(axis=1)])
+    return np.unique(np.minimum(idx, n - 1))
+
+
+def crossing_indices(y: np.ndarray, thresholds: Sequence[float]) -> np.ndarray:
+    """Indices on both sides of every crossing of each threshold."""
+    found = []
+    for t in thresholds:
+        above = np.asarray(y) >= t
+        i = np.flatnonzero(above[1:] != above[:-1])
+        found.extend([i, i + 1])
+    return np.concatenate(found) if found else np.empty(0, dtype=np.int64)
+
+
+# =============================================================================
+# PUBLIC API
+# =============================================================================
+
+def decimation_indices(
+    x: np.ndarray,
+    y: np.ndarray,
+    max_points: int = DECIMATE_TARGET_POINTS,
+    method: str = "lttb",
+    thresholds: Sequence[float] = (),
+    keep: Sequence[int] = ()
+) -> np.ndarray:
+    """
+    Sorted indices of the points to plot for one series.
+
+    Parameters:
+        x, y: Series (x ascending)
+        max_points: Points chosen by the method
+        method: "lttb" or "minmax"
+        thresholds: y levels whose crossings must be kept
+        keep: Extra indices to keep (negative indices allowed)
+    """
+    y = np.asarray(y)
+    n = len(y)
+    if method == "lttb":
+        chosen = lttb_indices(x, y, max_points)
+    elif method == "minmax":
+        chosen = minmax_indices(y, max_points)
+    else:
+        raise ValueError(f"Unknown decimation method: {method}")
+    if n == 0:
+        return chosen
+
+    extra = np.asarray(list(keep), dtype=np.int64) % n
+    return np.unique(np.concatenate([
+        chosen, [0, n - 1, int(np.argmin(y)), int(np.argmax(y))],
+        crossing_indices(y, thresholds), extra,
+    ]).astype(np.int64))
+
+
+def decimate(
+    x: np.ndarray,
+    *ys: np.ndarray,
+    min_points: int = DECIMATE_MIN_POINTS,
+    max_points: int = DECIMATE_TARGET_POINTS,
+    method: str = "lttb",
+    thresholds: Sequence[float] = (),
+    keep: Sequence[int] = ()
+) -> Tuple[np.ndarray, ...]:
+    """
+    Decimate one or more series sharing x, if longer than min_points.
+
+    The points kept are the union over all ys, so every series keeps its
+    own peaks and crossings.
+
+    Returns:
+        (x, *ys) as arrays, unchanged if len(x) <= min_points
+    """
+    x = np.asarray(x)
+    ys = tuple(np.asarray(y) for y in ys)
+    if len(x) <= min_points:
+        return (x,) + ys
+    idx = np.unique(np.concatenate([
+        decimation_indices(x, y, max_points, method, thresholds, keep) for y in ys
+    ]))
+    return (x[idx],) + tuple(y[idx] for y in ys)
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+GENESIS: PRECOMPUTED SPLINE LOOKUP FOR THE QUANTUM SIEVE
+================================================================================
+
+Interactive exploration of the sieve model asks for ε(d) and ΔH(d) at the same
+parameter sets over and over. This module tabulates both once per parameter
+set and answers later queries from a cubic spline.
+
+METHOD:
+    - The exact model (born_solvation_quantum_sieve) is sampled on a uniform
+      pore grid and fitted with a cubic spline
+    - The grid is doubled until the spline's error at every mid-point between
+      nodes is below the requested tolerance; the achieved bound is stored
+      on the table as max_error. If the tolerance is still not met at
+      _MAX_NODES nodes, the table is kept with converged = False and a
+      RuntimeWarning is issued
+    - Barrier tables only cover the passable range d ≥ 0.8 × d_solvated;
+      queries below the steric cutoff return +inf, exactly like the model
+    - Tables are kept in an LRU cache keyed by every model parameter, so
+      changing ε_bulk, d_crit, the species radii etc. builds a new table and
+      the least recently used ones are evicted
+
+USAGE:
+    eps = dielectric_lookup(epsilon_bulk=30.0)
+    eps(0.65)                                 # ε at 0.65 nm
+    barrier_lookup("Li+")(np.linspace(0.6, 1.0, 50))
+
+Author: Nicholas Harris, Genesis Platform Inc.
+Date: February 2026
+Patent Reference: Provisional 6, Claims 12-17
+================================================================================
+"""
+
+import numpy as np
+import warnings
+from functools import lru_cache
+from typing import Union
+
+from born_solvation_quantum_sieve import (
+    SPECIES,
+    IonSpecies,
+    confined_dielectric_constant,
+    dehydration_enthalpy_array,
+)
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+LOOKUP_CACHE_SIZE = 128        # Tables retained per cache (LRU eviction)
+
+DEFAULT_D_MIN_NM = 0.3
+DEFAULT_D_MAX_NM = 3.0
+DEFAULT_DIELECTRIC_TOL = 1e-4  # Absolute error in ε_r
+DEFAULT_BARRIER_TOL = 1e-3     # Absolute error in kJ/mol
+
+_INITIAL_NODES = 129
+_MAX_NODES = 2**16 + 1
+
+
+# =============================================================================
+# SPLINE TABLES
+# =============================================================================
+
+class SplineTable:
+    """
+    Cubic-spline interpolant of an exact model function on [d_min, d_max].
+
+    Attributes:
+        d_min_nm, d_max_nm: Tabulated range (queries outside use the model)
+        n_nodes: Number of spline nodes after refinement
+        max_error: Largest mid-point deviation from the exact model
+        tolerance: Requested error bound
+        converged: Whether max_error <= tolerance
+    """
+
+    def __init__(self, func, d_min_nm: float, d_max_nm: float, tolerance: float):
+        self._func = func
+        self.d_min_nm = d_min_nm
+        self.d_max_nm = d_max_nm
+        self.tolerance = tolerance
+
+        from scipy.interpolate import CubicSpline
+
+        n = _INITIAL_NODES
+        while True:
+            nodes = np.linspace(d_min_nm, d_max_nm, n)
+            spline = CubicSpline(nodes, func(nodes))
+            mids = 0.5 * (nodes[1:] + nodes[:-1])
+            max_error = float(np.max(np.abs(spline(mids) - func(mids))))
+            if max_error <= tolerance or n >= _MAX_NODES:
+                break
+            n = 2 * n - 1
+
+        self._spline = spline
+        self.n_nodes = n
+        self.max_error = max_error
+        self.converged = max_error <= tolerance
+        if not self.converged:
+            warnings.warn(f"Spline table on [{d_min_nm:.3g}, {d_max_nm:.3g}] nm reached {n} nodes "
+                          f"with max error {max_error:.3g} > tolerance {tolerance:.3g}", RuntimeWarning)
+
+    def __call__(self, pore_diameter_nm):
+        d = np.asarray(pore_diameter_nm, dtype=float)
+        inside = (d >= self.d_min_nm) & (d <= self.d_max_nm)
+        if np.all(inside):
+            values = self._spline(d)
+        else:
+            values = np.where(inside, self._spline(np.clip(d, self.d_min_nm, self.d_max_nm)),
+                              self._func(d))
+        return float(values) if values.ndim == 0 else values
+
+
+class BarrierTable:
+    """
+    Dehydration barrier lookup for one species and parameter set.
+
+    Spline over the passable range; +inf below the steric cutoff.
+    """
+
+    def __init__(self, spline: SplineTable, steric_cutoff_nm: float):
+        self.spline = spline
+        self.steric_cutoff_nm = steric_cutoff_nm
+        self.max_error = spline.max_error if spline is not None else 0.0
+        self.converged = spline.converged if spline is not None else True
+
+    def __call__(self, pore_diameter_nm):
+        d = np.asarray(pore_diameter_nm, dtype=float)
+        if self.spline is None:
+            values = np.full(d.shape, np.inf)
+        else:
+            blocked = d < self.steric_cutoff_nm
+            values = np.where(blocked, np.inf, self.spline(np.maximum(d, self.steric_cutoff_nm)))
+        return float(values) if values.ndim == 0 else values
+
+
+# =============================================================================
+# CACHED BUILDERS
+# =============================================================================
+
+@lru_cache(maxsize=LOOKUP_CACHE_SIZE)
+def _dielectric_lookup(
+    epsilon_bulk: float,
+    epsilon_vacuum: float,
+    d_critical_nm: float,
+    transition_width_nm: float,
+    d_min_nm: float,
+    d_max_nm: float,
+    tolerance: float
+) -> SplineTable:
+    """Build (or fetch) the dielectric table for one hashable parameter set."""
+    def exact(d):
+        return confined_dielectric_constant(d, epsilon_bulk, epsilon_vacuum,
+                                            d_critical_nm, transition_width_nm)
+
+    return SplineTable(exact, d_min_nm, d_max_nm, tolerance)
+
+
+def dielectric_lookup(
+    epsilon_bulk: float = 30.0,
+    epsilon_vacuum: float = 2.0,
+    d_critical_nm: float = 0.70,
+    transition_width_nm: float = 0.10,
+    d_min_nm: float = DEFAULT_D_MIN_NM,
+    d_max_nm: float = DEFAULT_D_MAX_NM,
+    tolerance: float = DEFAULT_DIELECTRIC_TOL
+) -> SplineTable:
+    """
+    Cached spline table for confined_dielectric_constant.
+
+    Returns:
+        Callable SplineTable giving ε_r(d)
+    """
+    return _dielectric_lookup(float(epsilon_bulk), float(epsilon_vacuum),
+                              float(d_critical_nm), float(transition_width_nm),
+                              float(d_min_nm), float(d_max_nm), float(tolerance))
+
+
+@lru_cache(maxsize=LOOKUP_CACHE_SIZE)
+def _barrier_lookup(
+    bare_radius_nm: float,
+    solvated_radius_nm: float,
+    charge: int,
+    epsilon_bulk: float,
+    epsilon_vacuum: float,
+    d_critical_nm: float,
+    transition_width_nm: float,
+    d_min_nm: float,
+    d_max_nm: float,
+    tolerance: float
+) -> BarrierTable:
+    """Build (or fetch) the barrier table for one hashable parameter set."""
+    steric_cutoff_nm = 2.0 * solvated_radius_nm * 0.8
+    lower = max(d_min_nm, steric_cutoff_nm)
+    if lower >= d_max_nm:
+        return BarrierTable(None, steric_cutoff_nm)
+
+    def exact(d):
+        return dehydration_enthalpy_array(d, bare_radius_nm, solvated_radius_nm, charge,
+                                          epsilon_bulk, epsilon_vacuum,
+                                          d_critical_nm, transition_width_nm)
+
+    return BarrierTable(SplineTable(exact, lower, d_max_nm, tolerance), steric_cutoff_nm)
+
+
+def barrier_lookup(
+    species: Union[str, IonSpecies],
+    epsilon_bulk: float = 30.0,
+    epsilon_vacuum: float = 2.0,
+    d_critical_nm: float = 0.70,
+    transition_width_nm: float = 0.10,
+    d_min_nm: float = DEFAULT_D_MIN_NM,
+    d_max_nm: float = DEFAULT_D_MAX_NM,
+    tolerance: float = DEFAULT_BARRIER_TOL
+) -> BarrierTable:
+    """
+    Cached barrier table for a species.
+
+    Parameters:
+        species: Key into SPECIES or an IonSpecies instance
+
+    Returns:
+        Callable BarrierTable giving ΔH(d) in kJ/mol (+inf when blocked)
+    """
+    ion = SPECIES[species] if isinstance(species, str) else species
+    return _barrier_lookup(float(ion.bare_radius_nm), float(ion.solvated_radius_nm),
+                           int(ion.charge), float(epsilon_bulk), float(epsilon_vacuum),
+                           float(d_critical_nm), float(transition_width_nm),
+                           float(d_min_nm), float(d_max_nm), float(tolerance))
+
+
+def clear_lookup_cache():
+    """Drop every cached table."""
+    _dielectric_lookup.cache_clear()
+    _barrier_lookup.cache_clear()
+
+
+def lookup_cache_info() -> dict:
+    """Hit/miss/size statistics for both caches."""
+    return {
+        "dielectric": _dielectric_lookup.cache_info()._asdict(),
+        "barrier": _barrier_lookup.cache_info()._asdict(),
+    }
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+GENESIS: BINARY PROFILE STORE FOR QUANTUM SIEVE OUTPUTS
+================================================================================
+
+Dehydration enthalpy profiles are dense (species × pore) float arrays. Writing
+them to JSON through .tolist()/round() with None placeholders is lossy, slow
+and grows to gigabytes for high-resolution or multi-parameter runs. This
+module stores them as typed binary arrays instead.
+
+LAYOUT (one directory per run):
+    - <name>.npy             float array, shape (n_species, n_pores),
+                             kJ/mol, +inf where sterically blocked
+    - <name>_pores.npy       pore diameters (nm), sorted ascending
+    - <name>.json            small sidecar: species keys/names, units,
+                             dtype, shape and run metadata
+
+READING:
+    The .npy files are opened memory-mapped, so loading one species or one
+    pore range only reads the rows/columns it touches; nothing is parsed.
+
+Author: Nicholas Harris, Genesis Platform Inc.
+Date: February 2026
+Patent Reference: Provisional 6, Claims 12-17
+================================================================================
+"""
+
+import numpy as np
+import json
+import os
+from datetime import datetime
+from typing import Dict, Optional, Sequence, Tuple
+
+FORMAT_VERSION = 1
+
+
+# =============================================================================
+# WRITING
+# =============================================================================
+
+class ProfileWriter:
+    """
+    Pre-allocated on-disk profile array, filled species by species.
+
+    Lets long sweeps stream rows to disk without holding the full
+    (species × pores) matrix in memory.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        name: str,
+        species: Sequence[str],
+        pore_diameters_nm: np.ndarray,
+        species_names: Optional[Sequence[str]] = None,
+        metadata: Optional[Dict] = None,
+        dtype=np.float64
+    ):
+        pores = np.asarray(pore_diameters_nm, dtype=float)
+        if np.any(np.diff(pores) < 0):
+            raise ValueError("pore_diameters_nm must be sorted ascending")
+
+        os.makedirs(output_dir, exist_ok=True)
+        self.output_dir = output_dir
+        self.name = name
+        self.species = list(species)
+        self._index = {key: i for i, key in enumerate(self.species)}
+
+        np.save(os.path.join(output_dir, f"{name}_pores.npy"), pores)
+        self._array = np.lib.format.open_memmap(
+            os.path.join(output_dir, f"{name}.npy"), mode='w+',
+            dtype=dtype, shape=(len(self.species), len(pores))
+        )
+
+        sidecar = {
+            "format_version": FORMAT_VERSION,
+            "created": datetime.now().isoformat(),
+            "quantity": "dehydration_enthalpy",
+            "unit": "kJ/mol",
+            "blocked_value": "inf",
+            "dtype": np.dtype(dtype).name,
+            "shape": [len(self.species), len(pores)],
+            "axes": ["species", "pore_nm"],
+            "species": self.species,
+            "species_names": list(species_names) if species_names is not None else self.species,
+            "pore_range_nm": [float(pores[0]), float(pores[-1])] if len(pores) else [],
+            "metadata": metadata or {},
+        }
+        with open(os.path.join(output_dir, f"{name}.json"), 'w') as f:
+            json.dump(sidecar, f, indent=2)
+
+    def write(self, species: str, profile: np.ndarray):
+        """Store one species' profile."""
+        self._array[self._index[species]] = profile
+
+    def write_block(self, start: int, profiles: np.ndarray):
+        """Store consecutive species rows starting at index start."""
+        self._array[start:start + len(profiles)] = profiles
+
+    def close(self):
+        self._array.flush()
+        del self._array
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_profiles(
+    output_dir: str,
+    name: str,
+    species: Sequence[str],
+    pore_diameters_nm: np.ndarray,
+    profiles: np.ndarray,
+    species_names: Optional[Sequence[str]] = None,
+    metadata: Optional[Dict] = None,
+    dtype=np.float64
+) -> str:
+    """
+    Write a full (species × pores) profile matrix.
+
+    Returns:
+        Path of the JSON sidecar
+    """
+    with ProfileWriter(output_dir, name, species, pore_diameters_nm,
+                       species_names, metadata, dtype) as writer:
+        writer.write_block(0, np.asarray(profiles))
+    return os.path.join(output_dir, f"{name}.json")
+
+
+# =============================================================================
+# READING
+# =============================================================================
+
+class ProfileStore:
+    """Memory-mapped reader for profiles written by ProfileWriter."""
+
+    def __init__(self, output_dir: str, name: str):
+        with open(os.path.join(output_dir, f"{name}.json"), 'r') as f:
+            self.metadata = json.load(f)
+        self.species = list(self.metadata["species"])
+        self._index = {key: i for i, key in enumerate(self.species)}
+
+        self.pore_diameters_nm = np.load(os.path.join(output_dir, f"{name}_pores.npy"))
+        self.profiles = np.load(os.path.join(output_dir, f"{name}.npy"), mmap_mode='r')
+
+    def pore_slice(self, pore_min_nm: float = None, pore_max_nm: float = None) -> slice:
+        """Column slice covering pore_min_nm ≤ d ≤ pore_max_nm."""
+        lo = 0 if pore_min_nm is None else np.searchsorted(self.pore_diameters_nm, pore_min_nm, 'left')
+        hi = (len(self.pore_diameters_nm) if pore_max_nm is None
+              else np.searchsorted(self.pore_diameters_nm, pore_max_nm, 'right'))
+        return slice(int(lo), int(hi))
+
+    def load(
+        self,
+        species: Optional[Sequence[str]] = None,
+        pore_min_nm: float = None,
+        pore_max_nm: float = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Read a subset of the profiles.
+
+        Parameters:
+            species: Species keys to read (default: all)
+            pore_min_nm, pore_max_nm: Inclusive pore range (default: all)
+
+        Returns:
+            (pore_diameters_nm, profiles) with profiles shaped
+            (len(species), n_pores_in_range)
+        """
+        cols = self.pore_slice(pore_min_nm, pore_max_nm)
+        if species is None:
+            rows = self.profiles[:, cols]
+        else:
+            rows = self.profiles[[self._index[k] for k in species], cols]
+        return self.pore_diameters_nm[cols], np.asarray(rows)
+
+    def species_profile(self, species: str) -> np.ndarray:
+        """Full profile of a single species."""
+        return np.asarray(self.profiles[self._index[species]])
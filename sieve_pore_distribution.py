@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+GENESIS: PORE-SIZE-DISTRIBUTION AVERAGED QUANTUM SIEVE TRANSPORT
+================================================================================
+
+A manufactured separator does not have a single 0.7 nm pore; it has a
+distribution of pore diameters set by the process tolerances. This script
+averages the Born solvation sieve over such distributions.
+
+PHYSICS:
+    For a pore-size density f(d), the effective permeation of species s is
+    the Boltzmann-weighted average over the distribution
+
+        k_eff,s = ∫ f(d) × exp(-ΔH_s(d) / RT) dd
+
+    (optionally weighted by pore cross-section, d², for area-averaged flux).
+    Sterically blocked pores contribute nothing. Effective selectivity of a
+    target over a blocked species is k_eff,target / k_eff,blocked.
+
+    The integral is evaluated by trapezoidal quadrature on a shared pore
+    grid and combined in log space (logsumexp over pores), so permeation
+    and selectivity are reported as log10 values that never overflow or
+    underflow, however extreme the barriers.
+
+DISTRIBUTIONS:
+    - Log-normal (median, σ_log)       — typical for sintered/templated pores
+    - Normal (mean, σ)                 — tight lithographic tolerances
+    - Histogram (bin edges, counts)    — measured BET/BJH or TEM pore counts
+
+Author: Nicholas Harris, Genesis Platform Inc.
+Date: February 2026
+Patent Reference: Provisional 6, Claims 12-17
+================================================================================
+"""
+
+import numpy as np
+from datetime import datetime
+from typing import Dict
+
+from born_solvation_quantum_sieve import (
+    K_B, N_A, LN10,
+    library_dehydration_matrix,
+    species_library_from_dict,
+)
+
+# Default quadrature grid (nm): covers the sieve-active range with margin
+DEFAULT_PORE_GRID_NM = np.linspace(0.3, 3.0, 1000)
+
+# Working-set cap for the (distributions, species, pores) logsumexp block
+LOGSUMEXP_CHUNK_BYTES = 64 * 1024**2
+
+
+# =============================================================================
+# PORE-SIZE DISTRIBUTIONS
+# =============================================================================
+
+def lognormal_psd(median_nm, sigma_log, pore_grid_nm: np.ndarray = None) -> np.ndarray:
+    """
+    Log-normal pore-size densities on the quadrature grid.
+
+    Parameters:
+        median_nm: Median pore diameter(s), shape (D,)
+        sigma_log: Standard deviation(s) of ln(d), shape (D,) or scalar
+
+    Returns:
+        Unnormalized densities, shape (D, P)
+    """
+    if pore_grid_nm is None:
+        pore_grid_nm = DEFAULT_PORE_GRID_NM
+    median = np.atleast_1d(np.asarray(median_nm, dtype=float))[:, np.newaxis]
+    sigma = np.atleast_1d(np.asarray(sigma_log, dtype=float))[:, np.newaxis]
+    d = np.asarray(pore_grid_nm, dtype=float)[np.newaxis, :]
+
+    z = (np.log(d) - np.log(median)) / sigma
+    return np.exp(-0.5 * z**2) / (d * sigma * np.sqrt(2 * np.pi))
+
+
+def normal_psd(mean_nm, std_nm, pore_grid_nm: np.ndarray = None) -> np.ndarray:
+    """
+    Normal pore-size densities on the quadrature grid.
+
+    Returns:
+        Unnormalized densities, shape (D, P)
+    """
+    if pore_grid_nm is None:
+        pore_grid_nm = DEFAULT_PORE_GRID_NM
+    mean = np.atleast_1d(np.asarray(mean_nm, dtype=float))[:, np.newaxis]
+    std = np.atleast_1d(np.asarray(std_nm, dtype=float))[:, np.newaxis]
+    d = np.asarray(pore_grid_nm, dtype=float)[np.newaxis, :]
+
+    z = (d - mean) / std
+    return np.exp(-0.5 * z**2) / (std * np.sqrt(2 * np.pi))
+
+
+def histogram_psd(bin_edges_nm: np.ndarray, counts: np.ndarray,
+                  pore_grid_nm: np.ndarray = None) -> np.ndarray:
+    """
+    Piecewise-constant densities from measured pore-count histograms.
+
+    Parameters:
+        bin_edges_nm: Shared bin edges, shape (B + 1,)
+        counts: Pore counts per bin, shape (B,) or (D, B)
+
+    Returns:
+        Unnormalized densities, shape (D, P); zero outside the bins
+    """
+    if pore_grid_nm is None:
+        pore_grid_nm = DEFAULT_PORE_GRID_NM
+    edges = np.asarray(bin_edges_nm, dtype=float)
+    counts = np.atleast_2d(np.asarray(counts, dtype=float))
+
+    density = counts / np.diff(edges)[np.newaxis, :]
+    bin_index = np.searchsorted(edges, pore_grid_nm, side='right') - 1
+    inside = (bin_index >= 0) & (bin_index < len(edges) - 1)
+
+    pdf = np.zeros((counts.shape[0], len(pore_grid_nm)))
+    pdf[:, inside] = density[:, bin_index[inside]]
+    return pdf
+
+
+def quadrature_weights(pdf: np.ndarray, pore_grid_nm: np.ndarray = None,
+                       area_weighted: bool = False) -> np.ndarray:
+    """
+    Normalized trapezoidal quadrature weights for a batch of densities.
+
+    Parameters:
+        pdf: Densities, shape (D, P)
+        area_weighted: Weight each pore by its cross-section (∝ d²)
+
+    Returns:
+        Weights, shape (D, P), each row summing to 1
+    """
+    if pore_grid_nm is None:
+        pore_grid_nm = DEFAULT_PORE_GRID_NM
+    d = np.asarray(pore_grid_nm, dtype=float)
+
+    trapz = np.zeros_like(d)
+    trapz[1:] += 0.5 * np.diff(d)
+    trapz[:-1] += 0.5 * np.diff(d)
+    if area_weighted:
+        trapz = trapz * d**2
+
+    w = np.atleast_2d(pdf) * trapz[np.newaxis, :]
+    total = w.sum(axis=1, keepdims=True)
+    return np.divide(w, total, out=np.zeros_like(w), where=total > 0)
+
+
+# =============================================================================
+# DISTRIBUTION-AVERAGED TRANSPORT
+# =============================================================================
+
+def log_sum_exp(log_terms: np.ndarray, axis: int = -1) -> np.ndarray:
+    """
+    Numerically stable log(Σ exp(x)) along an axis.
+
+    Slices whose terms are all -inf (no contribution) return -inf.
+    """
+    peak = np.max(log_terms, axis=axis, keepdims=True)
+    shift = np.where(np.isfinite(peak), peak, 0.0)
+    with np.errstate(divide='ignore'):
+        total = np.log(np.sum(np.exp(log_terms - shift), axis=axis, keepdims=True))
+    return np.squeeze(total + shift, axis=axis)
+
+
+def log10_effective_permeation(weights: np.ndarray, barriers: np.ndarray,
+                               temperature_K: float = 300.0) -> np.ndarray:
+    """
+    log10 of the Boltzmann-weighted permeation over pore-size distributions.
+
+    log10 k_eff[D, S] = logsumexp_p(ln w[D, p] - ΔH[S, p] / RT) / ln(10)
+
+    Evaluated in chunks of distributions so the (D, S, P) intermediate
+    stays within LOGSUMEXP_CHUNK_BYTES.
+
+    Parameters:
+        weights: Quadrature weights, shape (D, P)
+        barriers: Barrier matrix in kJ/mol, shape (S, P), +inf where blocked
+        temperature_K: Temperature
+
+    Returns:
+        log10 permeation relative to a barrier-free pore, shape (D, S);
+        -inf where a species cannot enter any pore of the distribution
+    """
+    RT = K_B * temperature_K * N_A / 1000  # kJ/mol
+    log_boltzmann = -np.asarray(barriers, dtype=float) / RT  # (S, P)
+    with np.errstate(divide='ignore'):
+        log_w = np.log(np.atleast_2d(weights))               # (D, P)
+
+    n_dist = log_w.shape[0]
+    n_species, n_pores = log_boltzmann.shape
+    rows_per_chunk = max(1, LOGSUMEXP_CHUNK_BYTES // (8 * n_species * n_pores))
+
+    out = np.empty((n_dist, n_species))
+    for d0 in range(0, n_dist, rows_per_chunk):
+        block = log_w[d0:d0 + rows_per_chunk, np.newaxis, :] + log_boltzmann[np.newaxis, :, :]
+        out[d0:d0 + rows_per_chunk] = log_sum_exp(block, axis=2)
+    return out / LN10
+
+
+def evaluate_distributions(
+    pdf: np.ndarray,
+    library: np.ndarray = None,
+    pore_grid_nm: np.ndarray = None,
+    target: str = "Li+",
+    blocked: str = "Li_EC4",
+    temperature_K: float = 300.0,
+    epsilon_bulk: float = 30.0,
+    area_weighted: bool = False,
+    **confinement
+) -> Dict[str, np.ndarray]:
+    """
+    Effective permeation and selectivity for a batch of pore-size distributions.
+
+    Parameters:
+        pdf: Pore-size densities on pore_grid_nm, shape (D, P)
+        library: Structured species array (default: SPECIES)
+        target: Species that should pass
+        blocked: Species that should be rejected
+
+    Returns:
+        Dict with species keys and log10 arrays: log10_permeation (D, S),
+        log10_target_permeation (D,), log10_blocked_permeation (D,) and
+        log10_selectivity (D,)
+    """
+    if library is None:
+        library = species_library_from_dict()
+    if pore_grid_nm is None:
+        pore_grid_nm = DEFAULT_PORE_GRID_NM
+
+    barriers = library_dehydration_matrix(library, pore_grid_nm, epsilon_bulk, **confinement)
+    weights = quadrature_weights(pdf, pore_grid_nm, area_weighted)
+    log10_permeation = log10_effective_permeation(weights, barriers, temperature_K)
+
+    keys = list(library["key"])
+    log10_target = log10_permeation[:, keys.index(target)]
+    log10_blocked = log10_permeation[:, keys.index(blocked)]
+    with np.errstate(invalid='ignore'):
+        log10_selectivity = log10_target - log10_blocked
+
+    return {
+        "species": library["key"],
+        "log10_permeation": log10_permeation,
+        "log10_target_permeation": log10_target,
+        "log10_blocked_permeation": log10_blocked,
+        "log10_selectivity": log10_selectivity,
+    }
+
+
+def rank_distributions(evaluation: Dict[str, np.ndarray],
+                       min_log10_target_permeation: float = -np.inf) -> np.ndarray:
+    """
+    Order distributions from best to worst separator.
+
+    Ranked by log10 selectivity, then by target permeation; distributions
+    whose log10 target permeation falls below min_log10_target_permeation
+    go last.
+
+    Returns:
+        Indices into the distribution batch, best first
+    """
+    selectivity = np.nan_to_num(evaluation["log10_selectivity"], nan=-np.inf)
+    k_target = evaluation["log10_target_permeation"]
+    usable = k_target >= min_log10_target_permeation
+
+    # np.lexsort sorts by the last key first
+    return np.lexsort((-k_target, -selectivity, ~usable))
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def main():
+    """Rank log-normal manufacturing tolerances around the 0.7 nm target."""
+
+    print("\n" + "█" * 70)
+    print("  GENESIS QUANTUM SIEVE: PORE-SIZE DISTRIBUTION ANALYSIS")
+    print("█" * 70)
+    print(f"  Timestamp: {datetime.now().isoformat()}")
+
+    medians = np.linspace(0.60, 0.90, 61)
+    sigmas = np.linspace(0.01, 0.30, 30)
+    M, S = np.meshgrid(medians, sigmas, indexing='ij')
+
+    pdf = lognormal_psd(M.ravel(), S.ravel())
+    evaluation = evaluate_distributions(pdf, target="Li+", blocked="Li_EC4")
+    order = rank_distributions(evaluation, min_log10_target_permeation=-6.0)
+
+    print(f"  Distributions evaluated: {len(pdf)}")
+    print(f"  {'Rank':<6} {'Median (nm)':<14} {'σ_log':<10} {'log10 k(Li+)':<14} {'log10 S(Li+/Li(EC)4)':<20}")
+    print("  " + "-" * 64)
+    for rank, i in enumerate(order[:10], 1):
+        print(f"  {rank:<6} {M.ravel()[i]:<14.3f} {S.ravel()[i]:<10.3f} "
+              f"{evaluation['log10_target_permeation'][i]:<14.2f} {evaluation['log10_selectivity'][i]:<20.2f}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
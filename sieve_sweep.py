@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+GENESIS: MULTI-SOLVENT, MULTI-TEMPERATURE QUANTUM SIEVE SWEEP ENGINE
+================================================================================
+
+This script maps the Born solvation sieve model over its full parameter space
+instead of the single EC/DMC / 300 K / d_crit = 0.7 nm operating point used in
+born_solvation_quantum_sieve.py.
+
+SWEEP TENSOR:
+    The sweep evaluates a 5-D tensor
+
+        log10_transmission[ε_bulk, T, d_crit, species, pore]
+            = -ΔH_dehydration(d; ε_bulk, d_crit) / (ln(10) × R × T)
+
+    i.e. the log10 Boltzmann factor for entering the pore. The barrier itself
+    does not depend on temperature and is stored once as a 4-D tensor
+
+        barrier_kJ_mol[ε_bulk, d_crit, species, pore]
+
+    Sterically blocked entries are +inf (barrier) and -inf (transmission).
+
+EXECUTION:
+    - The (ε_bulk, d_crit) grid, and the species axis if needed, is split into
+      chunks whose working set fits a memory budget
+    - Chunks are evaluated in parallel across cores (process pool)
+    - Every worker writes its slab directly into memory-mapped .npy files, so
+      the full tensor never has to fit in RAM
+
+OUTPUTS (one directory per sweep):
+    - barrier_kJ_mol.npy         (memory-mapped, 4-D)
+    - log10_transmission.npy     (memory-mapped, 5-D)
+    - sweep_metadata.json        (axes, species keys, fixed parameters)
+
+Author: Nicholas Harris, Genesis Platform Inc.
+Date: February 2026
+Patent Reference: Provisional 6, Claims 12-17
+================================================================================
+"""
+
+import numpy as np
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from born_solvation_quantum_sieve import (
+    K_B, N_A,
+    dehydration_enthalpy_array,
+    species_library_from_dict,
+)
+
+# =============================================================================
+# STORE LAYOUT
+# =============================================================================
+
+METADATA_FILE = "sweep_metadata.json"
+BARRIER_FILE = "barrier_kJ_mol.npy"
+TRANSMISSION_FILE = "log10_transmission.npy"
+
+BARRIER_AXES = ("epsilon_bulk", "d_critical_nm", "species", "pore_nm")
+TRANSMISSION_AXES = ("epsilon_bulk", "temperature_K", "d_critical_nm", "species", "pore_nm")
+
+# Peak working set per output element: barrier, dielectric, two Born terms
+# and the temperature-expanded result, all float64
+_BYTES_PER_ELEMENT = 8 * 6
+
+LN10 = np.log(10.0)
+
+
+# =============================================================================
+# CHUNK PLANNING
+# =============================================================================
+
+def plan_chunks(
+    n_epsilon: int,
+    n_temperature: int,
+    n_d_critical: int,
+    n_species: int,
+    n_pores: int,
+    memory_budget_bytes: int
+) -> List[Tuple[int, int, int, int]]:
+    """
+    Split the sweep into chunks that fit a memory budget.
+
+    The (ε_bulk, d_crit) pairs are flattened into one "outer" index. Each
+    chunk covers a contiguous range of outer points and of species; species
+    are only split when a single outer point does not fit the budget.
+
+    Returns:
+        List of (outer_start, outer_stop, species_start, species_stop)
+    """
+    n_outer = n_epsilon * n_d_critical
+    bytes_per_species = max(1, n_temperature) * n_pores * _BYTES_PER_ELEMENT
+    bytes_per_outer = bytes_per_species * n_species
+
+    if bytes_per_outer <= memory_budget_bytes:
+        outer_per_chunk = max(1, memory_budget_bytes // bytes_per_outer)
+        species_per_chunk = n_species
+    else:
+        outer_per_chunk = 1
+        species_per_chunk = max(1, memory_budget_bytes // bytes_per_species)
+
+    chunks = []
+    for o0 in range(0, n_outer, outer_per_chunk):
+        o1 = min(o0 + outer_per_chunk, n_outer)
+        for s0 in range(0, n_species, species_per_chunk):
+            chunks.append((o0, o1, s0, min(s0 + species_per_chunk, n_species)))
+    return chunks
+
+
+# =============================================================================
+# CHUNK EVALUATION (WORKER SIDE)
+# =============================================================================
+
+# Per-process sweep state, set once by _init_worker instead of being
+# pickled with every chunk
+_WORKER_STATE: Dict = {}
+
+
+def _init_worker(state: Dict):
+    """Process pool initializer: install the shared sweep state."""
+    _WORKER_STATE.clear()
+    _WORKER_STATE.update(state)
+
+
+def _evaluate_chunk(chunk: Tuple[int, int, int, int]) -> int:
+    """
+    Evaluate one chunk and write it into the memory-mapped store.
+
+    Returns:
+        Number of tensor elements written
+    """
+    state = _WORKER_STATE
+    o0, o1, s0, s1 = chunk
+
+    eps_axis = state["epsilon_bulk"]
+    dcrit_axis = state["d_critical_nm"]
+    temps = state["temperature_K"]
+    pores = state["pore_nm"]
+    library = state["library"][s0:s1]
+
+    outer = np.arange(o0, o1)
+    i_eps, i_dcrit = np.divmod(outer, len(dcrit_axis))
+
+    # Barrier block: (outer, species, pore)
+    barrier = dehydration_enthalpy_array(
+        pores[np.newaxis, np.newaxis, :],
+        library["bare_radius_nm"][np.newaxis, :, np.newaxis],
+        library["solvated_radius_nm"][np.newaxis, :, np.newaxis],
+        library["charge"][np.newaxis, :, np.newaxis],
+        epsilon_bulk=eps_axis[i_eps][:, np.newaxis, np.newaxis],
+        epsilon_vacuum=state["epsilon_vacuum"],
+        d_critical_nm=dcrit_axis[i_dcrit][:, np.newaxis, np.newaxis],
+        transition_width_nm=state["transition_width_nm"],
+    )
+
+    # Transmission block: (outer, temperature, species, pore)
+    RT = K_B * temps * N_A / 1000  # kJ/mol
+    log10_tx = -barrier[:, np.newaxis, :, :] / (LN10 * RT[np.newaxis, :, np.newaxis, np.newaxis])
+
+    barrier_store = np.load(os.path.join(state["output_dir"], BARRIER_FILE), mmap_mode='r+')
+    tx_store = np.load(os.path.join(state["output_dir"], TRANSMISSION_FILE), mmap_mode='r+')
+
+    for j, (ie, idc) in enumerate(zip(i_eps, i_dcrit)):
+        barrier_store[ie, idc, s0:s1, :] = barrier[j]
+        tx_store[ie, :, idc, s0:s1, :] = log10_tx[j]
+
+    barrier_store.flush()
+    tx_store.flush()
+    del barrier_store, tx_store
+
+    return int(barrier.size + log10_tx.size)
+
+
+# =============================================================================
+# SWEEP DRIVER
+# =============================================================================
+
+def run_sieve_sweep(
+    output_dir: str,
+    library: np.ndarray = None,
+    epsilon_bulk=(30.0,),
+    temperature_K=(300.0,),
+    d_critical_nm=(0.70,),
+    pore_range_nm: np.ndarray = None,
+    epsilon_vacuum: float = 2.0,
+    transition_width_nm: float = 0.10,
+    memory_budget_mb: float = 256.0,
+    n_workers: Optional[int] = None
+) -> "SieveSweepStore":
+    """
+    Evaluate the full sweep tensor and write it to a memory-mapped store.
+
+    Parameters:
+        output_dir: Directory for the .npy tensors and metadata sidecar
+        library: Structured species array (default: SPECIES)
+        epsilon_bulk: Bulk solvent dielectric constants to sweep
+        temperature_K: Temperatures to sweep
+        d_critical_nm: Critical confinement diameters to sweep
+        pore_range_nm: Pore diameters (default: 0.3-3.0 nm, 500 points)
+        epsilon_vacuum: Limiting dielectric at extreme confinement
+        transition_width_nm: Width of the sigmoid dielectric transition
+        memory_budget_mb: Peak working set per chunk
+        n_workers: Worker processes (default: all cores; 1 = run in-process)
+
+    Returns:
+        SieveSweepStore opened read-only on the written tensors
+    """
+    if library is None:
+        library = species_library_from_dict()
+    if pore_range_nm is None:
+        pore_range_nm = np.linspace(0.3, 3.0, 500)
+
+    axes = {
+        "epsilon_bulk": np.atleast_1d(np.asarray(epsilon_bulk, dtype=float)),
+        "temperature_K": np.atleast_1d(np.asarray(temperature_K, dtype=float)),
+        "d_critical_nm": np.atleast_1d(np.asarray(d_critical_nm, dtype=float)),
+        "pore_nm": np.asarray(pore_range_nm, dtype=float),
+    }
+    n_eps = len(axes["epsilon_bulk"])
+    n_T = len(axes["temperature_K"])
+    n_dc = len(axes["d_critical_nm"])
+    n_sp = len(library)
+    n_p = len(axes["pore_nm"])
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Pre-allocate the on-disk tensors; workers fill them in place
+    np.lib.format.open_memmap(os.path.join(output_dir, BARRIER_FILE), mode='w+',
+                              dtype=np.float64, shape=(n_eps, n_dc, n_sp, n_p)).flush()
+    np.lib.format.open_memmap(os.path.join(output_dir, TRANSMISSION_FILE), mode='w+',
+                              dtype=np.float64, shape=(n_eps, n_T, n_dc, n_sp, n_p)).flush()
+
+    chunks = plan_chunks(n_eps, n_T, n_dc, n_sp, n_p, int(memory_budget_mb * 1024**2))
+
+    state = dict(axes, library=library, output_dir=output_dir,
+                 epsilon_vacuum=epsilon_vacuum, transition_width_nm=transition_width_nm)
+
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    n_workers = max(1, min(n_workers, len(chunks)))
+
+    if n_workers == 1:
+        _init_worker(state)
+        written = sum(_evaluate_chunk(c) for c in chunks)
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker,
+                                 initargs=(state,)) as pool:
+            written = sum(pool.map(_evaluate_chunk, chunks))
+
+    metadata = {
+        "created": datetime.now().isoformat(),
+        "method": "Modified Born Solvation Model (sigmoid dielectric collapse)",
+        "axes": {name: values.tolist() for name, values in axes.items()},
+        "species": library["key"].tolist(),
+        "barrier_axes": list(BARRIER_AXES),
+        "transmission_axes": list(TRANSMISSION_AXES),
+        "fixed_parameters": {
+            "epsilon_vacuum": epsilon_vacuum,
+            "transition_width_nm": transition_width_nm,
+        },
+        "n_chunks": len(chunks),
+        "n_workers": n_workers,
+        "elements_written": written,
+    }
+    with open(os.path.join(output_dir, METADATA_FILE), 'w') as f:
+        json.dump(metadata, f, indent=2)
+
+    return SieveSweepStore(output_dir)
+
+
+# =============================================================================
+# QUERYING A STORED SWEEP
+# =============================================================================
+
+class SieveSweepStore:
+    """
+    Read-only view of a sweep written by run_sieve_sweep.
+
+    The tensors are memory-mapped, so selecting a slice only reads the
+    pages it touches.
+    """
+
+    def __init__(self, output_dir: str):
+        self.output_dir = output_dir
+        with open(os.path.join(output_dir, METADATA_FILE), 'r') as f:
+            self.metadata = json.load(f)
+
+        self.axes = {name: np.asarray(values) for name, values in self.metadata["axes"].items()}
+        self.species = list(self.metadata["species"])
+
+        self.barrier_kJ_mol = np.load(os.path.join(output_dir, BARRIER_FILE), mmap_mode='r')
+        self.log10_transmission = np.load(os.path.join(output_dir, TRANSMISSION_FILE), mmap_mode='r')
+
+    def axis_index(self, axis: str, value) -> int:
+        """Index of the grid point nearest to value (species by key)."""
+        if axis == "species":
+            return self.species.index(value)
+        return int(np.argmin(np.abs(self.axes[axis] - value)))
+
+    def _select(self, tensor: np.ndarray, axis_names: Tuple[str, ...], selection: Dict) -> np.ndarray:
+        index = []
+        for name in axis_names:
+            value = selection.get(name)
+            index.append(slice(None) if value is None else self.axis_index(name, value))
+        return np.asarray(tensor[tuple(index)])
+
+    def barrier(self, **selection) -> np.ndarray:
+        """
+        Barrier slice in kJ/mol.
+
+        Keyword arguments name an axis (epsilon_bulk, d_critical_nm,
+        species, pore_nm) and pin it to the nearest grid value; omitted
+        axes are returned in full.
+        """
+        return self._select(self.barrier_kJ_mol, BARRIER_AXES, selection)
+
+    def transmission(self, **selection) -> np.ndarray:
+        """log10 Boltzmann transmission slice; same selection rules as barrier."""
+        return self._select(self.log10_transmission, TRANSMISSION_AXES, selection)
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def main():
+    """Run a representative solvent × temperature × d_crit sweep."""
+
+    print("\n" + "█" * 70)
+    print("  GENESIS QUANTUM SIEVE: PARAMETER SWEEP ENGINE")
+    print("█" * 70)
+    print(f"  Timestamp: {datetime.now().isoformat()}")
+
+    output_dir = os.path.join(os.path.dirname(__file__), "outputs", "sieve_sweep")
+
+    # DMC (~3) through EC/DMC (~30) to water (~78)
+    epsilon_bulk = np.array([3.1, 7.0, 18.0, 30.0, 46.0, 64.0, 78.4])
+    temperature_K = np.linspace(233.15, 353.15, 7)   # -40°C to 80°C
+    d_critical_nm = np.linspace(0.60, 0.80, 9)
+
+    store = run_sieve_sweep(output_dir, epsilon_bulk=epsilon_bulk,
+                            temperature_K=temperature_K, d_critical_nm=d_critical_nm)
+
+    meta = store.metadata
+    print(f"  Tensor shape:  {store.log10_transmission.shape}")
+    print(f"  Chunks:        {meta['n_chunks']} on {meta['n_workers']} worker(s)")
+    print(f"  Store:         {output_dir}")
+
+    barrier_li = store.barrier(epsilon_bulk=30.0, d_critical_nm=0.70, species="Li+", pore_nm=0.70)
+    print(f"  Li+ barrier at ε=30, d_crit=0.7 nm, d=0.7 nm: {float(barrier_li):.2f} kJ/mol")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+GENESIS: UNCERTAINTY PROPAGATION FOR QUANTUM SIEVE BARRIERS
+================================================================================
+
+The ionic radii in SPECIES and the bulk dielectric constant are literature
+point values, but the sieve barrier and selectivity depend steeply on them
+near the steric cutoff (d < 0.8 × d_solvated). This script propagates their
+uncertainty through the Born solvation model.
+
+METHOD:
+    - Inputs are sampled as independent normals around their nominal values:
+        r_bare    ~ N(r_bare,    (u_bare    × r_bare)²)      per species
+        r_solv    ~ N(r_solv,    (u_solv    × r_solv)²)      per species
+        ε_bulk    ~ N(ε_bulk,    (u_ε       × ε_bulk)²)      shared
+    - Sampling is quasi-Monte Carlo (scrambled Sobol sequence mapped through
+      the normal inverse CDF) by default, or plain Monte Carlo
+    - Each chunk of samples is evaluated as one vectorized
+      (samples × species × pores) barrier tensor, folded into fixed-bin
+      histograms and discarded, so memory is bounded by the chunk size and
+      histogram resolution — not by the number of samples
+
+OUTPUTS:
+    For every (species, pore): mean barrier, barrier confidence interval,
+    probability of steric blocking, and the confidence interval of
+    log10 selectivity versus the reference ion.
+
+Author: Nicholas Harris, Genesis Platform Inc.
+Date: February 2026
+Patent Reference: Provisional 6, Claims 12-17
+================================================================================
+"""
+
+import numpy as np
+import warnings
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterator, Tuple
+
+from born_solvation_quantum_sieve import (
+    K_B, N_A, LN10,
+    dehydration_enthalpy_array,
+    species_library_from_dict,
+)
+
+# =============================================================================
+# INPUT UNCERTAINTY
+# =============================================================================
+
+@dataclass
+class InputUncertainty:
+    """Relative (1σ) uncertainty of each sampled model input."""
+    bare_radius_rel: float = 0.05       # Shannon radii: ~±5%
+    solvated_radius_rel: float = 0.10   # Solvation shells are less certain
+    epsilon_bulk_rel: float = 0.10      # EC/DMC ratio and salt dependence
+
+
+# Histogram resolution for streaming quantiles
+BARRIER_BIN_EDGES = np.linspace(-100.0, 1000.0, 4401)        # 0.25 kJ/mol
+LOG10_SELECTIVITY_BIN_EDGES = np.linspace(-50.0, 200.0, 5001)  # 0.05 decades
+
+# Cells per block when locating quantile bins (bounds the temporary mask)
+_QUANTILE_CELL_BLOCK = 1024
+
+
+# =============================================================================
+# STREAMING STATISTICS
+# =============================================================================
+
+class StreamingHistogram:
+    """
+    Constant-memory per-cell distribution of a (samples, *cells) stream.
+
+    Finite values go into fixed bins; finite values below the first or
+    above the last edge (underflow, overflow), +inf, -inf and NaN are
+    counted separately. Quantiles are read from the cumulative counts with
+    linear interpolation inside a bin; a quantile that falls in the
+    underflow or overflow is unknown and returned as NaN.
+
+    Memory is cells × bins × 8 bytes (int64 counts), e.g. 5 species × 101
+    pores × 5000 bins ≈ 20 MB, independent of the number of samples.
+    """
+
+    def __init__(self, cell_shape: Tuple[int, ...], bin_edges: np.ndarray):
+        self.cell_shape = tuple(cell_shape)
+        self.bin_edges = np.asarray(bin_edges, dtype=float)
+        self.n_bins = len(self.bin_edges) - 1
+        n_cells = int(np.prod(self.cell_shape))
+
+        self.counts = np.zeros((n_cells, self.n_bins), dtype=np.int64)
+        self.n_pos_inf = np.zeros(n_cells, dtype=np.int64)
+        self.n_neg_inf = np.zeros(n_cells, dtype=np.int64)
+        self.n_nan = np.zeros(n_cells, dtype=np.int64)
+        self.n_underflow = np.zeros(n_cells, dtype=np.int64)
+        self.n_overflow = np.zeros(n_cells, dtype=np.int64)
+        self.sum = np.zeros(n_cells)
+        self.n_finite = np.zeros(n_cells, dtype=np.int64)
+
+    def update(self, values: np.ndarray):
+        """Fold a chunk of shape (n, *cell_shape) into the histogram."""
+        v = np.asarray(values, dtype=float).reshape(len(values), -1)
+        n_cells = v.shape[1]
+
+        finite = np.isfinite(v)
+        self.n_pos_inf += np.sum(v == np.inf, axis=0)
+        self.n_neg_inf += np.sum(v == -np.inf, axis=0)
+        self.n_nan += np.sum(np.isnan(v), axis=0)
+        self.n_finite += finite.sum(axis=0)
+        self.sum += np.where(finite, v, 0.0).sum(axis=0)
+
+        values = v[finite]
+        cells = np.broadcast_to(np.arange(n_cells), v.shape)[finite]
+        under = values < self.bin_edges[0]
+        over = values > self.bin_edges[-1]
+        self.n_underflow += np.bincount(cells[under], minlength=n_cells)
+        self.n_overflow += np.bincount(cells[over], minlength=n_cells)
+
+        in_range = ~(under | over)
+        # The last edge itself belongs to the last bin
+        bins = np.minimum(np.searchsorted(self.bin_edges, values[in_range], side='right') - 1,
+                          self.n_bins - 1)
+        self.counts += np.bincount(cells[in_range] * self.n_bins + bins,
+                                   minlength=n_cells * self.n_bins).reshape(n_cells, self.n_bins)
+
+    def mean(self) -> np.ndarray:
+        """Mean of the finite values."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return (self.sum / self.n_finite).reshape(self.cell_shape)
+
+    def fraction(self, which: str) -> np.ndarray:
+        """Fraction of samples that were 'pos_inf', 'neg_inf', 'nan', 'underflow' or 'overflow'."""
+        total = (self.counts.sum(axis=1) + self.n_pos_inf + self.n_neg_inf + self.n_nan
+                 + self.n_underflow + self.n_overflow)
+        count = getattr(self, f"n_{which}")
+        return (count / np.maximum(total, 1)).reshape(self.cell_shape)
+
+    def quantiles(self, q) -> np.ndarray:
+        """
+        Quantiles of the defined (non-NaN) values, ±inf included.
+
+        Returns:
+            Array of shape (len(q), *cell_shape); NaN where the quantile
+            lies outside the bin range (see underflow / overflow)
+        """
+        q = np.atleast_1d(np.asarray(q, dtype=float))
+        n_defined = (self.counts.sum(axis=1) + self.n_pos_inf + self.n_neg_inf
+                     + self.n_underflow + self.n_overflow)
+        cumulative = np.cumsum(self.counts, axis=1)
+
+        out = np.empty((len(q), self.counts.shape[0]))
+        for k, qk in enumerate(q):
+            # Order: -inf, underflow, bins, overflow, +inf
+            rank = qk * n_defined - self.n_neg_inf - self.n_underflow  # rank among binned values
+            n_fin = cumulative[:, -1]
+            idx = np.empty(len(rank), dtype=np.int64)
+            for c0 in range(0, len(rank), _QUANTILE_CELL_BLOCK):
+                block = slice(c0, c0 + _QUANTILE_CELL_BLOCK)
+                idx[block] = (cumulative[block] < rank[block, np.newaxis]).sum(axis=1)
+            idx = np.clip(idx, 0, self.n_bins - 1)
+
+            below = np.where(idx > 0, cumulative[np.arange(len(idx)), idx - 1], 0)
+            in_bin = np.maximum(self.counts[np.arange(len(idx)), idx], 1)
+            frac = np.clip((rank - below) / in_bin, 0.0, 1.0)
+            value = self.bin_edges[idx] + frac * (self.bin_edges[idx + 1] - self.bin_edges[idx])
+
+            out[k] = np.select(
+                [n_defined == 0,
+                 (qk * n_defined <= self.n_neg_inf) & (self.n_neg_inf > 0),
+                 (rank <= 0) & (self.n_underflow > 0),
+                 rank > n_fin + self.n_overflow,
+                 rank > n_fin],
+                [np.nan, -np.inf, np.nan, np.inf, np.nan],
+                default=value)
+        return out.reshape((len(q),) + self.cell_shape)
+
+
+# =============================================================================
+# SAMPLING
+# =============================================================================
+
+def iter_barrier_samples(
+    library: np.ndarray,
+    pore_range_nm: np.ndarray,
+    n_samples: int = 100_000,
+    chunk_size: int = 4096,
+    uncertainty: InputUncertainty = None,
+    epsilon_bulk: float = 30.0,
+    method: str = "sobol",
+    seed: int = 42,
+    **confinement
+) -> Iterator[np.ndarray]:
+    """
+    Stream barrier samples chunk by chunk.
+
+    Yields:
+        Barrier arrays in kJ/mol of shape (chunk, species, pores)
+    """
+    if uncertainty is None:
+        uncertainty = InputUncertainty()
+    n_species = len(library)
+    dim = 2 * n_species + 1
+
+    if method == "sobol":
+        from scipy.stats import norm, qmc
+        sampler = qmc.Sobol(d=dim, scramble=True, seed=seed)
+    elif method == "mc":
+        rng = np.random.default_rng(seed)
+    else:
+        raise ValueError(f"Unknown sampling method: {method}")
+
+    pores = np.asarray(pore_range_nm, dtype=float)[np.newaxis, np.newaxis, :]
+    bare0 = library["bare_radius_nm"][np.newaxis, :]
+    solv0 = library["solvated_radius_nm"][np.newaxis, :]
+    charge = library["charge"][np.newaxis, :, np.newaxis]
+
+    for start in range(0, n_samples, chunk_size):
+        n = min(chunk_size, n_samples - start)
+
+        if method == "sobol":
+            with warnings.catch_warnings():
+                # Partial final chunks break Sobol's power-of-2 balance; harmless here
+                warnings.simplefilter("ignore", UserWarning)
+                u = sampler.random(n)
+            z = norm.ppf(np.clip(u, 1e-12, 1 - 1e-12))
+        else:
+            z = rng.standard_normal((n, dim))
+
+        bare = np.maximum(bare0 * (1 + uncertainty.bare_radius_rel * z[:, :n_species]), 1e-4)
+        solv = np.maximum(solv0 * (1 + uncertainty.solvated_radius_rel * z[:, n_species:2 * n_species]), 1e-4)
+        eps = np.maximum(epsilon_bulk * (1 + uncertainty.epsilon_bulk_rel * z[:, -1]), 1.01)
+
+        yield dehydration_enthalpy_array(
+            pores, bare[:, :, np.newaxis], solv[:, :, np.newaxis], charge,
+            eps[:, np.newaxis, np.newaxis], **confinement
+        )
+
+
+# =============================================================================
+# PROPAGATION
+# =============================================================================
+
+def propagate_uncertainty(
+    library: np.ndarray = None,
+    pore_range_nm: np.ndarray = None,
+    n_samples: int = 100_000,
+    chunk_size: int = 4096,
+    uncertainty: InputUncertainty = None,
+    reference: str = "Li+",
+    temperature_K: float = 300.0,
+    epsilon_bulk: float = 30.0,
+    confidence: float = 0.95,
+    method: str = "sobol",
+    seed: int = 42,
+    **confinement
+) -> Dict[str, np.ndarray]:
+    """
+    Barrier and selectivity confidence intervals from sampled inputs.
+
+    Returns:
+        Dict with pore_nm, species and (species, pores) arrays:
+        barrier_mean, barrier_median, barrier_lo, barrier_hi,
+        blocked_probability, log10_selectivity_median,
+        log10_selectivity_lo, log10_selectivity_hi
+        (log10 selectivity of the reference over each species), and
+        barrier_out_of_range, log10_selectivity_out_of_range: fraction
+        of samples outside the histogram range (their quantiles are NaN)
+    """
+    if library is None:
+        library = species_library_from_dict()
+    if pore_range_nm is None:
+        pore_range_nm = np.linspace(0.5, 1.5, 101)
+    pore_range_nm = np.asarray(pore_range_nm, dtype=float)
+
+    RT = K_B * temperature_K * N_A / 1000  # kJ/mol
+    ref = list(library["key"]).index(reference)
+    cells = (len(library), len(pore_range_nm))
+
+    barrier_hist = StreamingHistogram(cells, BARRIER_BIN_EDGES)
+    selectivity_hist = StreamingHistogram(cells, LOG10_SELECTIVITY_BIN_EDGES)
+
+    for barrier in iter_barrier_samples(library, pore_range_nm, n_samples, chunk_size,
+                                        uncertainty, epsilon_bulk, method, seed,
+                                        **confinement):
+        barrier_hist.update(barrier)
+        with np.errstate(invalid='ignore'):
+            log10_sel = (barrier - barrier[:, ref:ref + 1, :]) / (LN10 * RT)
+        selectivity_hist.update(log10_sel)
+
+    tail = (1.0 - confidence) / 2
+    b_lo, b_med, b_hi = barrier_hist.quantiles([tail, 0.5, 1 - tail])
+    s_lo, s_med, s_hi = selectivity_hist.quantiles([tail, 0.5, 1 - tail])
+
+    return {
+        "pore_nm": pore_range_nm,
+        "species": library["key"],
+        "n_samples": n_samples,
+        "confidence": confidence,
+        "barrier_mean": barrier_hist.mean(),
+        "barrier_median": b_med,
+        "barrier_lo": b_lo,
+        "barrier_hi": b_hi,
+        "blocked_probability": barrier_hist.fraction("pos_inf"),
+        "log10_selectivity_median": s_med,
+        "log10_selectivity_lo": s_lo,
+        "log10_selectivity_hi": s_hi,
+        "barrier_out_of_range": barrier_hist.fraction("underflow") + barrier_hist.fraction("overflow"),
+        "log10_selectivity_out_of_range": (selectivity_hist.fraction("underflow")
+                                           + selectivity_hist.fraction("overflow")),
+    }
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def main():
+    """Report 95% confidence intervals at the 0.7 nm design point."""
+
+    print("\n" + "█" * 70)
+    print("  GENESIS QUANTUM SIEVE: UNCERTAINTY PROPAGATION")
+    print("█" * 70)
+    print(f"  Timestamp: {datetime.now().isoformat()}")
+
+    u = InputUncertainty()
+    print(f"  σ(r_bare) = {u.bare_radius_rel:.0%}, σ(r_solv) = {u.solvated_radius_rel:.0%}, "
+          f"σ(ε_bulk) = {u.epsilon_bulk_rel:.0%}")
+
+    result = propagate_uncertainty(n_samples=100_000, uncertainty=u)
+    idx = int(np.argmin(np.abs(result["pore_nm"] - 0.70)))
+
+    print(f"  Samples: {result['n_samples']:,} (Sobol), d = {result['pore_nm'][idx]:.2f} nm")
+    print("-" * 70)
+    print(f"  {'Species':<14} {'P(blocked)':<12} {'Barrier 95% CI (kJ/mol)':<26} {'log10 S 95% CI':<20}")
+    print("  " + "-" * 70)
+    for i, key in enumerate(result["species"]):
+        b = f"[{result['barrier_lo'][i, idx]:.1f}, {result['barrier_hi'][i, idx]:.1f}]"
+        s = f"[{result['log10_selectivity_lo'][i, idx]:.2f}, {result['log10_selectivity_hi'][i, idx]:.2f}]"
+        print(f"  {key:<14} {result['blocked_probability'][i, idx]:<12.3f} {b:<26} {s:<20}")
+    for name in ("barrier", "log10_selectivity"):
+        outside = result[f"{name}_out_of_range"].max()
+        if outside > 0:
+            print(f"  ⚠ Up to {outside:.2%} of {name} samples fell outside the histogram range")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
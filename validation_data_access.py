@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+GENESIS SOLID-STATE BATTERY: SHARED VALIDATION DATA ACCESS
+================================================================================
+
+One place to read the files in validation_data/. The verification suite and
+the figure scripts used to parse the same CSV and JSON files with their own
+loops; they now go through this module.
+
+CACHING:
+    - In-process: every file is parsed at most once per process. Entries are
+      keyed on absolute path and invalidated when the file's mtime or size
+      changes, so an edited file is picked up on the next load.
+    - On-disk (optional): parsed CSV tables are also saved as .npy files in
+      a cache directory, so a fresh process skips text parsing entirely.
+      Enable with set_disk_cache(directory) or the GENESIS_DATA_CACHE
+      environment variable.
+
+    Cached values are shared between callers: arrays are returned read-only
+    and JSON dicts must be treated as read-only.
+
+STREAMING:
+    iter_table_chunks reads selected numeric columns of arbitrarily large
+    CSVs (raw cycler exports) in fixed-size row chunks, bypassing the cache.
+
+Author: Nicholas Harris, Genesis Platform Inc.
+Date: February 2026
+License: Proprietary - All Rights Reserved
+================================================================================
+"""
+
+import hashlib
+import itertools
+import json
+import os
+import threading
+import numpy as np
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+
+DATA_DIR = "validation_data"
+
+# Rows per chunk when streaming large CSVs
+STREAM_CHUNK_ROWS = 1_000_000
+
+# Optional directory for binary copies of parsed tables
+DISK_CACHE_DIR: Optional[str] = os.environ.get("GENESIS_DATA_CACHE") or None
+
+_cache: Dict[str, Tuple[Tuple[int, int], object]] = {}
+_path_locks: Dict[str, threading.Lock] = {}
+_registry_lock = threading.Lock()
+_stats = {"hits": 0, "parses": 0, "disk_hits": 0}
+
+
+# =============================================================================
+# CACHE MANAGEMENT
+# =============================================================================
+
+def file_signature(filepath: str) -> Tuple[int, int]:
+    """(mtime in ns, size in bytes) used to detect edited files."""
+    st = os.stat(filepath)
+    return st.st_mtime_ns, st.st_size
+
+
+def set_disk_cache(directory: Optional[str]):
+    """Enable the on-disk table cache in directory (None disables it)."""
+    global DISK_CACHE_DIR
+    DISK_CACHE_DIR = directory
+
+
+def clear_cache():
+    """Drop every in-process entry (the on-disk cache is left alone)."""
+    with _registry_lock:
+        _cache.clear()
+        for key in _stats:
+            _stats[key] = 0
+
+
+def cache_info() -> Dict[str, int]:
+    """Hit/parse counters and number of cached files."""
+    with _registry_lock:
+        return dict(_stats, entries=len(_cache))
+
+
+def _cached(filepath: str, parse):
+    """Return parse(path) from cache, re-parsing only if the file changed."""
+    path = os.path.abspath(filepath)
+    with _registry_lock:
+        lock = _path_locks.setdefault(path, threading.Lock())
+
+    # Per-file lock: concurrent loaders of the same file parse it once
+    with lock:
+        signature = file_signature(path)
+        entry = _cache.get(path)
+        if entry is not None and entry[0] == signature:
+            with _registry_lock:
+                _stats["hits"] += 1
+            return entry[1]
+
+        value = parse(path, signature)
+        with _registry_lock:
+            _cache[path] = (signature, value)
+        return value
+
+
+def _disk_cache_path(path: str, signature: Tuple[int, int]) -> Tuple[str, str]:
+    """(cache file for this signature, prefix shared by all its versions)."""
+    digest = hashlib.sha1(path.encode()).hexdigest()[:12]
+    prefix = f"{os.path.basename(path)}-{digest}-"
+    return os.path.join(DISK_CACHE_DIR, f"{prefix}{signature[0]}-{signature[1]}.npy"), prefix
+
+
+# =============================================================================
+# PARSERS
+# =============================================================================
+
+def _parse_table(path: str, signature: Tuple[int, int]) -> np.ndarray:
+    if DISK_CACHE_DIR:
+        cache_path, prefix = _disk_cache_path(path, signature)
+        if os.path.exists(cache_path):
+            table = np.load(cache_path, allow_pickle=False)
+            table.flags.writeable = False
+            with _registry_lock:
+                _stats["disk_hits"] += 1
+            return table
+
+    with open(path, 'r', encoding='utf-8') as f:
+        lines = [line for line in f if line.strip() and not line.lstrip().startswith('#')]
+    table = np.genfromtxt(lines, delimiter=',', names=True, dtype=None,
+                          encoding='utf-8', autostrip=True)
+    table = np.atleast_1d(table)
+    table.flags.writeable = False
+    with _registry_lock:
+        _stats["parses"] += 1
+
+    if DISK_CACHE_DIR:
+        os.makedirs(DISK_CACHE_DIR, exist_ok=True)
+        for name in os.listdir(DISK_CACHE_DIR):
+            if name.startswith(prefix):  # Stale versions of this file
+                os.remove(os.path.join(DISK_CACHE_DIR, name))
+        np.save(cache_path, table, allow_pickle=False)
+    return table
+
+
+def _parse_json(path: str, signature: Tuple[int, int]) -> Dict:
+    with open(path, 'r') as f:
+        data = json.load(f)
+    with _registry_lock:
+        _stats["parses"] += 1
+    return data
+
+
+# =============================================================================
+# PUBLIC LOADERS
+# =============================================================================
+
+def load_table(filepath: str) -> np.ndarray:
+    """
+    Load a '#'-commented CSV with a header row as a structured array.
+
+    Column names come from the header; dtypes are inferred per column.
+    """
+    return _cached(filepath, _parse_table)
+
+
+def load_json(filepath: str) -> Dict:
+    """Load a JSON file (shared, treat as read-only)."""
+    return _cached(filepath, _parse_json)
+
+
+def load_cycling(filepath: str = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Cycle numbers and capacity retention (%) from a cycling CSV.
+
+    Defaults to validation_data/zero_pressure_cycling.csv.
+    """
+    if filepath is None:
+        filepath = os.path.join(DATA_DIR, "zero_pressure_cycling.csv")
+    table = load_table(filepath)
+    return table["cycle"], table["capacity_retention_percent"]
+
+
+def load_dendrite_results(filepath: str = None) -> Dict:
+    """Dendrite suppression results (validation_data/dendrite_suppression_results.json)."""
+    if filepath is None:
+        filepath = os.path.join(DATA_DIR, "dendrite_suppression_results.json")
+    return load_json(filepath)
+
+
+def load_conductivity_results(filepath: str = None) -> Dict:
+    """Ionic conductivity results (validation_data/conductivity_results.json)."""
+    if filepath is None:
+        filepath = os.path.join(DATA_DIR, "conductivity_results.json")
+    return load_json(filepath)
+
+
+def iter_table_chunks(
+    filepath: str,
+    columns: Sequence[str],
+    chunk_rows: int = STREAM_CHUNK_ROWS
+) -> Iterator[Tuple[np.ndarray, ...]]:
+    """
+    Stream numeric columns of a '#'-commented CSV in fixed-size chunks.
+
+    Only chunk_rows lines are held in memory at a time, so files of any
+    length can be processed in constant memory.
+
+    Parameters:
+        filepath: CSV with a header row (comment lines may precede it)
+        columns: Header names of the columns to read
+        chunk_rows: Data rows per chunk
+
+    Yields:
+        One float array per requested column, each of length ≤ chunk_rows
+    """
+    with open(filepath, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip() and not line.lstrip().startswith('#'):
+                header = [name.strip() for name in line.split(',')]
+                break
+        else:
+            return
+        missing = [c for c in columns if c not in header]
+        if missing:
+            raise KeyError(f"{filepath}: no column(s) {missing}")
+        usecols = [header.index(c) for c in columns]
+
+        while True:
+            lines = list(itertools.islice(f, chunk_rows))
+            if not lines:
+                return
+            block = np.loadtxt(lines, delimiter=',', comments='#', usecols=usecols,
+                               quotechar='"', ndmin=2)
+            if len(block):
+                yield tuple(block[:, i] for i in range(len(usecols)))
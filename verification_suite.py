@@ -16,6 +16,39 @@ License: Proprietary - All Rights Reserved
 
 USAGE:
     python verification_suite.py [--verbose] [--output report.txt]
+                                 [--workers N] [--processes] [--no-cache]
+                                 [--json report.json] [--junit report.xml]
+    python verification_suite.py --stream cycler_export.csv [--chunk-rows N]
+    python verification_suite.py --robustness [--samples N]   (suite + sweep)
+    python verification_suite.py --import-budgets              (suite + gate)
+
+EXECUTION:
+    Each verify_* check is registered with the data loaders it needs. The
+    runner builds a dependency graph, loads every file once, and runs each
+    check as soon as its inputs are ready on a thread (or process) pool.
+
+    Results are cached in verification_output/verification_cache.json under
+    a hash of each check's input files (content), parameters and the
+    source files of the check, its loaders and the local modules they use.
+    Unchanged checks are served from the cache and marked "(cached)" in
+    the report; --no-cache reruns everything.
+
+ROBUSTNESS:
+    --robustness perturbs every input of each check uniformly within its
+    declared uncertainty range (default 10⁵ samples, one vectorized pass per
+    check) and reports the fraction of samples that still pass.
+
+IMPORT BUDGETS:
+    --import-budgets also runs import_budget.py (each model module imported
+    in fresh interpreters) and fails the run if any module is over its
+    budget. It is a performance gate, not a claim: it is not part of the
+    report or the checks tally.
+
+MACHINE-READABLE OUTPUT:
+    --json and --junit write every VerificationResult field plus per-check
+    wall time and peak traced memory, loader times and total runtime, for
+    CI dashboards. Per-check memory is isolated with --processes; on the
+    thread pool it also counts allocations of concurrently running checks.
 
 VERIFIED CLAIMS:
     1. Dendrite Suppression Factor: 7.6-12.7× (configuration-dependent)
@@ -26,14 +59,24 @@ VERIFIED CLAIMS:
 ================================================================================
 """
 
+import hashlib
+import inspect
 import json
-import csv
 import os
 import sys
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
 import numpy as np
+from functools import lru_cache, partial
+from concurrent.futures import (
+    FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+)
 from datetime import datetime
-from dataclasses import dataclass
-from typing import Dict, List, Tuple, Optional
+from dataclasses import dataclass, field, asdict
+from typing import Callable, Dict, List, NamedTuple, Tuple, Optional
+
+import validation_data_access as data_access
 
 # =============================================================================
 # CONSTANTS
@@ -51,10 +94,34 @@ LI_MOLAR_VOLUME = 13.0e-6  # m³/mol (13 cm³/mol)
 LLZO_FRACTURE_TOUGHNESS = 1.0  # MPa·√m
 LLZO_SHEAR_MODULUS = 55.0  # GPa
 STRESS_CONCENTRATION_FACTOR = 7.0
+CRITICAL_FLAW_SIZE_M = 10e-6   # Grain boundary flaw (10 μm)
+TRAP_OVERPOTENTIAL_V = 0.050   # Plating overpotential in W > F·η/Ω
 
 # Data directories
 DATA_DIR = "validation_data"
 OUTPUT_DIR = "verification_output"
+CACHE_FILE = "verification_cache.json"
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# White-paper claims and pass thresholds, shared by the checks and their
+# robustness sweeps
+CLAIM_TRAP_THRESHOLD_MPA = 370.0           # W > F·η/Ω
+CLAIM_PENETRATION_REDUCTION_PERCENT = 85.0  # 100 - 15
+CLAIM_CRITICAL_PRESSURE_MPA = 25.0
+K_T_RANGE = (5.0, 10.0)                     # Polycrystalline ceramics
+LLZO_D_RANGE_M2_S = (1e-14, 1e-11)
+MIN_MSD_R_SQUARED = 0.90
+CLAIM_MIN_CYCLES = 1000
+CLAIM_RETENTION_1000 = 95.0                 # % at 1000 cycles
+MAX_FADE_PER_100_CYCLES = 1.0               # %
+MAX_RETENTION_INCREASE_PERCENT = 0.1        # Allowed cycle-to-cycle gain
+
+# Published claims recomputed by the live model checks (README)
+CLAIM_GENESIS_RETENTION_2000 = 91.6    # % at 2000 cycles
+CLAIM_BASELINE_RETENTION_2000 = 71.9   # %
+CLAIM_SIEVE_BARRIER_KJ_MOL = 400.0     # Claim 12(b), solvated species at 0.7 nm
+CLAIM_SIEVE_BLOCKED_SPECIES = ("Li_EC4", "Li_H2O4")
+CLAIM_SIEVE_LOG10_SELECTIVITY = 3.0    # Claim 12(c), > 1000:1
 
 
 # =============================================================================
@@ -71,56 +138,341 @@ class VerificationResult:
     unit: str
     passed: bool
     notes: str = ""
+    check: str = ""            # Registered check that produced this result
+    wall_time_s: float = 0.0   # Wall time of that check
+    peak_memory_bytes: int = 0 # Peak traced allocation during that check
+    cached: bool = False       # Served from the verification cache
     
     def __str__(self):
         status = "✅ PASS" if self.passed else "❌ FAIL"
+        if self.cached:
+            status += " (cached)"
         return (f"{self.name}:\n"
                 f"  Expected:   {self.expected_value:.4g} {self.unit}\n"
                 f"  Calculated: {self.calculated_value:.4g} {self.unit}\n"
                 f"  Tolerance:  ±{self.tolerance_percent}%\n"
                 f"  Status:     {status}\n"
-                f"  Notes:      {self.notes}")
+                f"  Notes:      {self.notes}\n"
+                f"  Wall time:  {self.wall_time_s * 1000:.2f} ms")
+
+
+@dataclass
+class CheckSpec:
+    """A registered verification check and the loaders it depends on."""
+    name: str
+    title: str
+    func: Callable[..., List[VerificationResult]]
+    loaders: Tuple[str, ...] = field(default_factory=tuple)
+    params: Dict = field(default_factory=dict)
+
+
+@dataclass
+class LoaderSpec:
+    """A registered data loader and the files it reads."""
+    name: str
+    func: Callable
+    files: Tuple[str, ...] = field(default_factory=tuple)    # Under DATA_DIR
+    sources: Tuple[str, ...] = field(default_factory=tuple)  # Model modules (SCRIPT_DIR)
+
+
+# =============================================================================
+# CHECK REGISTRY
+# =============================================================================
+
+LOADER_REGISTRY: Dict[str, LoaderSpec] = {}
+CHECK_REGISTRY: Dict[str, CheckSpec] = {}
+
+
+def register_loader(name: str, files: Tuple[str, ...] = (), sources: Tuple[str, ...] = ()):
+    """
+    Register a zero-argument data loader under a name checks can depend on.
+
+    files lists the paths (relative to DATA_DIR) the loader reads and
+    sources the model modules (relative to SCRIPT_DIR) it runs; their
+    content is part of every dependent check's cache key.
+    """
+    def decorator(func):
+        LOADER_REGISTRY[name] = LoaderSpec(name, func, tuple(files), tuple(sources))
+        return func
+    return decorator
+
+
+def register_check(name: str, title: str, loaders: Tuple[str, ...] = (),
+                   params: Dict = None):
+    """
+    Register a verify_* function.
+
+    The function is called with one argument per declared loader, in order;
+    loaders that return a tuple are unpacked into consecutive arguments.
+    params are passed as keyword arguments.
+    """
+    def decorator(func):
+        CHECK_REGISTRY[name] = CheckSpec(name, title, func, tuple(loaders), dict(params or {}))
+        return func
+    return decorator
+
+
+# =============================================================================
+# VERIFICATION CACHE
+# =============================================================================
+
+def _code_files(func: Callable) -> Tuple[str, ...]:
+    """
+    Source files a function's behaviour depends on.
+
+    The file defining the function (so helpers, classes and constants of
+    any type it uses are covered) plus every local module it reaches
+    through a module-level name, e.g. data_access.
+    """
+    files = {os.path.abspath(inspect.getsourcefile(func))}
+    module_globals = func.__globals__
+    for name in func.__code__.co_names:
+        value = module_globals.get(name)
+        module_file = getattr(value, "__file__", None) if inspect.ismodule(value) else None
+        if module_file and os.path.dirname(os.path.abspath(module_file)) == SCRIPT_DIR:
+            files.add(os.path.abspath(module_file))
+    return tuple(sorted(files))
+
+
+class VerificationCache:
+    """
+    Persistent check results keyed by a hash of everything a check depends on.
+
+    The key covers the content of every input file, the check's params,
+    and the source files defining the check and its loaders (with any
+    local module they call into). Any change to one of them, including to
+    a helper or constant the check uses indirectly, reruns the check.
+    """
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self._digests: Dict[str, str] = {}
+        self.entries: Dict[str, Dict] = {}
+        if os.path.exists(filepath):
+            try:
+                with open(filepath, 'r') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError):
+                self.entries = {}  # Unreadable cache: rebuild from scratch
+
+    def _file_digest(self, filepath: str) -> str:
+        if filepath not in self._digests:
+            with open(filepath, 'rb') as f:
+                self._digests[filepath] = hashlib.sha256(f.read()).hexdigest()
+        return self._digests[filepath]
+
+    def key(self, spec: CheckSpec) -> str:
+        """Content hash of a check's inputs, parameters and code."""
+        loaders = [LOADER_REGISTRY[name] for name in spec.loaders]
+        code = set(_code_files(spec.func))
+        for loader in loaders:
+            code.update(_code_files(loader.func))
+        payload = {
+            "check": spec.func.__qualname__,
+            "code": {os.path.relpath(f, SCRIPT_DIR): self._file_digest(f) for f in sorted(code)},
+            "params": spec.params,
+            "loaders": {
+                loader.name: {
+                    "func": loader.func.__qualname__,
+                    "files": {f: self._file_digest(os.path.join(DATA_DIR, f))
+                              for f in loader.files},
+                    "sources": {f: self._file_digest(os.path.join(SCRIPT_DIR, f))
+                                for f in loader.sources},
+                }
+                for loader in loaders
+            },
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def get(self, spec: CheckSpec, key: str) -> Optional[List[VerificationResult]]:
+        """Cached results for this key, marked cached, or None."""
+        entry = self.entries.get(spec.name)
+        if entry is None or entry["key"] != key:
+            return None
+        return [VerificationResult(**dict(r, cached=True)) for r in entry["results"]]
+
+    def put(self, spec: CheckSpec, key: str, results: List[VerificationResult]):
+        self.entries[spec.name] = {
+            "key": key,
+            "results": [dict(asdict(r), cached=False) for r in results],
+        }
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.filepath) or ".", exist_ok=True)
+        with open(self.filepath, 'w') as f:
+            json.dump(self.entries, f, indent=2, default=float)
+
+
+# =============================================================================
+# PASS CRITERIA
+# =============================================================================
+# Each check's formulas and thresholds live here, once. verify_* evaluates
+# them on the nominal inputs (scalars); the robustness sweeps evaluate the
+# same functions on arrays of perturbed inputs.
+
+class Criterion(NamedTuple):
+    """A pass criterion evaluated on scalars or element-wise on arrays."""
+    value: np.ndarray
+    passed: np.ndarray
+    expected: float
+    tolerance_percent: float
+
+
+def within_tolerance(value, expected: float, tolerance_percent: float) -> Criterion:
+    """|value - expected| / |expected| < tolerance_percent / 100"""
+    value = np.asarray(value, dtype=float)
+    passed = np.abs(value - expected) / abs(expected) < tolerance_percent / 100.0
+    return Criterion(value, passed, expected, tolerance_percent)
+
+
+def dendrite_criteria(baseline_deflection, genesis_deflection, claimed_suppression: float,
+                      baseline_penetration, genesis_penetration,
+                      overpotential_V=TRAP_OVERPOTENTIAL_V,
+                      molar_volume=LI_MOLAR_VOLUME) -> Dict[str, Criterion]:
+    """Suppression factor, penetration reduction and the W > F·η/Ω trap threshold."""
+    required_W_MPa = FARADAY * np.asarray(overpotential_V) / molar_volume / 1e6
+    return {
+        "Dendrite Suppression Factor": within_tolerance(
+            np.asarray(baseline_deflection) / genesis_deflection, claimed_suppression, 1.0),
+        "Penetration Reduction": within_tolerance(
+            np.asarray(baseline_penetration) - genesis_penetration,
+            CLAIM_PENETRATION_REDUCTION_PERCENT, 1.0),
+        "Strain Energy Trap Threshold": within_tolerance(required_W_MPa, CLAIM_TRAP_THRESHOLD_MPA, 5.0),
+    }
+
+
+def nernst_einstein_mS_cm(n_lithium, volume_m3, D, T):
+    """σ = n q² D / (kB T), converted from S/m to mS/cm (× 10)."""
+    n = n_lithium / np.asarray(volume_m3)
+    return n * ELEMENTARY_CHARGE**2 * D / (BOLTZMANN * np.asarray(T)) * 10.0
+
+
+def conductivity_criteria(D, T, n_lithium, volume_m3, claimed_mS_cm: float,
+                          r_squared) -> Dict[str, Criterion]:
+    """Nernst-Einstein conductivity, physical D range and MSD fit quality."""
+    D = np.asarray(D, dtype=float)
+    r_squared = np.asarray(r_squared, dtype=float)
+    low, high = LLZO_D_RANGE_M2_S
+    return {
+        "Ionic Conductivity (Nernst-Einstein)": within_tolerance(
+            nernst_einstein_mS_cm(n_lithium, volume_m3, D, T), claimed_mS_cm, 5.0),
+        "Diffusion Coefficient (Physical Range)": Criterion(D, (D > low) & (D < high), 1.0e-13, 1000.0),
+        "MSD Linear Fit Quality (R²)": Criterion(
+            r_squared, r_squared > MIN_MSD_R_SQUARED, MIN_MSD_R_SQUARED, 10.0),
+    }
+
+
+def retention_monotonic(retention, max_increase_percent: float = MAX_RETENTION_INCREASE_PERCENT):
+    """No cycle-to-cycle gain above max_increase_percent (along the last axis)."""
+    return np.all(np.diff(retention, axis=-1) <= max_increase_percent, axis=-1)
+
+
+def cycle_life_criteria(max_cycle, retention_at_1000, is_monotonic) -> Dict[str, Criterion]:
+    """Cycle count, retention and fade rate at 1000 cycles, monotonic degradation."""
+    max_cycle = np.asarray(max_cycle, dtype=float)
+    retention_at_1000 = np.asarray(retention_at_1000, dtype=float)
+    is_monotonic = np.asarray(is_monotonic, dtype=bool)
+    fade_rate = (100.0 - retention_at_1000) / (CLAIM_MIN_CYCLES / 100)  # % per 100 cycles
+    return {
+        "Maximum Cycle Count": Criterion(
+            max_cycle, max_cycle >= CLAIM_MIN_CYCLES, float(CLAIM_MIN_CYCLES), 0.1),
+        "Capacity Retention at 1000 Cycles": Criterion(
+            retention_at_1000, retention_at_1000 >= CLAIM_RETENTION_1000, CLAIM_RETENTION_1000, 1.0),
+        "Monotonic Degradation": Criterion(is_monotonic.astype(float), is_monotonic, 1.0, 0.0),
+        "Capacity Fade Rate": Criterion(
+            fade_rate, fade_rate < MAX_FADE_PER_100_CYCLES, 0.5, 50.0),
+    }
+
+
+def critical_pressure_criteria(K_IC, K_t, flaw_size_m) -> Dict[str, Criterion]:
+    """P_critical = K_IC / (K_t √(π a)) and the K_t literature range."""
+    K_t = np.asarray(K_t, dtype=float)
+    P_critical = np.asarray(K_IC) / np.sqrt(np.pi * np.asarray(flaw_size_m)) / K_t
+    low, high = K_T_RANGE
+    return {
+        "Critical Pressure Threshold": within_tolerance(P_critical, CLAIM_CRITICAL_PRESSURE_MPA, 10.0),
+        "Stress Concentration Factor": Criterion(
+            K_t, (K_t > low) & (K_t < high), STRESS_CONCENTRATION_FACTOR, 30.0),
+    }
+
+
+# Drift of a published table from the live model is a property of the data
+# files at nominal conditions, not of uncertain inputs, so the live criteria
+# below leave it out and robustness sweeps never see it.
+
+def live_cycle_life_criteria(genesis_retention, baseline_retention) -> Dict[str, Criterion]:
+    """Model retention at 2000 cycles vs. the claims."""
+    return {
+        "Live Model: Genesis Retention at 2000 Cycles": within_tolerance(
+            genesis_retention, CLAIM_GENESIS_RETENTION_2000, 0.5),
+        "Live Model: Baseline Retention at 2000 Cycles": within_tolerance(
+            baseline_retention, CLAIM_BASELINE_RETENTION_2000, 0.5),
+    }
+
+
+def live_sieve_criteria(blocked_barriers: Dict[str, np.ndarray], log10_selectivity,
+                        optimal_pore_nm=None) -> Dict[str, Criterion]:
+    """Claims 12(b), 12(c) and, given the optimal pore, 13."""
+    criteria = {}
+    for key, barrier in blocked_barriers.items():
+        barrier = np.asarray(barrier, dtype=float)
+        criteria[f"Live Sieve: {key} Barrier at 0.7 nm"] = Criterion(
+            barrier, barrier > CLAIM_SIEVE_BARRIER_KJ_MOL, CLAIM_SIEVE_BARRIER_KJ_MOL, 0.0)
+    log10_selectivity = np.asarray(log10_selectivity, dtype=float)
+    criteria["Live Sieve: log10 Selectivity Li⁺ / Li(EC)₄⁺"] = Criterion(
+        log10_selectivity, log10_selectivity > CLAIM_SIEVE_LOG10_SELECTIVITY,
+        CLAIM_SIEVE_LOG10_SELECTIVITY, 0.0)
+    if optimal_pore_nm is not None:
+        optimal_pore_nm = np.asarray(optimal_pore_nm, dtype=float)
+        criteria["Live Sieve: Optimal Pore Diameter"] = Criterion(
+            optimal_pore_nm, (optimal_pore_nm >= 0.6) & (optimal_pore_nm <= 0.8), 0.70, 14.3)
+    return criteria
+
+
+def _result(name: str, criterion: Criterion, unit: str, notes: str) -> VerificationResult:
+    """VerificationResult for a criterion evaluated on scalars."""
+    return VerificationResult(
+        name=name,
+        expected_value=criterion.expected,
+        calculated_value=float(criterion.value),
+        tolerance_percent=criterion.tolerance_percent,
+        unit=unit,
+        passed=bool(criterion.passed),
+        notes=notes
+    )
 
 
 # =============================================================================
 # VERIFICATION FUNCTIONS
 # =============================================================================
 
+@register_loader("dendrite", files=("dendrite_suppression_results.json",))
 def load_dendrite_data() -> Dict:
     """Load dendrite suppression results from JSON file."""
     filepath = os.path.join(DATA_DIR, "dendrite_suppression_results.json")
     print(f"  Loading: {filepath}")
-    with open(filepath, 'r') as f:
-        return json.load(f)
+    return data_access.load_dendrite_results(filepath)
 
 
+@register_loader("conductivity", files=("conductivity_results.json",))
 def load_conductivity_data() -> Dict:
     """Load ionic conductivity results from JSON file."""
     filepath = os.path.join(DATA_DIR, "conductivity_results.json")
     print(f"  Loading: {filepath}")
-    with open(filepath, 'r') as f:
-        return json.load(f)
+    return data_access.load_conductivity_results(filepath)
 
 
+@register_loader("cycling", files=("zero_pressure_cycling.csv",))
 def load_cycling_data() -> Tuple[np.ndarray, np.ndarray]:
     """Load cycle life data from CSV file."""
     filepath = os.path.join(DATA_DIR, "zero_pressure_cycling.csv")
     print(f"  Loading: {filepath}")
-    
-    cycles = []
-    retention = []
-    
-    with open(filepath, 'r') as f:
-        reader = csv.reader(f)
-        for row in reader:
-            if not row or row[0].startswith('#') or row[0] == 'cycle':
-                continue
-            cycles.append(int(row[0]))
-            retention.append(float(row[2]))
-    
-    return np.array(cycles), np.array(retention)
+    return data_access.load_cycling(filepath)
 
 
+@register_check("dendrite_suppression", "Verifying dendrite suppression claims",
+                loaders=("dendrite",))
 def verify_dendrite_suppression(data: Dict) -> List[VerificationResult]:
     """
     Verify dendrite suppression metrics.
@@ -130,8 +482,6 @@ def verify_dendrite_suppression(data: Dict) -> List[VerificationResult]:
     2. Penetration reduction = 100 - genesis_penetration
     3. Physics: W_elastic > F*η/Ω condition
     """
-    results = []
-    
     # Extract values
     baseline_deflection = data['baseline_case']['results']['max_deflection_nm']
     genesis_deflection = data['genesis_case']['results']['max_deflection_nm']
@@ -141,52 +491,22 @@ def verify_dendrite_suppression(data: Dict) -> List[VerificationResult]:
     
     claimed_suppression = data['improvement_metrics']['dendrite_suppression_factor']
     
-    # Calculate suppression factor
-    calculated_suppression = baseline_deflection / genesis_deflection
-    
-    results.append(VerificationResult(
-        name="Dendrite Suppression Factor",
-        expected_value=claimed_suppression,
-        calculated_value=calculated_suppression,
-        tolerance_percent=1.0,
-        unit="×",
-        passed=abs(calculated_suppression - claimed_suppression) / claimed_suppression < 0.01,
-        notes=f"Calculated from deflection ratio: {baseline_deflection:.1f} nm / {genesis_deflection:.1f} nm"
-    ))
-    
-    # Verify penetration reduction
-    claimed_reduction = 85.0  # 100 - 15
-    calculated_reduction = baseline_penetration - genesis_penetration
-    
-    results.append(VerificationResult(
-        name="Penetration Reduction",
-        expected_value=claimed_reduction,
-        calculated_value=calculated_reduction,
-        tolerance_percent=1.0,
-        unit="%",
-        passed=abs(calculated_reduction - claimed_reduction) / claimed_reduction < 0.01,
-        notes=f"Calculated from: {baseline_penetration}% - {genesis_penetration}%"
-    ))
+    criteria = dendrite_criteria(baseline_deflection, genesis_deflection, claimed_suppression,
+                                 baseline_penetration, genesis_penetration)
     
-    # Verify physics: Strain energy trap condition
-    # W_trap > F*η/Ω where η = 50 mV, Ω = 13 cm³/mol
-    overpotential = 0.050  # V
-    required_W = FARADAY * overpotential / LI_MOLAR_VOLUME  # Pa
-    required_W_MPa = required_W / 1e6
-    
-    results.append(VerificationResult(
-        name="Strain Energy Trap Threshold",
-        expected_value=370.0,  # MPa (claimed)
-        calculated_value=required_W_MPa,
-        tolerance_percent=5.0,
-        unit="MPa",
-        passed=abs(required_W_MPa - 370.0) / 370.0 < 0.05,
-        notes=f"From W > F·η/Ω: {FARADAY:.0f} × {overpotential} / {LI_MOLAR_VOLUME:.2e}"
-    ))
-    
-    return results
+    return [
+        _result("Dendrite Suppression Factor", criteria["Dendrite Suppression Factor"], "×",
+                f"Calculated from deflection ratio: {baseline_deflection:.1f} nm / {genesis_deflection:.1f} nm"),
+        _result("Penetration Reduction", criteria["Penetration Reduction"], "%",
+                f"Calculated from: {baseline_penetration}% - {genesis_penetration}%"),
+        # W_trap > F*η/Ω where η = 50 mV, Ω = 13 cm³/mol
+        _result("Strain Energy Trap Threshold", criteria["Strain Energy Trap Threshold"], "MPa",
+                f"From W > F·η/Ω: {FARADAY:.0f} × {TRAP_OVERPOTENTIAL_V} / {LI_MOLAR_VOLUME:.2e}"),
+    ]
 
 
+@register_check("ionic_conductivity", "Verifying ionic conductivity claims",
+                loaders=("conductivity",))
 def verify_ionic_conductivity(data: Dict) -> List[VerificationResult]:
     """
     Verify ionic conductivity using Nernst-Einstein relation.
@@ -200,67 +520,95 @@ def verify_ionic_conductivity(data: Dict) -> List[VerificationResult]:
     - kB = Boltzmann constant
     - T = temperature
     """
-    results = []
-    
     # Extract values from data
     D = data['results']['diffusion_coefficient']['value']  # m²/s
     T = data['results']['ionic_conductivity']['temperature_K']
     claimed_conductivity = data['results']['ionic_conductivity']['value']  # mS/cm
+    r_squared = data['results']['msd_analysis']['r_squared']
     
     # LLZO structure: 7 Li per formula unit, density calculation
     n_ions = data['simulation_parameters']['composition']['lithium']
-    volume_nm3 = data['simulation_parameters']['volume_nm3']
-    volume_m3 = volume_nm3 * 1e-27
-    
+    volume_m3 = data['simulation_parameters']['volume_nm3'] * 1e-27
     n = n_ions / volume_m3  # ions/m³
     
-    # Calculate conductivity using Nernst-Einstein
-    # σ = n × q² × D / (kB × T)
-    # Units: (ions/m³) × (C²) × (m²/s) / (J/K × K) = C²·m²·s⁻¹·J⁻¹·m⁻³ = C²·s/kg·m³ = S/m
-    sigma_S_m = n * ELEMENTARY_CHARGE**2 * D / (BOLTZMANN * T)
-    # Convert S/m to mS/cm: 1 S/m = 10 mS/cm (because 1 S/m = 0.01 S/cm = 10 mS/cm)
-    sigma_mS_cm = sigma_S_m * 10.0  # Correct conversion: S/m × 10 = mS/cm
-    
-    results.append(VerificationResult(
-        name="Ionic Conductivity (Nernst-Einstein)",
-        expected_value=claimed_conductivity,
-        calculated_value=sigma_mS_cm,
-        tolerance_percent=5.0,
-        unit="mS/cm",
-        passed=abs(sigma_mS_cm - claimed_conductivity) / claimed_conductivity < 0.05,
-        notes=f"Using D = {D:.2e} m²/s, T = {T} K, n = {n:.2e} ions/m³"
-    ))
-    
-    # Verify diffusion coefficient is physically reasonable
-    # Typical LLZO D ~ 10⁻¹³ to 10⁻¹² m²/s
-    D_reasonable = 1e-14 < D < 1e-11
-    
-    results.append(VerificationResult(
-        name="Diffusion Coefficient (Physical Range)",
-        expected_value=1.0e-13,  # Order of magnitude
-        calculated_value=D,
-        tolerance_percent=1000.0,  # Wide range
-        unit="m²/s",
-        passed=D_reasonable,
-        notes="Literature range: 10⁻¹⁴ to 10⁻¹¹ m²/s for LLZO"
-    ))
-    
-    # Verify R² of fit
-    r_squared = data['results']['msd_analysis']['r_squared']
+    criteria = conductivity_criteria(D, T, n_ions, volume_m3, claimed_conductivity, r_squared)
     
-    results.append(VerificationResult(
-        name="MSD Linear Fit Quality (R²)",
-        expected_value=0.90,
-        calculated_value=r_squared,
-        tolerance_percent=10.0,
-        unit="",
-        passed=r_squared > 0.90,
-        notes="R² > 0.90 indicates valid diffusive regime"
-    ))
-    
-    return results
+    return [
+        _result("Ionic Conductivity (Nernst-Einstein)", criteria["Ionic Conductivity (Nernst-Einstein)"],
+                "mS/cm", f"Using D = {D:.2e} m²/s, T = {T} K, n = {n:.2e} ions/m³"),
+        # Typical LLZO D ~ 10⁻¹³ to 10⁻¹² m²/s
+        _result("Diffusion Coefficient (Physical Range)", criteria["Diffusion Coefficient (Physical Range)"],
+                "m²/s", "Literature range: 10⁻¹⁴ to 10⁻¹¹ m²/s for LLZO"),
+        _result("MSD Linear Fit Quality (R²)", criteria["MSD Linear Fit Quality (R²)"],
+                "", "R² > 0.90 indicates valid diffusive regime"),
+    ]
+
+
+class CycleLifeAccumulator:
+    """
+    Cycle-life statistics accumulated chunk by chunk in constant memory.
+
+    Tracks the maximum cycle, the retention at the rows nearest to any
+    requested cycles, and monotonicity. The last retention of each chunk
+    is carried into the next, so a capacity jump across a chunk boundary
+    is still detected.
+    """
 
+    def __init__(self, retention_cycles: Tuple[float, ...] = (1000,),
+                 max_increase_percent: float = MAX_RETENTION_INCREASE_PERCENT):
+        self.retention_cycles = tuple(retention_cycles)
+        self.max_increase_percent = max_increase_percent
+        self.n_rows = 0
+        self.max_cycle = -np.inf
+        self.is_monotonic = True
+        self._last_retention = None
+        self._best_distance = np.full(len(self.retention_cycles), np.inf)
+        self._best_retention = np.full(len(self.retention_cycles), np.nan)
 
+    def update(self, cycles: np.ndarray, retention: np.ndarray):
+        """Fold in the next chunk of rows (in file order)."""
+        if len(cycles) == 0:
+            return
+        self.n_rows += len(cycles)
+        self.max_cycle = max(self.max_cycle, cycles.max())
+
+        # Nearest row to each requested cycle; first occurrence wins ties
+        targets = np.asarray(self.retention_cycles, dtype=float)
+        distance = np.abs(cycles[np.newaxis, :] - targets[:, np.newaxis])
+        idx = np.argmin(distance, axis=1)
+        chunk_best = distance[np.arange(len(targets)), idx]
+        better = chunk_best < self._best_distance
+        self._best_distance[better] = chunk_best[better]
+        self._best_retention[better] = retention[idx[better]]
+
+        previous = retention if self._last_retention is None else \
+            np.concatenate(([self._last_retention], retention))
+        if self.is_monotonic:
+            self.is_monotonic = bool(retention_monotonic(previous, self.max_increase_percent))
+        self._last_retention = retention[-1]
+
+    def retention_at(self, cycle: float) -> float:
+        """Retention (%) at the row nearest to a requested cycle."""
+        return float(self._best_retention[self.retention_cycles.index(cycle)])
+
+    def results(self) -> List[VerificationResult]:
+        """Cycle-life checks (requires 1000 among retention_cycles)."""
+        criteria = cycle_life_criteria(self.max_cycle, self.retention_at(1000), self.is_monotonic)
+        return [
+            _result("Maximum Cycle Count", criteria["Maximum Cycle Count"], "cycles",
+                    "Target: ≥1000 cycles demonstrated"),
+            _result("Capacity Retention at 1000 Cycles", criteria["Capacity Retention at 1000 Cycles"], "%",
+                    "Target: ≥95% retention at 1000 cycles"),
+            # Small fluctuations allowed
+            _result("Monotonic Degradation", criteria["Monotonic Degradation"], "(bool)",
+                    "No anomalous capacity gains detected"),
+            # Less than 1% per 100 cycles; ~0.5% expected
+            _result("Capacity Fade Rate", criteria["Capacity Fade Rate"], "% / 100 cycles",
+                    "Low fade rate indicates stable architecture"),
+        ]
+
+
+@register_check("cycle_life", "Verifying cycle life claims", loaders=("cycling",))
 def verify_cycle_life(cycles: np.ndarray, retention: np.ndarray) -> List[VerificationResult]:
     """
     Verify cycle life claims.
@@ -270,65 +618,39 @@ def verify_cycle_life(cycles: np.ndarray, retention: np.ndarray) -> List[Verific
     2. ≥95% retention at 1000 cycles
     3. Monotonic degradation (no anomalies)
     """
-    results = []
-    
-    # Check max cycles
-    max_cycles = cycles.max()
-    
-    results.append(VerificationResult(
-        name="Maximum Cycle Count",
-        expected_value=1000.0,
-        calculated_value=float(max_cycles),
-        tolerance_percent=0.1,
-        unit="cycles",
-        passed=max_cycles >= 1000,
-        notes="Target: ≥1000 cycles demonstrated"
-    ))
-    
-    # Check retention at 1000 cycles
-    idx_1000 = np.argmin(np.abs(cycles - 1000))
-    retention_at_1000 = retention[idx_1000]
-    
-    results.append(VerificationResult(
-        name="Capacity Retention at 1000 Cycles",
-        expected_value=95.0,
-        calculated_value=retention_at_1000,
-        tolerance_percent=1.0,
-        unit="%",
-        passed=retention_at_1000 >= 95.0,
-        notes="Target: ≥95% retention at 1000 cycles"
-    ))
-    
-    # Verify monotonic degradation
-    retention_diff = np.diff(retention)
-    is_monotonic = np.all(retention_diff <= 0.1)  # Allow small fluctuations
-    
-    results.append(VerificationResult(
-        name="Monotonic Degradation",
-        expected_value=1.0,
-        calculated_value=1.0 if is_monotonic else 0.0,
-        tolerance_percent=0.0,
-        unit="(bool)",
-        passed=is_monotonic,
-        notes="No anomalous capacity gains detected"
-    ))
-    
-    # Calculate fade rate per 100 cycles
-    fade_rate = (100.0 - retention_at_1000) / (1000 / 100)  # % per 100 cycles
-    
-    results.append(VerificationResult(
-        name="Capacity Fade Rate",
-        expected_value=0.5,  # Expected ~0.5% per 100 cycles
-        calculated_value=fade_rate,
-        tolerance_percent=50.0,
-        unit="% / 100 cycles",
-        passed=fade_rate < 1.0,  # Less than 1% per 100 cycles
-        notes="Low fade rate indicates stable architecture"
-    ))
-    
-    return results
+    accumulator = CycleLifeAccumulator()
+    accumulator.update(cycles, retention)
+    return accumulator.results()
+
+
+def verify_cycle_life_streaming(
+    filepath: str,
+    chunk_rows: int = data_access.STREAM_CHUNK_ROWS,
+    retention_cycles: Tuple[float, ...] = (1000,),
+    cycle_column: str = "cycle",
+    retention_column: str = "capacity_retention_percent"
+) -> Tuple[List[VerificationResult], CycleLifeAccumulator]:
+    """
+    Verify cycle life from a cycling log of any size in constant memory.
 
+    Same checks as verify_cycle_life, evaluated chunk by chunk.
+
+    Parameters:
+        retention_cycles: Cycles at which to record retention (1000 is
+            always included for the standard checks)
+
+    Returns:
+        Tuple of (results, accumulator); accumulator.retention_at(c) gives
+        retention at any requested cycle
+    """
+    accumulator = CycleLifeAccumulator(tuple(dict.fromkeys((1000,) + tuple(retention_cycles))))
+    for cycles, retention in data_access.iter_table_chunks(
+            filepath, (cycle_column, retention_column), chunk_rows):
+        accumulator.update(cycles, retention)
+    return accumulator.results(), accumulator
 
+
+@register_check("critical_pressure", "Verifying critical pressure threshold")
 def verify_critical_pressure() -> List[VerificationResult]:
     """
     Verify critical pressure threshold using fracture mechanics.
@@ -340,51 +662,587 @@ def verify_critical_pressure() -> List[VerificationResult]:
     - K_t = 7 (stress concentration factor)
     - a = 10 μm (grain boundary flaw size)
     """
-    results = []
-    
     # Parameters
     K_IC = LLZO_FRACTURE_TOUGHNESS  # MPa·√m
     K_t = STRESS_CONCENTRATION_FACTOR
-    a = 10e-6  # m (10 μm)
+    a = CRITICAL_FLAW_SIZE_M
     
-    # Calculate critical stress
     sigma_critical = K_IC / np.sqrt(np.pi * a)  # MPa
+    criteria = critical_pressure_criteria(K_IC, K_t, a)
+    
+    return [
+        _result("Critical Pressure Threshold", criteria["Critical Pressure Threshold"], "MPa",
+                f"From σ_crit / K_t = {sigma_critical:.1f} / {K_t}"),
+        _result("Stress Concentration Factor", criteria["Stress Concentration Factor"], "",
+                "Literature range: 5-10 for polycrystalline ceramics"),
+    ]
+
+
+# =============================================================================
+# LIVE MODEL CROSS-CHECKS
+# =============================================================================
+# These loaders run the model modules themselves, so a change to a model that
+# breaks a published claim fails verification. Model results are computed
+# once per process (lru_cache) and shared by every check that needs them;
+# the verification cache keys them on the model source files.
+
+@lru_cache(maxsize=None)
+def _cycle_life_model(n_cycles: int = 2000, seed: int = 42) -> Dict:
+    import physics_cycle_life as model
+
+    rng = np.random.RandomState(seed)  # Same stream as physics_cycle_life.main()
+    return {
+        "genesis": model.run_cycle_life(model.GENESIS, n_cycles=n_cycles, rng=rng, verbose=False),
+        "baseline": model.run_cycle_life(model.BASELINE, n_cycles=n_cycles, rng=rng, verbose=False),
+    }
+
+
+@lru_cache(maxsize=None)
+def _sieve_model(target_pore_nm: float = 0.70) -> Dict:
+    import born_solvation_quantum_sieve as model
+
+    library = model.species_library_from_dict()
+    selectivity = model.compute_library_selectivity(library, target_pore_nm=target_pore_nm)
+    pairwise = model.pairwise_selectivity(library)
+    optimum = model.optimal_pore_for_pairs(pairwise, ["Li+"], ["Li_EC4"])
+    return {
+        "barrier_kJ_mol": dict(zip(selectivity["key"], selectivity["barrier_kJ_mol"])),
+        "log10_selectivity": dict(zip(selectivity["key"], selectivity["log10_selectivity"])),
+        "optimal_pore_nm": float(optimum["pore_nm"][0]),
+    }
+
+
+@register_loader("cycle_life_model", sources=("physics_cycle_life.py",))
+def load_cycle_life_model() -> Dict:
+    """Run the physics cycle-life model for Genesis and baseline."""
+    return _cycle_life_model()
+
+
+@register_loader("physics_cycling", files=("genesis_cycle_life_physics.csv",))
+def load_physics_cycling_data() -> np.ndarray:
+    """Load the published physics-model cycle-life table."""
+    filepath = os.path.join(DATA_DIR, "genesis_cycle_life_physics.csv")
+    print(f"  Loading: {filepath}")
+    return data_access.load_table(filepath)
+
+
+@register_loader("sieve_model", sources=("born_solvation_quantum_sieve.py", "sieve_output.py"))
+def load_sieve_model() -> Dict:
+    """Evaluate the Born solvation sieve (vectorized library path)."""
+    return _sieve_model()
+
+
+@register_loader("sieve_selectivity", files=("species_selectivity.json",))
+def load_sieve_selectivity_data() -> Dict:
+    """Load the published sieve selectivity table."""
+    filepath = os.path.join(DATA_DIR, "species_selectivity.json")
+    print(f"  Loading: {filepath}")
+    return data_access.load_json(filepath)
+
+
+@register_check("live_cycle_life", "Recomputing cycle life from the physics model",
+                loaders=("cycle_life_model", "physics_cycling"))
+def verify_live_cycle_life(model: Dict, published: np.ndarray) -> List[VerificationResult]:
+    """
+    Cross-check cycle-life claims against physics_cycle_life.
+
+    Key checks:
+    1. Genesis retention at 2000 cycles matches the published 91.6%
+    2. Baseline retention at 2000 cycles matches the published 71.9%
+    3. Published CSV agrees with the model's current output
+    """
+    genesis, baseline = model["genesis"], model["baseline"]
     
-    # Applied pressure to reach critical stress at grain boundary
-    P_critical = sigma_critical / K_t
-    
-    results.append(VerificationResult(
-        name="Critical Pressure Threshold",
-        expected_value=25.0,  # Claimed ~25 MPa
-        calculated_value=P_critical,
-        tolerance_percent=10.0,
-        unit="MPa",
-        passed=abs(P_critical - 25.0) / 25.0 < 0.10,
-        notes=f"From σ_crit / K_t = {sigma_critical:.1f} / {K_t}"
+    # Published table vs model history, matched on cycle number
+    history = {h["cycle"]: h["capacity_retention"] for h in genesis["history"]}
+    common = [i for i, c in enumerate(published["cycle"]) if c in history]
+    drift = max((abs(published["capacity_retention"][i] - history[published["cycle"][i]])
+                 for i in common), default=np.inf)
+    
+    criteria = live_cycle_life_criteria(100.0 * genesis["final_capacity"],
+                                        100.0 * baseline["final_capacity"])
+    drift_criterion = Criterion(100.0 * drift, len(common) > 0 and drift <= 1e-4, 0.0, 0.0)
+    return [
+        _result("Live Model: Genesis Retention at 2000 Cycles",
+                criteria["Live Model: Genesis Retention at 2000 Cycles"], "%",
+                f"physics_cycle_life.run_cycle_life(GENESIS), {genesis['n_cycles_tested']} cycles"),
+        _result("Live Model: Baseline Retention at 2000 Cycles",
+                criteria["Live Model: Baseline Retention at 2000 Cycles"], "%",
+                f"Cycles to 80%: Genesis {genesis['cycles_to_80_pct']}, baseline {baseline['cycles_to_80_pct']}"),
+        _result("Live Model: Published Cycle-Life Data Drift", drift_criterion, "% (max abs)",
+                f"{len(common)} cycles of genesis_cycle_life_physics.csv vs current model"),
+    ]
+
+
+@register_check("live_sieve", "Recomputing quantum sieve claims from the Born model",
+                loaders=("sieve_model", "sieve_selectivity"))
+def verify_live_sieve(model: Dict, published: Dict) -> List[VerificationResult]:
+    """
+    Cross-check quantum sieve claims against born_solvation_quantum_sieve.
+
+    Key checks:
+    1. Claim 12(b): barrier > 400 kJ/mol for solvated species at 0.7 nm
+    2. Claim 12(c): Li⁺ / Li(EC)₄⁺ selectivity > 1000:1
+    3. Claim 13: optimal pore between 0.6 and 0.8 nm
+    4. Published Li⁺ barrier agrees with the model
+    """
+    barriers = model["barrier_kJ_mol"]
+    criteria = live_sieve_criteria(
+        {key: barriers[key] for key in CLAIM_SIEVE_BLOCKED_SPECIES},
+        model["log10_selectivity"]["Li_EC4"], model["optimal_pore_nm"])
+    drift_criterion = within_tolerance(barriers["Li+"], float(published["Li+_barrier_kJ_mol"]), 1.0)
+    
+    results = [
+        _result(f"Live Sieve: {key} Barrier at 0.7 nm", criteria[f"Live Sieve: {key} Barrier at 0.7 nm"],
+                "kJ/mol", "inf = sterically blocked (pore < 0.8 × solvated diameter)")
+        for key in CLAIM_SIEVE_BLOCKED_SPECIES
+    ]
+    results += [
+        _result("Live Sieve: log10 Selectivity Li⁺ / Li(EC)₄⁺",
+                criteria["Live Sieve: log10 Selectivity Li⁺ / Li(EC)₄⁺"], "log10",
+                "compute_library_selectivity at 0.70 nm, 300 K"),
+        _result("Live Sieve: Optimal Pore Diameter", criteria["Live Sieve: Optimal Pore Diameter"], "nm",
+                "Claim 13: d_crit between 0.6 and 0.8 nm (pairwise_selectivity optimum)"),
+        _result("Live Sieve: Published Li⁺ Barrier Drift", drift_criterion, "kJ/mol",
+                "validation_data/species_selectivity.json vs current model"),
+    ]
+    return results
+
+
+# =============================================================================
+# ROBUSTNESS SWEEPS
+# =============================================================================
+
+ROBUSTNESS_SAMPLES = 100_000
+
+
+@dataclass
+class Uncertainty:
+    """Uniform range an input is perturbed over."""
+    low: float
+    high: float
+
+    @classmethod
+    def relative(cls, nominal: float, fraction: float) -> "Uncertainty":
+        """nominal ± fraction × |nominal|"""
+        return cls(nominal - fraction * abs(nominal), nominal + fraction * abs(nominal))
+
+
+class Sampler:
+    """
+    Draws perturbed inputs for one robustness sweep.
+
+    sample(name, uncertainty) returns n_samples uniform draws and records
+    the declared range, so the report lists exactly what was perturbed.
+    """
+
+    def __init__(self, n_samples: int, rng: np.random.Generator):
+        self.n_samples = n_samples
+        self.rng = rng
+        self.declared: Dict[str, Uncertainty] = {}
+
+    def __call__(self, name: str, uncertainty: Uncertainty, shape: Tuple[int, ...] = ()) -> np.ndarray:
+        self.declared[name] = uncertainty
+        return self.rng.uniform(uncertainty.low, uncertainty.high, (self.n_samples,) + shape)
+
+
+@dataclass
+class RobustnessSpec:
+    """Vectorized counterpart of a registered check."""
+    check: str
+    func: Callable[..., Dict[str, np.ndarray]]
+    loaders: Tuple[str, ...] = field(default_factory=tuple)
+
+
+ROBUSTNESS_REGISTRY: Dict[str, RobustnessSpec] = {}
+
+
+def register_robustness(check: str, loaders: Tuple[str, ...] = ()):
+    """
+    Register the robustness sweep for a check.
+
+    The function is called as func(sample, *loader_outputs) and returns
+    {result name: boolean pass array over samples}, evaluated with the
+    same PASS CRITERIA functions as the check itself.
+    """
+    def decorator(func):
+        ROBUSTNESS_REGISTRY[check] = RobustnessSpec(check, func, tuple(loaders))
+        return func
+    return decorator
+
+
+def _pass_arrays(criteria: Dict[str, Criterion]) -> Dict[str, np.ndarray]:
+    return {name: c.passed for name, c in criteria.items()}
+
+
+@register_robustness("dendrite_suppression", loaders=("dendrite",))
+def robust_dendrite_suppression(sample: Sampler, data: Dict) -> Dict[str, np.ndarray]:
+    """Dendrite checks under deflection, penetration, overpotential and Ω uncertainty."""
+    baseline, genesis = data['baseline_case']['results'], data['genesis_case']['results']
+    claimed_suppression = data['improvement_metrics']['dendrite_suppression_factor']
+    return _pass_arrays(dendrite_criteria(
+        sample("baseline_deflection_nm", Uncertainty.relative(baseline['max_deflection_nm'], 0.02)),
+        sample("genesis_deflection_nm", Uncertainty.relative(genesis['max_deflection_nm'], 0.02)),
+        claimed_suppression,
+        sample("baseline_penetration_percent", Uncertainty(
+            baseline['dendrite_penetration_percent'] - 1.0, baseline['dendrite_penetration_percent'] + 1.0)),
+        sample("genesis_penetration_percent", Uncertainty(
+            genesis['dendrite_penetration_percent'] - 1.0, genesis['dendrite_penetration_percent'] + 1.0)),
+        overpotential_V=sample("overpotential_V", Uncertainty.relative(TRAP_OVERPOTENTIAL_V, 0.05)),
+        molar_volume=sample("Li_molar_volume_m3_mol", Uncertainty.relative(LI_MOLAR_VOLUME, 0.02)),
     ))
+
+
+@register_robustness("ionic_conductivity", loaders=("conductivity",))
+def robust_ionic_conductivity(sample: Sampler, data: Dict) -> Dict[str, np.ndarray]:
+    """Conductivity checks under D, T, cell-volume and MSD-fit uncertainty."""
+    r_squared = data['results']['msd_analysis']['r_squared']
+    return _pass_arrays(conductivity_criteria(
+        sample("D_m2_s", Uncertainty.relative(data['results']['diffusion_coefficient']['value'], 0.10)),
+        sample("T_K", Uncertainty.relative(data['results']['ionic_conductivity']['temperature_K'], 0.01)),
+        data['simulation_parameters']['composition']['lithium'],
+        sample("volume_m3", Uncertainty.relative(data['simulation_parameters']['volume_nm3'] * 1e-27, 0.02)),
+        data['results']['ionic_conductivity']['value'],
+        sample("msd_r_squared", Uncertainty(r_squared - 0.01, min(r_squared + 0.01, 1.0))),
+    ))
+
+
+@register_robustness("cycle_life", loaders=("cycling",))
+def robust_cycle_life(sample: Sampler, cycles: np.ndarray, retention: np.ndarray) -> Dict[str, np.ndarray]:
+    """Cycle-life checks under per-point retention measurement error (±0.05 %)."""
+    noise = sample("retention_error_percent", Uncertainty(-0.05, 0.05), shape=(len(retention),))
+    perturbed = retention[np.newaxis, :] + noise  # (samples, points)
     
-    # Verify stress concentration is reasonable
-    results.append(VerificationResult(
-        name="Stress Concentration Factor",
-        expected_value=7.0,
-        calculated_value=K_t,
-        tolerance_percent=30.0,
-        unit="",
-        passed=5.0 < K_t < 10.0,
-        notes="Literature range: 5-10 for polycrystalline ceramics"
+    # Cycle numbers are counted, not measured: the maximum is exact
+    return _pass_arrays(cycle_life_criteria(
+        np.full(sample.n_samples, cycles.max()),
+        perturbed[:, np.argmin(np.abs(cycles - 1000))],
+        retention_monotonic(perturbed),
+    ))
+
+
+@register_robustness("critical_pressure")
+def robust_critical_pressure(sample: Sampler) -> Dict[str, np.ndarray]:
+    """Critical pressure under K_IC, K_t and flaw-size uncertainty."""
+    return _pass_arrays(critical_pressure_criteria(
+        sample("K_IC_MPa_sqrt_m", Uncertainty.relative(LLZO_FRACTURE_TOUGHNESS, 0.10)),
+        sample("K_t", Uncertainty(*K_T_RANGE)),  # Literature range
+        sample("flaw_size_m", Uncertainty.relative(CRITICAL_FLAW_SIZE_M, 0.30)),
+    ))
+
+
+def _binomial_cdf(n: int, p: float) -> np.ndarray:
+    """P(K ≤ k) for K ~ Binomial(n, p), k = 0..n (pmf built by its ratio recurrence)."""
+    k = np.arange(n)
+    log_ratio = np.log((n - k) / (k + 1)) + np.log(p / (1.0 - p))
+    log_pmf = n * np.log1p(-p) + np.concatenate(([0.0], np.cumsum(log_ratio)))
+    return np.cumsum(np.exp(log_pmf))
+
+
+@register_robustness("live_cycle_life")
+def robust_live_cycle_life(sample: Sampler) -> Dict[str, np.ndarray]:
+    """
+    Live cycle-life claims over dendrite nucleation realisations.
+
+    The published figures are one realisation (seed 42). Nucleation is
+    the model's only random input and has the same probability every
+    cycle, so the event count after n cycles is Binomial(n, p), drawn here
+    by inverse transform from a uniform quantile; SEI and fatigue losses
+    are deterministic. Runs that reach end of life are evaluated at the
+    last cycle instead of stopping there; capacity only falls, so both are
+    below 70% and the verdict is the same.
+    """
+    import physics_cycle_life as model
+
+    n_cycles = 2000
+    retention = {}
+    for name, architecture in (("genesis", model.GENESIS), ("baseline", model.BASELINE)):
+        quantile = sample(f"{name}_dendrite_quantile", Uncertainty(0.0, 1.0))
+        p = model.dendrite_nucleation_probability(architecture)
+        events = np.minimum(np.searchsorted(_binomial_cdf(n_cycles, p), quantile), n_cycles)
+        capacity = (1.0
+                    - model.SEI_LOSS_PER_NM * model.sei_growth_per_cycle(architecture, n_cycles - 1)
+                    - model.FATIGUE_LOSS_AT_FAILURE * model.fatigue_damage_per_cycle(architecture, n_cycles - 1)
+                    - model.DENDRITE_LOSS_PER_EVENT * events)
+        retention[name] = 100.0 * np.round(np.maximum(capacity, 0.0), 6)
+    return _pass_arrays(live_cycle_life_criteria(retention["genesis"], retention["baseline"]))
+
+
+@register_robustness("live_sieve")
+def robust_live_sieve(sample: Sampler) -> Dict[str, np.ndarray]:
+    """
+    Live sieve claims 12(b) and 12(c) under solvent dielectric, temperature
+    and solvated-radius uncertainty.
+
+    Barriers at 0.7 nm for every sample and species come from one call to
+    the model's broadcasting dehydration_enthalpy_array. Claim 13 is left
+    to the nominal check: its optimum needs a full pore scan per sample
+    (samples × pores), over ten times the cost of the whole suite.
+    """
+    import born_solvation_quantum_sieve as model
+
+    library = model.species_library_from_dict()
+    epsilon = sample("epsilon_bulk", Uncertainty(27.0, 33.0))
+    temperature = sample("T_K", Uncertainty(290.0, 310.0))
+    radius_scale = sample("solvated_radius_scale", Uncertainty(0.95, 1.05))
+
+    # (samples, species)
+    barrier = model.dehydration_enthalpy_array(
+        0.70, library["bare_radius_nm"], library["solvated_radius_nm"] * radius_scale[:, np.newaxis],
+        library["charge"], epsilon[:, np.newaxis])
+    barriers = dict(zip(library["key"], barrier.T))
+
+    # As compute_library_selectivity: a blocked reference passes freely
+    reference = np.where(np.isfinite(barriers["Li+"]), barriers["Li+"], 0.0)
+    RT = model.K_B * temperature * model.N_A / 1000  # kJ/mol
+    return _pass_arrays(live_sieve_criteria(
+        {key: barriers[key] for key in CLAIM_SIEVE_BLOCKED_SPECIES},
+        (barriers["Li_EC4"] - reference) / (model.LN10 * RT),
     ))
+
+
+def run_robustness(n_samples: int = ROBUSTNESS_SAMPLES, seed: int = 0) -> Dict[str, Dict]:
+    """
+    Run every registered robustness sweep.
+
+    Each sweep draws all of its inputs at once and evaluates the check on
+    the whole (n_samples,) batch in a single NumPy pass.
+
+    Returns:
+        {check: {"pass_fraction": {result name: fraction},
+                 "uncertainties": {input: (low, high)}, "error": str}}
+    """
+    loaded: Dict[str, object] = {}
+    report: Dict[str, Dict] = {}
+    for i, spec in enumerate(ROBUSTNESS_REGISTRY.values()):
+        sampler = Sampler(n_samples, np.random.default_rng([seed, i]))
+        try:
+            for name in spec.loaders:
+                if name not in loaded:
+                    loaded[name] = LOADER_REGISTRY[name].func()
+            passed = spec.func(sampler, *_check_arguments(spec, loaded))
+        except Exception as e:
+            report[spec.check] = {"pass_fraction": {}, "uncertainties": {},
+                                  "error": f"{type(e).__name__}: {e}"}
+            continue
+        report[spec.check] = {
+            "pass_fraction": {name: float(np.mean(ok)) for name, ok in passed.items()},
+            "uncertainties": {name: (u.low, u.high) for name, u in sampler.declared.items()},
+            "error": "",
+        }
+    return report
+
+
+def generate_robustness_report(report: Dict[str, Dict], n_samples: int, output_path: str):
+    """Pass fractions and declared input ranges per check."""
+    with open(output_path, 'w') as f:
+        f.write("=" * 80 + "\n")
+        f.write("GENESIS SOLID-STATE BATTERY: ROBUSTNESS REPORT\n")
+        f.write("=" * 80 + "\n")
+        f.write(f"Generated: {datetime.now().isoformat()}\n")
+        f.write(f"Samples per check: {n_samples}\n")
+        f.write("=" * 80 + "\n\n")
+        
+        for check, entry in report.items():
+            f.write(f"[{check}]\n")
+            if entry["error"]:
+                f.write(f"  Not run: {entry['error']}\n\n")
+                continue
+            for name, (low, high) in entry["uncertainties"].items():
+                f.write(f"  Input {name:<28} U({low:.4g}, {high:.4g})\n")
+            for name, fraction in entry["pass_fraction"].items():
+                f.write(f"  {name:<45} {100 * fraction:6.2f}% of samples pass\n")
+            f.write("\n")
+        
+        f.write("=" * 80 + "\n")
+        f.write("END OF REPORT\n")
+        f.write("=" * 80 + "\n")
     
-    return results
+    print(f"📄 Robustness report saved to: {output_path}")
 
 
 # =============================================================================
 # MAIN VERIFICATION ROUTINE
 # =============================================================================
 
-def run_full_verification(verbose: bool = True) -> Tuple[List[VerificationResult], bool]:
+def _timed_call(func: Callable, *args):
+    """
+    Call func in a worker and return (value, wall time in s, peak bytes).
+
+    Peak bytes is the tracemalloc peak above the starting allocation, or 0
+    when tracing is off in this process.
+    """
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.reset_peak()
+        start_bytes = tracemalloc.get_traced_memory()[0]
+    t0 = time.perf_counter()
+    value = func(*args)
+    elapsed = time.perf_counter() - t0
+    peak = tracemalloc.get_traced_memory()[1] - start_bytes if tracing else 0
+    return value, elapsed, max(0, peak)
+
+
+def _start_memory_tracing():
+    """Pool initializer: trace allocations in worker processes."""
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def _check_arguments(spec, loaded: Dict) -> list:
+    """Positional arguments for a check (or sweep) from its loaders' outputs."""
+    args = []
+    for name in spec.loaders:
+        value = loaded[name]
+        args.extend(value if isinstance(value, tuple) else (value,))
+    return args
+
+
+def _failed_check(spec: CheckSpec, reason: str) -> VerificationResult:
+    """Single failing result standing in for a check that could not complete."""
+    return VerificationResult(
+        name=spec.title.replace("Verifying ", "").capitalize(),
+        expected_value=1.0,
+        calculated_value=0.0,
+        tolerance_percent=0.0,
+        unit="(bool)",
+        passed=False,
+        notes=reason,
+        check=spec.name
+    )
+
+
+def run_checks(
+    checks: Optional[List[str]] = None,
+    max_workers: Optional[int] = None,
+    use_processes: bool = False,
+    cache: Optional[VerificationCache] = None,
+    track_memory: bool = False
+) -> Tuple[Dict[str, List[VerificationResult]], Dict[str, float]]:
+    """
+    Run registered checks as a loader → check dependency graph.
+
+    Every loader needed by the selected checks is run once; each check is
+    submitted as soon as all of its loaders have finished, so independent
+    checks run concurrently. A failing loader fails its dependent checks,
+    and a check that raises is recorded as failed, without stopping the
+    others.
+
+    Parameters:
+        checks: Registered check names to run (default: all, in order)
+        max_workers: Pool size (default: executor default)
+        use_processes: Use a process pool instead of threads
+        cache: Serve unchanged checks from (and store new results in) this
+            cache; only the loaders of checks that must run are executed
+        track_memory: Record each check's peak traced memory (tracemalloc)
+
+    Returns:
+        Tuple of (results per check name in registration order,
+        loader wall times in s)
+    """
+    specs = [CHECK_REGISTRY[name] for name in (checks or CHECK_REGISTRY)]
+    for spec in specs:
+        for name in spec.loaders:
+            if name not in LOADER_REGISTRY:
+                raise KeyError(f"No loader registered as '{name}'")
+
+    check_results: Dict[str, List[VerificationResult]] = {}
+    cache_keys: Dict[str, str] = {}
+    waiting = []
+    for spec in specs:
+        if cache is not None:
+            try:
+                cache_keys[spec.name] = cache.key(spec)
+            except OSError:
+                pass  # Missing input: let the loader report it
+            cached = cache.get(spec, cache_keys[spec.name]) if spec.name in cache_keys else None
+            if cached is not None:
+                check_results[spec.name] = cached
+                continue
+        waiting.append(spec)
+
+    needed = sorted({name for spec in waiting for name in spec.loaders})
+    loaded: Dict[str, object] = {}
+    failed_loaders: Dict[str, Exception] = {}
+    failed_checks = set()
+    loader_times: Dict[str, float] = {}
+
+    stop_tracing = False
+    if use_processes:
+        pool_cls = partial(ProcessPoolExecutor,
+                           initializer=_start_memory_tracing if track_memory else None)
+    else:
+        pool_cls = ThreadPoolExecutor
+        if track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            stop_tracing = True
+
+    with pool_cls(max_workers=max_workers) as pool:
+        pending = {}
+        for name in needed:
+            pending[pool.submit(_timed_call, LOADER_REGISTRY[name].func)] = ("loader", name)
+
+        def submit_ready():
+            for spec in list(waiting):
+                failed = [n for n in spec.loaders if n in failed_loaders]
+                if failed:
+                    check_results[spec.name] = [_failed_check(
+                        spec, f"Not run: loader '{failed[0]}' failed ({failed_loaders[failed[0]]})")]
+                    waiting.remove(spec)
+                elif all(n in loaded for n in spec.loaders):
+                    future = pool.submit(_timed_call, partial(spec.func, **spec.params),
+                                         *_check_arguments(spec, loaded))
+                    pending[future] = ("check", spec.name)
+                    waiting.remove(spec)
+
+        submit_ready()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                kind, name = pending.pop(future)
+                if kind == "loader":
+                    try:
+                        loaded[name], loader_times[name], _ = future.result()
+                    except Exception as e:
+                        failed_loaders[name] = e
+                        print(f"  ❌ Error loading '{name}': {e}")
+                else:
+                    try:
+                        results, elapsed, peak = future.result()
+                    except Exception as e:
+                        results, elapsed, peak = [_failed_check(
+                            CHECK_REGISTRY[name], f"Check raised {type(e).__name__}: {e}")], 0.0, 0
+                        failed_checks.add(name)
+                    for r in results:
+                        r.check = name
+                        r.wall_time_s = elapsed
+                        r.peak_memory_bytes = peak
+                    check_results[name] = results
+                    if name in cache_keys and name not in failed_checks:
+                        cache.put(CHECK_REGISTRY[name], cache_keys[name], results)
+            submit_ready()
+
+    if stop_tracing:
+        tracemalloc.stop()
+    return {spec.name: check_results[spec.name] for spec in specs}, loader_times
+
+
+def run_full_verification(
+    verbose: bool = True,
+    max_workers: Optional[int] = None,
+    use_processes: bool = False,
+    use_cache: bool = True,
+    json_path: Optional[str] = None,
+    junit_path: Optional[str] = None
+) -> Tuple[List[VerificationResult], bool]:
     """
     Run complete verification suite.
     
+    With use_cache, checks whose inputs, parameters and code are unchanged
+    since the last run are served from OUTPUT_DIR/CACHE_FILE. json_path and
+    junit_path additionally write machine-readable reports (and enable
+    per-check memory tracking).
+    
     Returns:
         Tuple of (all_results, all_passed)
     """
@@ -395,54 +1253,28 @@ def run_full_verification(verbose: bool = True) -> Tuple[List[VerificationResult
     print(f"Timestamp: {datetime.now().isoformat()}")
     print("-" * 80)
     
-    all_results = []
+    t0 = time.perf_counter()
+    print(f"\nRunning {len(CHECK_REGISTRY)} registered checks...")
+    cache = VerificationCache(os.path.join(OUTPUT_DIR, CACHE_FILE)) if use_cache else None
+    check_results, loader_times = run_checks(max_workers=max_workers,
+                                             use_processes=use_processes, cache=cache,
+                                             track_memory=bool(json_path or junit_path))
+    if cache is not None:
+        cache.save()
+    elapsed = time.perf_counter() - t0
+    n_cached = sum(1 for results in check_results.values() if results and results[0].cached)
+    print(f"  Loaded {len(loader_times)} data files, {n_cached} checks from cache, "
+          f"completed in {elapsed:.3f} s.\n")
     
-    # 1. Load data
-    print("\n[1/5] Loading data files...")
-    try:
-        dendrite_data = load_dendrite_data()
-        conductivity_data = load_conductivity_data()
-        cycles, retention = load_cycling_data()
-        print("  ✅ All data files loaded successfully.\n")
-    except Exception as e:
-        print(f"  ❌ Error loading data: {e}")
-        return [], False
-    
-    # 2. Verify dendrite suppression
-    print("[2/5] Verifying dendrite suppression claims...")
-    dendrite_results = verify_dendrite_suppression(dendrite_data)
-    all_results.extend(dendrite_results)
-    if verbose:
-        for r in dendrite_results:
-            print(f"  • {r.name}: {'✅' if r.passed else '❌'}")
-    print()
-    
-    # 3. Verify ionic conductivity
-    print("[3/5] Verifying ionic conductivity claims...")
-    conductivity_results = verify_ionic_conductivity(conductivity_data)
-    all_results.extend(conductivity_results)
-    if verbose:
-        for r in conductivity_results:
-            print(f"  • {r.name}: {'✅' if r.passed else '❌'}")
-    print()
-    
-    # 4. Verify cycle life
-    print("[4/5] Verifying cycle life claims...")
-    cycle_results = verify_cycle_life(cycles, retention)
-    all_results.extend(cycle_results)
-    if verbose:
-        for r in cycle_results:
-            print(f"  • {r.name}: {'✅' if r.passed else '❌'}")
-    print()
-    
-    # 5. Verify critical pressure physics
-    print("[5/5] Verifying critical pressure threshold...")
-    pressure_results = verify_critical_pressure()
-    all_results.extend(pressure_results)
-    if verbose:
-        for r in pressure_results:
-            print(f"  • {r.name}: {'✅' if r.passed else '❌'}")
-    print()
+    all_results = []
+    for i, (name, results) in enumerate(check_results.items(), 1):
+        all_results.extend(results)
+        print(f"[{i}/{len(check_results)}] {CHECK_REGISTRY[name].title}...")
+        if verbose:
+            for r in results:
+                timing = "cached" if r.cached else f"{r.wall_time_s * 1000:.2f} ms"
+                print(f"  • {r.name}: {'✅' if r.passed else '❌'} ({timing})")
+        print()
     
     # Summary
     passed = sum(1 for r in all_results if r.passed)
@@ -464,6 +1296,11 @@ def run_full_verification(verbose: bool = True) -> Tuple[List[VerificationResult
     
     print("=" * 80)
     
+    if json_path:
+        write_json_report(all_results, loader_times, elapsed, json_path)
+    if junit_path:
+        write_junit_report(all_results, loader_times, elapsed, junit_path)
+    
     return all_results, all_passed
 
 
@@ -478,6 +1315,7 @@ def generate_verification_report(results: List[VerificationResult], output_path:
         f.write(f"Total Checks: {len(results)}\n")
         f.write(f"Passed: {sum(1 for r in results if r.passed)}\n")
         f.write(f"Failed: {sum(1 for r in results if not r.passed)}\n")
+        f.write(f"Cached: {sum(1 for r in results if r.cached)}\n")
         f.write("=" * 80 + "\n\n")
         
         for i, r in enumerate(results, 1):
@@ -490,6 +1328,89 @@ def generate_verification_report(results: List[VerificationResult], output_path:
     print(f"\n📄 Detailed report saved to: {output_path}")
 
 
+def _json_safe(value):
+    """Non-finite floats as strings so the output is strict JSON."""
+    if isinstance(value, (float, np.floating)) and not np.isfinite(value):
+        return str(float(value))
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _check_summaries(results: List[VerificationResult]) -> Dict[str, Dict]:
+    """Per-check timing, memory and pass counts (checks in result order)."""
+    checks: Dict[str, Dict] = {}
+    for r in results:
+        entry = checks.setdefault(r.check, {
+            "wall_time_s": r.wall_time_s,
+            "peak_memory_bytes": r.peak_memory_bytes,
+            "cached": r.cached,
+            "results": 0,
+            "failures": 0,
+        })
+        entry["results"] += 1
+        entry["failures"] += 0 if r.passed else 1
+    return checks
+
+
+def write_json_report(results: List[VerificationResult], loader_times: Dict[str, float],
+                      total_runtime_s: float, output_path: str):
+    """Machine-readable report: every result field plus timings."""
+    report = {
+        "generated": datetime.now().isoformat(),
+        "total_runtime_s": total_runtime_s,
+        "summary": {
+            "total": len(results),
+            "passed": sum(1 for r in results if r.passed),
+            "failed": sum(1 for r in results if not r.passed),
+            "cached": sum(1 for r in results if r.cached),
+        },
+        "loader_times_s": loader_times,
+        "checks": _check_summaries(results),
+        "results": [{k: _json_safe(v) for k, v in asdict(r).items()} for r in results],
+    }
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    with open(output_path, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"📄 JSON report saved to: {output_path}")
+
+
+def write_junit_report(results: List[VerificationResult], loader_times: Dict[str, float],
+                       total_runtime_s: float, output_path: str):
+    """
+    JUnit-XML report: one testcase per result, classname = check.
+
+    Result fields and per-check memory are testcase properties; loader
+    times and total runtime are suite properties.
+    """
+    failures = sum(1 for r in results if not r.passed)
+    suites = ET.Element("testsuites", name="verification_suite", tests=str(len(results)),
+                        failures=str(failures), time=f"{total_runtime_s:.6f}")
+    suite = ET.SubElement(suites, "testsuite", name="verification_suite",
+                          tests=str(len(results)), failures=str(failures), errors="0",
+                          time=f"{total_runtime_s:.6f}",
+                          timestamp=datetime.now().isoformat(timespec="seconds"))
+
+    properties = ET.SubElement(suite, "properties")
+    ET.SubElement(properties, "property", name="total_runtime_s", value=f"{total_runtime_s:.6f}")
+    for name, seconds in loader_times.items():
+        ET.SubElement(properties, "property", name=f"loader_time_s.{name}", value=f"{seconds:.6f}")
+
+    for r in results:
+        case = ET.SubElement(suite, "testcase", classname=f"verification_suite.{r.check}",
+                             name=r.name, time=f"{r.wall_time_s:.6f}")
+        case_properties = ET.SubElement(case, "properties")
+        for key, value in asdict(r).items():
+            ET.SubElement(case_properties, "property", name=key, value=str(_json_safe(value)))
+        if not r.passed:
+            failure = ET.SubElement(case, "failure", message=r.notes or "check failed")
+            failure.text = str(r)
+
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    ET.ElementTree(suites).write(output_path, encoding="utf-8", xml_declaration=True)
+    print(f"📄 JUnit report saved to: {output_path}")
+
+
 # =============================================================================
 # ENTRY POINT
 # =============================================================================
@@ -497,12 +1418,53 @@ def generate_verification_report(results: List[VerificationResult], output_path:
 if __name__ == "__main__":
     verbose = "--verbose" in sys.argv or "-v" in sys.argv
     
-    results, all_passed = run_full_verification(verbose=True)
+    if "--stream" in sys.argv:
+        # Constant-memory cycle-life verification of a large cycler export
+        stream_path = sys.argv[sys.argv.index("--stream") + 1]
+        chunk_rows = (int(sys.argv[sys.argv.index("--chunk-rows") + 1])
+                      if "--chunk-rows" in sys.argv else data_access.STREAM_CHUNK_ROWS)
+        results, accumulator = verify_cycle_life_streaming(stream_path, chunk_rows)
+        print(f"Streamed {accumulator.n_rows} rows from {stream_path}")
+        for r in results:
+            print(f"[{r.name}] {'✅ PASS' if r.passed else '❌ FAIL'}: {r.calculated_value:.4g} {r.unit}")
+        sys.exit(0 if all(r.passed for r in results) else 1)
+    workers = int(sys.argv[sys.argv.index("--workers") + 1]) if "--workers" in sys.argv else None
+    
+    results, all_passed = run_full_verification(verbose=True, max_workers=workers,
+                                                use_processes="--processes" in sys.argv,
+                                                use_cache="--no-cache" not in sys.argv,
+                                                json_path=(sys.argv[sys.argv.index("--json") + 1]
+                                                           if "--json" in sys.argv else None),
+                                                junit_path=(sys.argv[sys.argv.index("--junit") + 1]
+                                                            if "--junit" in sys.argv else None))
     
     # Generate report
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     report_path = os.path.join(OUTPUT_DIR, "verification_report.txt")
     generate_verification_report(results, report_path)
     
+    # Robustness sweep (informational; does not affect the exit code)
+    if "--robustness" in sys.argv:
+        n_samples = (int(sys.argv[sys.argv.index("--samples") + 1])
+                     if "--samples" in sys.argv else ROBUSTNESS_SAMPLES)
+        t0 = time.perf_counter()
+        robustness = run_robustness(n_samples)
+        print(f"\nRobustness sweep: {len(robustness)} checks × {n_samples} samples "
+              f"in {time.perf_counter() - t0:.3f} s")
+        for check, entry in robustness.items():
+            for name, fraction in entry["pass_fraction"].items():
+                print(f"  • {name}: {100 * fraction:.2f}% of samples pass")
+            if entry["error"]:
+                print(f"  • {check}: not run ({entry['error']})")
+        generate_robustness_report(robustness, n_samples,
+                                   os.path.join(OUTPUT_DIR, "robustness_report.txt"))
+    
+    # Import-time gate (affects the exit code, not the report)
+    budgets_passed = True
+    if "--import-budgets" in sys.argv:
+        import import_budget
+        print("\nImport-time budgets:")
+        budgets_passed = import_budget.main() == 0
+    
     # Exit with appropriate code
-    sys.exit(0 if all_passed else 1)
+    sys.exit(0 if all_passed and budgets_passed else 1)
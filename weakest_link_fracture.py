@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+GENESIS: WEAKEST-LINK MONTE CARLO FRACTURE ENGINE FOR LLZO SEPARATORS
+================================================================================
+
+The pressure-failure curve (figure_registry.weibull_failure_data) is a
+closed-form 3-parameter Weibull, and verify_critical_pressure uses a single
+deterministic flaw (a = 10 μm, K_t = 7). This engine derives the curve
+instead: it samples the grain-boundary flaw population of every separator
+and fails the separator at its weakest grain. figure_registry registers it
+as the alternative data source "weibull_failure_monte_carlo", with the same
+keys as "weibull_failure".
+
+PHYSICS:
+    Each grain boundary i carries a flaw of size a_i, a local stress
+    concentration K_t,i and a toughness K_IC,i. Under stack pressure P:
+
+        K_I,i(P) = K_t,i × P × √(π × a_i)
+
+    The grain cracks when K_I,i ≥ K_IC,i, i.e. at
+
+        P_c,i = K_IC,i / (K_t,i × √(π × a_i))
+
+    and a separator of N grains fails at its weakest link, min_i P_c,i.
+    Evaluating K_I ≥ K_IC on every grain at every grid pressure is therefore
+    the same as comparing each separator's strength (and each grain's P_c)
+    against the grid, which is what the engine does.
+
+    Flaw sizes are capped at the grain-boundary flaw of the closed-form
+    model (10 μm) and K_t at its value (7), so with nominal toughness the
+    deterministic check is the worst-case grain. Because a separator's
+    strength is the minimum over 10⁶ grains, it lands in the low-toughness
+    tail: strengths sit well below the single-flaw estimate and are
+    narrowly spread (a high fitted Weibull modulus).
+
+EXECUTION:
+    - Grains are sampled in chunks of at most GRAIN_CHUNK per array, so
+      10⁶+ grains per separator never need more than a few tens of MB
+    - Separators are split across a process pool; separator s always uses
+      the random stream [seed, s], so results do not depend on the number
+      of workers
+
+OUTPUTS (main):
+    - fracture_curve.npz          (pressure grid, P_failure, cracked-grain
+                                   fraction, separator strengths)
+    - fracture_weibull_fit.json   (fitted Weibull vs. closed-form constants)
+
+Author: Nicholas Harris, Genesis Platform Inc.
+Date: February 2026
+License: Proprietary - All Rights Reserved
+================================================================================
+"""
+
+import numpy as np
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from figure_registry import WEIBULL_MODULUS, WEIBULL_SCALE_MPA, WEIBULL_THRESHOLD_MPA
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+GRAINS_PER_SEPARATOR = 1_000_000
+N_SEPARATORS = 100
+GRAIN_CHUNK = 1 << 20          # Grains sampled per array
+
+
+@dataclass
+class FlawPopulation:
+    """Per-grain flaw statistics of an LLZO separator."""
+    flaw_median_m: float = 4e-6        # Lognormal median flaw size
+    flaw_sigma_ln: float = 0.5         # Lognormal shape
+    flaw_max_m: float = 10e-6          # Flaws cannot exceed the grain boundary
+    K_t_low: float = 5.0               # Stress concentration, uniform
+    K_t_high: float = 7.0
+    K_IC_mean: float = 1.0             # MPa·√m (LLZO)
+    K_IC_cov: float = 0.10             # Coefficient of variation
+    K_IC_min: float = 0.05             # Floor for the normal tail
+
+
+# =============================================================================
+# SAMPLING (WORKER SIDE)
+# =============================================================================
+
+# Per-process state, set once by _init_worker instead of being pickled with
+# every chunk of separators
+_WORKER_STATE: Dict = {}
+
+
+def _init_worker(state: Dict):
+    """Process pool initializer: install the shared simulation state."""
+    _WORKER_STATE.clear()
+    _WORKER_STATE.update(state)
+
+
+def sample_critical_pressure(population: FlawPopulation, n_grains: int,
+                             rng: np.random.Generator) -> np.ndarray:
+    """
+    Critical pressure P_c (MPa) of n_grains sampled grain boundaries.
+
+    Sampled in float32 (relative error ~1e-7, far below the population
+    scatter), which halves the cost of the random draws.
+    """
+    p = population
+    f32 = np.float32
+    a = rng.standard_normal(n_grains, dtype=f32)
+    a *= f32(p.flaw_sigma_ln)
+    a += f32(np.log(p.flaw_median_m))
+    np.exp(a, out=a)
+    np.minimum(a, f32(p.flaw_max_m), out=a)
+    K_t = rng.random(n_grains, dtype=f32)
+    K_t *= f32(p.K_t_high - p.K_t_low)
+    K_t += f32(p.K_t_low)
+    K_IC = rng.standard_normal(n_grains, dtype=f32)
+    K_IC *= f32(p.K_IC_cov * p.K_IC_mean)
+    K_IC += f32(p.K_IC_mean)
+    np.maximum(K_IC, f32(p.K_IC_min), out=K_IC)
+
+    # P_c = K_IC / (K_t √(π a)), computed in place
+    a *= f32(np.pi)
+    np.sqrt(a, out=a)
+    a *= K_t
+    return np.divide(K_IC, a, out=K_IC)
+
+
+def _grid_bins(grid: np.ndarray, P_c: np.ndarray) -> np.ndarray:
+    """
+    Index of the first grid pressure >= P_c, per grain (len(grid) if none).
+
+    Uniform grids (the usual case) use arithmetic instead of a binary
+    search, which is ~8× faster for 10⁶ grains.
+    """
+    if _WORKER_STATE.get("uniform_step"):
+        step = _WORKER_STATE["uniform_step"]
+        bins = np.ceil((P_c - grid[0]) / step)
+        np.clip(bins, 0, len(grid), out=bins)
+        return bins.astype(np.intp)
+    return np.searchsorted(grid, P_c, side='left')
+
+
+def _simulate_separators(separators: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Simulate separators [s0, s1).
+
+    Returns:
+        (strength_MPa per separator, cracked-grain counts per grid
+        pressure summed over the separators)
+    """
+    state = _WORKER_STATE
+    population = state["population"]
+    grid = state["pressure_MPa"]
+    n_grains = state["n_grains"]
+    s0, s1 = separators
+
+    strength = np.empty(s1 - s0)
+    cracked = np.zeros(len(grid), dtype=np.int64)
+    for j, s in enumerate(range(s0, s1)):
+        rng = np.random.default_rng([state["seed"], s])
+        weakest = np.inf
+        for g0 in range(0, n_grains, GRAIN_CHUNK):
+            P_c = sample_critical_pressure(population, min(GRAIN_CHUNK, n_grains - g0), rng)
+            weakest = min(weakest, float(P_c.min()))
+            # Grain cracks at grid pressure k when P_c <= grid[k]
+            bins = _grid_bins(grid, P_c)
+            cracked += np.cumsum(np.bincount(bins, minlength=len(grid) + 1)[:len(grid)])
+        strength[j] = weakest
+    return strength, cracked
+
+
+# =============================================================================
+# WEIBULL FIT
+# =============================================================================
+
+def fit_weibull(strength: np.ndarray, n_thresholds: int = 400) -> Dict:
+    """
+    Fit a 3-parameter Weibull to separator strengths.
+
+    Linear regression on the Weibull plot ln(-ln(1 - F)) vs. ln(σ - σ_u)
+    with median ranks F = (i - 0.3) / (n + 0.4); the threshold σ_u is the
+    candidate in [0, min σ) that makes the plot most linear.
+
+    A best candidate at either end of that range means the data want a
+    threshold outside it (typically below 0 for narrowly spread
+    weakest-link strengths). σ_u is then pinned at the bound, the fit is
+    effectively 2-parameter, and threshold_at_bound is True.
+
+    Returns:
+        Dict with threshold_MPa, scale_MPa, modulus, r_squared,
+        threshold_at_bound
+    """
+    s = np.sort(np.asarray(strength, dtype=float))
+    n = len(s)
+    if n < 3:
+        raise ValueError(f"Need at least 3 strengths to fit a Weibull, got {n}")
+    F = (np.arange(1, n + 1) - 0.3) / (n + 0.4)
+    y = np.log(-np.log(1 - F))
+
+    # All candidate thresholds at once: rows are candidates
+    thresholds = s[0] * (1 - np.geomspace(1, 1e-4, n_thresholds))
+    x = np.log(s[np.newaxis, :] - thresholds[:, np.newaxis])
+    x_c = x - x.mean(axis=1, keepdims=True)
+    y_c = y - y.mean()
+    sxx = (x_c ** 2).sum(axis=1)
+    sxy = (x_c * y_c).sum(axis=1)
+    r_squared = sxy ** 2 / (sxx * (y_c ** 2).sum())
+
+    best = int(np.argmax(r_squared))
+    modulus = sxy[best] / sxx[best]
+    intercept = y.mean() - modulus * x[best].mean()
+    return {
+        "threshold_MPa": float(thresholds[best]),
+        "scale_MPa": float(np.exp(-intercept / modulus)),
+        "modulus": float(modulus),
+        "r_squared": float(r_squared[best]),
+        "threshold_at_bound": best in (0, n_thresholds - 1),
+    }
+
+
+def weibull_failure_probability(pressure_MPa: np.ndarray, threshold_MPa: float,
+                                scale_MPa: float, modulus: float) -> np.ndarray:
+    """P(failure) = 1 - exp(-((σ - σ_u) / σ_0)^m) for σ > σ_u, else 0."""
+    excess = np.clip(np.asarray(pressure_MPa, dtype=float) - threshold_MPa, 0, None)
+    return 1 - np.exp(-(excess / scale_MPa) ** modulus)
+
+
+# =============================================================================
+# DRIVER
+# =============================================================================
+
+def run_fracture_simulation(
+    pressure_MPa: np.ndarray = None,
+    population: FlawPopulation = None,
+    n_grains: int = GRAINS_PER_SEPARATOR,
+    n_separators: int = N_SEPARATORS,
+    seed: int = 0,
+    n_workers: Optional[int] = None
+) -> Dict:
+    """
+    Weakest-link failure curve over a pressure grid.
+
+    Parameters:
+        pressure_MPa: Ascending stack-pressure grid (default: 0-100 MPa, 1000 points)
+        population: Grain flaw statistics (default: FlawPopulation())
+        n_grains: Grain boundaries per separator
+        n_separators: Separators sampled
+        seed: Base random seed
+        n_workers: Worker processes (default: all cores; 1 = run in-process)
+
+    Returns:
+        Dict with pressure_MPa, failure_probability (separators failed),
+        cracked_grain_fraction (mean fraction of grains with K_I >= K_IC),
+        strength_MPa (per separator) and the fitted weibull parameters
+    """
+    if pressure_MPa is None:
+        pressure_MPa = np.linspace(0, 100, 1000)
+    if population is None:
+        population = FlawPopulation()
+    grid = np.asarray(pressure_MPa, dtype=float)
+
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    n_workers = max(1, min(n_workers, n_separators))
+    # A few chunks per worker so uneven workers still finish together
+    per_chunk = max(1, -(-n_separators // (4 * n_workers)))
+    chunks = [(s, min(s + per_chunk, n_separators)) for s in range(0, n_separators, per_chunk)]
+
+    step = np.diff(grid)
+    uniform = len(grid) > 1 and np.allclose(step, step[0], rtol=1e-9, atol=0)
+    state = {"population": population, "pressure_MPa": grid,
+             "uniform_step": float(step[0]) if uniform else None,
+             "n_grains": n_grains, "seed": seed}
+
+    if n_workers == 1:
+        _init_worker(state)
+        parts = [_simulate_separators(c) for c in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker,
+                                 initargs=(state,)) as pool:
+            parts = list(pool.map(_simulate_separators, chunks))
+
+    strength = np.concatenate([p[0] for p in parts])
+    cracked = sum(p[1] for p in parts)
+    # Separator s fails at grid pressure k when its weakest grain does
+    failed = np.searchsorted(np.sort(strength), grid, side='right')
+
+    return {
+        "pressure_MPa": grid,
+        "failure_probability": failed / n_separators,
+        "cracked_grain_fraction": cracked / (n_grains * n_separators),
+        "strength_MPa": strength,
+        "weibull": fit_weibull(strength),
+        "population": asdict(population),
+        "n_grains": n_grains,
+        "n_separators": n_separators,
+        "n_workers": n_workers,
+        "seed": seed,
+    }
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def main():
+    """Simulate the default separator population and compare with the closed form."""
+    import time
+
+    print("\n" + "█" * 70)
+    print("  GENESIS: WEAKEST-LINK MONTE CARLO FRACTURE ENGINE")
+    print("█" * 70)
+    print(f"  Timestamp: {datetime.now().isoformat()}")
+
+    output_dir = os.path.join(os.path.dirname(__file__), "outputs", "weakest_link_fracture")
+    os.makedirs(output_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    result = run_fracture_simulation()
+    elapsed = time.perf_counter() - start
+
+    fit = result["weibull"]
+    grid = result["pressure_MPa"]
+    closed_form = weibull_failure_probability(grid, WEIBULL_THRESHOLD_MPA,
+                                              WEIBULL_SCALE_MPA, WEIBULL_MODULUS)
+    strength = result["strength_MPa"]
+
+    print(f"  Grains:      {result['n_grains']:,} × {result['n_separators']} separators "
+          f"on {result['n_workers']} worker(s), {elapsed:.1f} s")
+    print(f"  Strength:    median {np.median(strength):.2f} MPa "
+          f"(range {strength.min():.2f}-{strength.max():.2f})")
+    print(f"  {'Weibull':<12} {'Monte Carlo':>12} {'Closed form':>12}")
+    print(f"  {'σ_u (MPa)':<12} {fit['threshold_MPa']:>12.2f} {WEIBULL_THRESHOLD_MPA:>12.2f}")
+    print(f"  {'σ_0 (MPa)':<12} {fit['scale_MPa']:>12.2f} {WEIBULL_SCALE_MPA:>12.2f}")
+    print(f"  {'m':<12} {fit['modulus']:>12.2f} {WEIBULL_MODULUS:>12.2f}")
+    print(f"  Fit R² = {fit['r_squared']:.4f}")
+    if fit["threshold_at_bound"]:
+        print(f"  σ_u is pinned at its search bound ({fit['threshold_MPa']:.2f} MPa): "
+              f"effectively a 2-parameter fit")
+
+    curve_path = os.path.join(output_dir, "fracture_curve.npz")
+    np.savez(curve_path, pressure_MPa=grid,
+             failure_probability=result["failure_probability"],
+             cracked_grain_fraction=result["cracked_grain_fraction"],
+             strength_MPa=strength,
+             closed_form_failure_probability=closed_form)
+    print(f"\n  Curve saved: {curve_path}")
+
+    fit_path = os.path.join(output_dir, "fracture_weibull_fit.json")
+    with open(fit_path, 'w') as f:
+        json.dump({
+            "simulation_id": "GENESIS-FRACTURE-MC-V1",
+            "date": datetime.now().isoformat(),
+            "method": "Weakest-link Monte Carlo (K_t σ √(πa) ≥ K_IC per grain)",
+            "n_grains": result["n_grains"],
+            "n_separators": result["n_separators"],
+            "seed": result["seed"],
+            "population": result["population"],
+            "weibull_fit": fit,
+            "closed_form": {
+                "threshold_MPa": WEIBULL_THRESHOLD_MPA,
+                "scale_MPa": WEIBULL_SCALE_MPA,
+                "modulus": WEIBULL_MODULUS,
+            },
+            "runtime_s": round(elapsed, 2),
+        }, f, indent=2)
+    print(f"  Fit saved:   {fit_path}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()